@@ -1,21 +1,46 @@
 """
 Generate PawGate icon - clean, minimal paw print with lock indicator.
 Optimized for system tray visibility (16x16 up to 256x256).
+
+Shapes are rasterized as NumPy boolean masks over a shared pixel grid and
+composited into a single RGBA buffer, instead of issuing one PIL draw call
+per primitive.
+Requires: pip install pillow numpy
 """
-from PIL import Image, ImageDraw
-import math
+from PIL import Image
+import io
+import os
+import struct
+
+import numpy as np
+
+
+def _ellipse_mask(xx, yy, cx, cy, rx, ry):
+    """Boolean mask of pixels inside the ellipse centered at (cx, cy)."""
+    # Invert the radii once so the per-pixel work is multiply-only
+    inv_rx2 = 1.0 / (rx * rx)
+    inv_ry2 = 1.0 / (ry * ry)
+    dx = xx - cx
+    dy = yy - cy
+    return dx * dx * inv_rx2 + dy * dy * inv_ry2 <= 1.0
+
 
+def _rounded_rect_mask(xx, yy, x0, y0, x1, y1, radius):
+    """Boolean mask of pixels inside a rounded rectangle."""
+    # Distance past the inner (radius-inset) rectangle; zero inside it
+    dx = np.maximum(np.maximum(x0 + radius - xx, xx - (x1 - radius)), 0)
+    dy = np.maximum(np.maximum(y0 + radius - yy, yy - (y1 - radius)), 0)
+    inside = (xx >= x0) & (xx <= x1) & (yy >= y0) & (yy <= y1)
+    return inside & (dx ** 2 + dy ** 2 <= radius ** 2)
 
-def draw_paw_print(draw, cx, cy, size, color):
+
+def draw_paw_print(rgba, xx, yy, cx, cy, size, color):
     """Draw a cat paw print centered at (cx, cy). BOLD version for visibility."""
     # Main pad (large oval at bottom) - BIGGER
     pad_w = size * 0.55
     pad_h = size * 0.42
     pad_y = cy + size * 0.12
-    draw.ellipse(
-        [cx - pad_w/2, pad_y - pad_h/2, cx + pad_w/2, pad_y + pad_h/2],
-        fill=color
-    )
+    paw_mask = _ellipse_mask(xx, yy, cx, pad_y, pad_w / 2, pad_h / 2)
 
     # Toe beans (4 circles above the main pad) - BIGGER and BOLDER
     toe_radius = size * 0.16
@@ -28,59 +53,59 @@ def draw_paw_print(draw, cx, cy, size, color):
     ]
 
     for tx, ty in toe_positions:
-        draw.ellipse(
-            [tx - toe_radius, ty - toe_radius, tx + toe_radius, ty + toe_radius],
-            fill=color
-        )
+        paw_mask |= _ellipse_mask(xx, yy, tx, ty, toe_radius, toe_radius)
 
+    rgba[paw_mask] = color + (255,)
 
-def draw_lock_badge(draw, cx, cy, size, bg_color, fg_color):
+
+def draw_lock_badge(rgba, xx, yy, cx, cy, size, bg_color, fg_color):
     """Draw a small lock icon."""
     # Lock body (rounded rectangle)
     body_w = size * 0.6
     body_h = size * 0.5
     body_top = cy + size * 0.1
-
-    draw.rounded_rectangle(
-        [cx - body_w/2, body_top, cx + body_w/2, body_top + body_h],
-        radius=size * 0.08,
-        fill=fg_color
+    lock_mask = _rounded_rect_mask(
+        xx, yy,
+        cx - body_w/2, body_top, cx + body_w/2, body_top + body_h,
+        size * 0.08,
     )
 
-    # Lock shackle (arc at top)
+    # Lock shackle (upper half of an elliptical ring)
     shackle_w = size * 0.35
     shackle_h = size * 0.35
-    shackle_thickness = size * 0.12
-
-    # Outer arc
-    draw.arc(
-        [cx - shackle_w/2, body_top - shackle_h, cx + shackle_w/2, body_top + shackle_h * 0.3],
-        start=180, end=0,
-        fill=fg_color,
-        width=int(shackle_thickness)
+    shackle_thickness = int(size * 0.12)
+    arc_top = body_top - shackle_h
+    arc_bottom = body_top + shackle_h * 0.3
+    arc_cy = (arc_top + arc_bottom) / 2
+    arc_rx = shackle_w / 2
+    arc_ry = (arc_bottom - arc_top) / 2
+    lock_mask |= (
+        _ellipse_mask(xx, yy, cx, arc_cy, arc_rx, arc_ry)
+        & ~_ellipse_mask(xx, yy, cx, arc_cy, arc_rx - shackle_thickness, arc_ry - shackle_thickness)
+        & (yy <= arc_cy)
     )
+    rgba[lock_mask] = fg_color + (255,)
 
     # Keyhole (small circle + triangle)
     keyhole_y = body_top + body_h * 0.35
     keyhole_r = size * 0.08
-    draw.ellipse(
-        [cx - keyhole_r, keyhole_y - keyhole_r, cx + keyhole_r, keyhole_y + keyhole_r],
-        fill=bg_color
-    )
-    # Keyhole slot
-    draw.polygon(
-        [(cx - keyhole_r * 0.6, keyhole_y),
-         (cx + keyhole_r * 0.6, keyhole_y),
-         (cx, keyhole_y + size * 0.15)],
-        fill=bg_color
-    )
+    keyhole_mask = _ellipse_mask(xx, yy, cx, keyhole_y, keyhole_r, keyhole_r)
+    # Keyhole slot: triangle narrowing from the circle center down to its tip
+    slot_tip = keyhole_y + size * 0.15
+    slot_half_w = (slot_tip - yy) * (keyhole_r * 0.6 / (slot_tip - keyhole_y))
+    keyhole_mask |= (yy >= keyhole_y) & (yy <= slot_tip) & (np.abs(xx - cx) <= slot_half_w)
+    rgba[keyhole_mask] = bg_color + (255,)
 
 
 def create_icon(size):
     """Create a single icon at the specified size."""
     # Use RGBA for transparency
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    rgba = np.zeros((size, size, 4), np.uint8)
+
+    # Pixel-center coordinate grids, broadcast against each other by the masks
+    yy, xx = np.ogrid[:size, :size]
+    xx = xx + 0.5
+    yy = yy + 0.5
 
     # Colors - MORRIS THE CAT orange, high visibility
     paw_color = (255, 140, 50)     # Bright orange tabby - Morris the Cat
@@ -94,62 +119,84 @@ def create_icon(size):
     # Draw paw print (centered, fills the space)
     paw_cx = center
     paw_cy = center - size * 0.02
-    draw_paw_print(draw, paw_cx, paw_cy, paw_size, paw_color)
+    draw_paw_print(rgba, xx, yy, paw_cx, paw_cy, paw_size, paw_color)
 
     # Draw lock badge in bottom-right - BIGGER and BOLDER
     if size >= 32:
         lock_size = size * 0.45  # Bigger lock
         lock_cx = center + size * 0.30
         lock_cy = center + size * 0.28
-        draw_lock_badge(draw, lock_cx, lock_cy, lock_size, lock_bg, lock_color)
+        draw_lock_badge(rgba, xx, yy, lock_cx, lock_cy, lock_size, lock_bg, lock_color)
     elif size >= 16:
         # For tiny sizes, bright blue dot - still visible
         dot_r = size * 0.18
         dot_cx = center + size * 0.28
         dot_cy = center + size * 0.28
-        draw.ellipse(
-            [dot_cx - dot_r, dot_cy - dot_r, dot_cx + dot_r, dot_cy + dot_r],
-            fill=lock_color
-        )
+        rgba[_ellipse_mask(xx, yy, dot_cx, dot_cy, dot_r, dot_r)] = lock_color + (255,)
+
+    return Image.fromarray(rgba, 'RGBA')
 
-    return img
+
+def write_ico(f, sizes, payloads):
+    """Write an ICO file whose entries are the given PNG-encoded images."""
+    # ICONDIR: reserved, type (1 = icon), image count
+    f.write(struct.pack('<HHH', 0, 1, len(sizes)))
+    offset = 6 + 16 * len(sizes)
+    for size, png in zip(sizes, payloads):
+        # ICONDIRENTRY: width/height (0 means 256), palette size, reserved,
+        # color planes, bits per pixel, payload length, payload offset
+        f.write(struct.pack('<BBBBHHII', size & 0xFF, size & 0xFF, 0, 0, 1, 32, len(png), offset))
+        offset += len(png)
+    for png in payloads:
+        f.write(png)
 
 
 def main():
     # Standard Windows icon sizes - most important for system tray and taskbar
     sizes = [16, 32, 48, 256]
 
-    # Generate all sizes
-    images = []
-    for s in sizes:
-        img = create_icon(s)
-        # Convert to proper format for ICO embedding
-        images.append(img)
-
-    # Save as ICO with proper multi-size embedding
-    # The largest image saves, others are appended
+    # Render the 256px master once and downscale it for the larger sizes.
+    # The geometry is scale-invariant, so Lanczos resampling matches a native
+    # render. Sizes below 32 use the simplified blue-dot badge, so they are
+    # still rendered natively to stay legible in the system tray.
+    master = create_icon(sizes[-1])
+    images = [
+        create_icon(s) if s < 32 else master.resize((s, s), Image.LANCZOS)
+        for s in sizes[:-1]
+    ]
+    images.append(master)
+
+    # Encode every size as PNG exactly once; the ICO embeds these blobs and
+    # icon.png reuses the 256px one verbatim
+    payloads = []
+    for img in images:
+        buf = io.BytesIO()
+        img.save(buf, format='PNG', optimize=True)
+        payloads.append(buf.getvalue())
+
+    # Write the ICO container by hand: ICONDIR, one ICONDIRENTRY per size,
+    # then the PNG payloads (Vista+ ICO supports embedded PNG). PIL's ICO
+    # encoder would re-encode and re-compress each size again.
     icon_path = 'resources/img/icon.ico'
-    images[-1].save(
-        icon_path,
-        format='ICO',
-        append_images=images[:-1],
-        sizes=[(s, s) for s in sizes]
-    )
+    with open(icon_path, 'wb') as f:
+        write_ico(f, sizes, payloads)
 
     # Verify the ICO file
-    import os
     ico_size = os.path.getsize(icon_path)
     print(f"Created icon.ico ({ico_size:,} bytes) with sizes: {sizes}")
 
     # Save 256px PNG for other uses (README, etc.)
-    images[-1].save('resources/img/icon.png', format='PNG', optimize=True)
-    png_size = os.path.getsize('resources/img/icon.png')
+    with open('resources/img/icon.png', 'wb') as f:
+        f.write(payloads[-1])
+    png_size = len(payloads[-1])
     print(f"Created icon.png (256x256, {png_size:,} bytes)")
 
     # Clean up preview file if it exists
     preview_path = 'resources/img/icon_preview.png'
-    if os.path.exists(preview_path):
+    try:
         os.remove(preview_path)
+    except FileNotFoundError:
+        pass
 
 
 if __name__ == '__main__':
@@ -60,13 +60,23 @@ def create_icon():
 
     # Standard ICO sizes
     sizes = [16, 24, 32, 48, 64, 128, 256]
-    images = []
 
-    for size in sizes:
+    def render(size):
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw_paw(draw, size, bg_color, fg_color)
-        images.append(img)
+        draw_paw(ImageDraw.Draw(img), size, bg_color, fg_color)
+        return img
+
+    # Draw the largest size once and downscale it for 32px and up.
+    # Below 32px the fixed 2px margin and the truncated pad offsets make up
+    # a visible share of the icon, so a downscale no longer looks like the
+    # native draw; those sizes are still rendered natively (as the app's
+    # generate_icon.py does for the tray).
+    master = render(sizes[-1])
+    images = [
+        render(size) if size < 32 else master.resize((size, size), Image.LANCZOS)
+        for size in sizes[:-1]
+    ]
+    images.append(master)
 
     # Save as ICO
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1,43 +1,157 @@
-"""Run PyInstaller build for PawGate."""
+"""
+Run PyInstaller build for PawGate.
+
+This is the single scripted build entry point (build.bat remains the
+interactive first-time setup that also installs dependencies).
+
+Usage:
+    python run_build.py [--clean-config] [--dev | --release]
+
+    --clean-config  Remove the user config first so the build is tested
+                    against the bundled defaults.
+    --dev           Build --onedir for fast launches while iterating
+                    (also the default when PAWGATE_DEV is set).
+    --release       Always build the single-file distributable, even when
+                    PAWGATE_DEV is set.
+"""
+import argparse
+import hashlib
 import os
 import subprocess
 import sys
 
 from src.util.path_util import get_config_path
 
+# Directories whose contents end up in the executable
+SOURCE_DIRS = ('src', 'resources')
+BUILD_STAMP_PATH = os.path.join('build', '.build-stamp')
+
+# Dev builds use --onedir so the exe starts without self-extracting to a temp
+# dir on every launch; release builds produce the single-file distributable.
+ONEDIR_EXE_PATH = os.path.join('dist', 'PawGate', 'PawGate.exe')
+ONEFILE_EXE_PATH = os.path.join('dist', 'PawGate.exe')
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse build flags; --dev defaults on when PAWGATE_DEV is set."""
+    parser = argparse.ArgumentParser(description='Build PawGate.exe with PyInstaller.')
+    parser.add_argument('--clean-config', action='store_true',
+                        help='remove the user config before building')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dev', action='store_true',
+                      help='fast --onedir build (default if PAWGATE_DEV is set)')
+    mode.add_argument('--release', action='store_true',
+                      help='single-file --onefile build')
+    args = parser.parse_args(argv)
+    if not args.release and os.environ.get('PAWGATE_DEV'):
+        args.dev = True
+    return args
+
+
+def _rm(path: str) -> bool:
+    """Remove a file, returning False if it was already gone (one syscall, no exists() check)."""
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
 
 def delete_user_config() -> None:
     """Remove the user config file so each build starts clean."""
     config_path = get_config_path()
-    if os.path.exists(config_path):
-        os.remove(config_path)
+    if _rm(config_path):
         print(f"Removed user config: {config_path}")
     else:
         print(f"No user config found at: {config_path}")
 
 
-delete_user_config()
+def _walk_files(root: str):
+    """Yield (path, stat) for every file under root, using os.scandir."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != '__pycache__':
+                    yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.stat()
+
+
+def compute_build_stamp(cmd: list[str]) -> str:
+    """
+    Fingerprint the build inputs without reading file contents.
+
+    Hashes (path, size, mtime_ns) for every file in SOURCE_DIRS plus the
+    PyInstaller command line, so any edit or flag change triggers a rebuild.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\0'.join(cmd).encode())
+    for root in SOURCE_DIRS:
+        for path, st in sorted(_walk_files(root)):
+            digest.update(f'{path}\0{st.st_size}\0{st.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()
+
+
+def is_build_current(stamp: str, exe_path: str) -> bool:
+    """Return True if the existing executable was built from the same inputs."""
+    if not os.path.exists(exe_path):
+        return False
+    try:
+        with open(BUILD_STAMP_PATH, 'r') as f:
+            return f.read().strip() == stamp
+    except FileNotFoundError:
+        return False
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    if args.clean_config:
+        delete_user_config()
+
+    # Build from the repo root regardless of where the script was invoked
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.dev:
+        bundle_args, exe_path = ['--onedir'], ONEDIR_EXE_PATH
+    else:
+        bundle_args, exe_path = ['--onefile'], ONEFILE_EXE_PATH
+
+    cmd = [
+        sys.executable, '-m', 'PyInstaller',
+        *bundle_args,
+        '--noconfirm',  # Overwrite dist/ without prompting (never stalls on stdin)
+        '--log-level=WARN',
+        '--distpath=./dist',
+        '--workpath=./build',
+        '--add-data=./resources/img/icon.ico;./resources/img/',
+        '--add-data=./resources/img/icon.png;./resources/img/',
+        '--add-data=./resources/config/config.json;./resources/config/',
+        '--icon=./resources/img/icon.ico',
+        '--hidden-import=plyer.platforms.win.notification',
+        '--noconsole',
+        '--name=PawGate',
+        './src/main.py'
+    ]
+
+    stamp = compute_build_stamp(cmd)
+    if is_build_current(stamp, exe_path):
+        print(f"Sources unchanged since last build, skipping PyInstaller: {exe_path}")
+        return 0
+
+    print(f"Running: {' '.join(cmd)}")
+    print("-" * 60)
 
-os.chdir(r'C:\github\pawgate')
+    result = subprocess.run(cmd)
+    print("-" * 60)
+    print(f"Exit code: {result.returncode}")
 
-cmd = [
-    sys.executable, '-m', 'PyInstaller',
-    '--onefile',
-    '--distpath=./dist',
-    '--workpath=./build',
-    '--add-data=./resources/img/icon.ico;./resources/img/',
-    '--add-data=./resources/img/icon.png;./resources/img/',
-    '--add-data=./resources/config/config.json;./resources/config/',
-    '--icon=./resources/img/icon.ico',
-    '--hidden-import=plyer.platforms.win.notification',
-    '--noconsole',
-    '--name=PawGate',
-    './src/main.py'
-]
+    if result.returncode == 0:
+        os.makedirs(os.path.dirname(BUILD_STAMP_PATH), exist_ok=True)
+        with open(BUILD_STAMP_PATH, 'w') as f:
+            f.write(stamp)
+    return result.returncode
 
-print(f"Running: {' '.join(cmd)}")
-print("-" * 60)
 
-result = subprocess.run(cmd, capture_output=False)
-print("-" * 60)
-print(f"Exit code: {result.returncode}")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,14 +30,17 @@ See also:
     - main.py: Uses Config instance for all settings
 """
 
+import functools
 import json
+import logging
 import os
-import os.path
-import shutil
 import sys
+from pathlib import Path
 
+from src.util.hotkey_util import parse_hotkey_keys
 from src.util.path_util import get_packaged_path, get_config_path
-from src.util.web_browser_util import open_about
+
+logger = logging.getLogger(__name__)
 
 # Path to the default config bundled with the application
 # WHY in resources/: PyInstaller can package this with --add-data
@@ -70,12 +73,44 @@ def should_use_bundled_config():
     return '--reset-config' in sys.argv or os.environ.get('PAWGATE_DEV')
 
 
+def _restore_bundled_config(config_path: str) -> dict:
+    """
+    Overwrite the user config with the bundled defaults and return them parsed.
+
+    The bundled file is read once into memory; the same bytes are parsed and
+    written to the user path, so there is no copy-then-reread round trip.
+
+    WHY compare before writing:
+        In dev mode this runs on every launch, and the user file usually
+        already matches the bundled one from the previous run. Comparing the
+        bytes skips the disk write in that common case.
+    """
+    data = Path(get_packaged_path(BUNDLED_CONFIG_FILE)).read_bytes()
+    parsed = json.loads(data)
+    user_path = Path(config_path)
+    try:
+        unchanged = user_path.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        user_path.write_bytes(data)
+    return parsed
+
+
+@functools.lru_cache(maxsize=1)
 def load():
     """
     Load configuration from user's config file, with fallback to bundled defaults.
 
+    The parsed dict is memoized: repeated Config() constructions (tests, tray
+    recreation) share one parse. Config instances copy it rather than edit it,
+    and Config.save() updates it in place after writing, so it never goes
+    stale within a process. Call load.cache_clear() to force a re-read from
+    disk (e.g. after a dev-mode reset or in tests).
+
     Loading priority:
         1. If dev mode (--reset-config or PAWGATE_DEV): Force reset to bundled defaults
+           (the file is only rewritten if it differs from the bundled one)
         2. If user config exists and is valid JSON: Use it
         3. If user config missing or corrupt: Copy bundled defaults and use those
 
@@ -101,36 +136,26 @@ def load():
         - get_config_path(): Returns ~/.pawgate/config/config.json
         - get_packaged_path(): Handles PyInstaller bundled resources
     """
+    config_path = get_config_path()
+
     # Dev mode: always use bundled config for predictable behavior
     if should_use_bundled_config():
-        config_path = get_config_path()
-
-        # Remove existing user config (if any) to force fresh state
-        if os.path.exists(config_path):
-            os.remove(config_path)
-
-        # Copy bundled defaults to user config location
-        # WHY copy instead of just reading bundled: Keeps user config directory
+        # Overwrite user config with bundled defaults to force fresh state
+        # WHY write instead of just reading bundled: Keeps user config directory
         # consistent (always has a config.json file after first run)
-        shutil.copy(get_packaged_path(BUNDLED_CONFIG_FILE), config_path)
+        config = _restore_bundled_config(config_path)
         print(f"[DEV] Reset config to bundled defaults: {config_path}")
-
-        with open(config_path, "r") as f:
-            return json.load(f)
+        return config
 
     # Try to load user config (normal operation)
     try:
-        with open(get_config_path(), "r") as f:
+        with open(config_path, "r") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
-        # Config missing or corrupt - copy bundled defaults
-        # WHY copy on error: Ensures user config directory is populated
+        # Config missing or corrupt - restore bundled defaults
+        # WHY write on error: Ensures user config directory is populated
         # so future saves have a valid starting point
-        shutil.copy(get_packaged_path(BUNDLED_CONFIG_FILE), get_config_path())
-
-        # Now load the freshly copied config
-        with open(get_config_path(), "r") as f:
-            return json.load(f)
+        return _restore_bundled_config(config_path)
 
 
 class Config:
@@ -143,12 +168,17 @@ class Config:
 
     Attributes:
         hotkey (str): Global keyboard shortcut (e.g., "ctrl+b")
+        hotkey_keys (tuple[str, ...]): Hotkey split into key names with
+            modifier variants expanded (read-only, cached per hotkey)
         opacity (float): Overlay transparency 0.0-1.0 (e.g., 0.3 = 30% opaque)
         notifications_enabled (bool): Show Windows toast when keyboard locks
 
-    WHY instance attributes instead of class attributes:
-        Multiple Config instances could theoretically exist (testing), and
-        we don't want shared state between them.
+    WHY properties over a per-instance copy of the loaded dict:
+        load() is memoized, so constructing Config again only copies a
+        three-key dict instead of re-parsing the file. Each instance edits its
+        own copy, so unsaved changes stay private to it; save() pushes the
+        saved values into load()'s cache so the next instance starts from
+        them.
 
     WHY .get() with defaults:
         Forward compatibility - if we add new settings in a future version,
@@ -164,13 +194,16 @@ class Config:
         """
         Load configuration from disk and populate instance attributes.
 
-        If config is completely missing (None), this is a first-run scenario.
-        We open the about page in the browser and save default config to disk.
+        First run is detected by the absence of both a `.welcomed` marker and
+        config.json next to it; in that case we open the about page and
+        create the marker.
 
-        WHY dict.get() with ternary:
-            Handles the case where config is None (should never happen due to
-            load()'s fallback logic, but defensive programming is good).
-            Also provides defaults for any missing keys (forward compatibility).
+        WHY copy load()'s dict:
+            load() returns one cached dict for the whole process. Editing it
+            directly would make a setter's unsaved value visible to every
+            later Config(). `or {}` guards against a None result (load()'s
+            fallback logic should prevent it), and the properties supply
+            defaults for any missing keys (forward compatibility).
 
         WHY camelCase "notificationsEnabled" in JSON but snake_case in Python:
             JSON follows JavaScript conventions (camelCase), but Python
@@ -180,20 +213,77 @@ class Config:
             Welcomes new users and explains what PawGate does. Many users
             install software and forget what it's for. The about page provides
             context and usage instructions.
+
+        WHY a marker file instead of checking for an empty config:
+            load() always repairs a missing config from bundled defaults, so
+            "config is empty" is the wrong signal; a bug there could launch a
+            browser on every start. The marker makes the welcome fire exactly
+            once per user. open_about is imported only in that branch so the
+            webbrowser module stays off the normal startup path.
+
+        WHY an existing config.json also counts as welcomed:
+            Releases before the marker never wrote one, so upgrading users
+            would otherwise get the about page again. Their config file
+            proves they have run PawGate before; the marker is just created
+            silently. This is checked before load(), which creates the file.
         """
-        config = load()
+        config_path = Path(get_config_path())
+        welcomed = config_path.parent / ".welcomed"
+        needs_marker = not welcomed.exists()
+        first_run = needs_marker and not config_path.exists()
+
+        # Settings are read lazily from this private copy, with fallback
+        # defaults for missing keys (see the properties below)
+        self._cfg = dict(load() or {})
+
+        # (hotkey, parsed keys) - see hotkey_keys
+        self._hotkey_keys = None
+
+        # First run: no marker and no config yet, so open the about page once;
+        # an upgrade from a marker-less release just gets the marker
+        if first_run:
+            from src.util.web_browser_util import open_about
+            open_about()  # Welcome the user with browser page
+        if needs_marker:
+            welcomed.touch()
 
-        # Load settings with fallback defaults for missing keys
-        # WHY ternary check for None: Defensive programming, though load()
-        # should never return None due to its fallback logic
-        self.hotkey = config.get("hotkey", DEFAULT_HOTKEY) if config else DEFAULT_HOTKEY
-        self.opacity = config.get("opacity", 0.3) if config else 0.3
-        self.notifications_enabled = config.get("notificationsEnabled", True) if config else True
+    @property
+    def hotkey(self) -> str:
+        return self._cfg.get("hotkey", DEFAULT_HOTKEY)
 
-        # First run: config was None, so open about page and save defaults
-        if not config:
-            open_about()  # Welcome the user with browser page
-            self.save()   # Create initial config file
+    @hotkey.setter
+    def hotkey(self, value: str) -> None:
+        self._cfg["hotkey"] = value
+
+    @property
+    def hotkey_keys(self) -> tuple[str, ...]:
+        """
+        The hotkey's key names with modifier variants expanded.
+
+        WHY cached here: Locking needs this on every lock. Parsing once per
+        hotkey value (keyed by the string, so a new hotkey is picked up
+        automatically) keeps lower/split/strip off the lock path.
+        """
+        hotkey = self.hotkey
+        if self._hotkey_keys is None or self._hotkey_keys[0] != hotkey:
+            self._hotkey_keys = (hotkey, parse_hotkey_keys(hotkey))
+        return self._hotkey_keys[1]
+
+    @property
+    def opacity(self) -> float:
+        return self._cfg.get("opacity", 0.3)
+
+    @opacity.setter
+    def opacity(self, value: float) -> None:
+        self._cfg["opacity"] = value
+
+    @property
+    def notifications_enabled(self) -> bool:
+        return self._cfg.get("notificationsEnabled", True)
+
+    @notifications_enabled.setter
+    def notifications_enabled(self, value: bool) -> None:
+        self._cfg["notificationsEnabled"] = value
 
     def save(self) -> None:
         """
@@ -202,10 +292,16 @@ class Config:
         Writes settings to ~/.pawgate/config/config.json in JSON format.
         Called whenever user changes settings via system tray menu.
 
-        WHY print statement:
-            Debug aid during development. Confirms settings are being saved
-            to the correct location. Could be replaced with proper logging
-            in production.
+        WHY write to a temp file and os.replace():
+            Writing straight to the live path means a crash mid-write leaves a
+            truncated file, which load() then has to repair from bundled
+            defaults (losing the user's settings). os.replace() is an atomic
+            rename on Windows (MoveFileEx) and POSIX, so the config on disk is
+            always either the old or the new version, never a partial one.
+
+        WHY logger.debug instead of print:
+            Confirms the save location during development without forcing a
+            stdout write (and flush) on every settings change.
 
         WHY reconstruct dict:
             We could use self.__dict__, but explicit is better than implicit.
@@ -220,16 +316,25 @@ class Config:
         See also:
             - tray_icon.py: Calls save() when user changes opacity or notifications
         """
-        print(f'saving to: {get_config_path()}')
-
-        with open(get_config_path(), "w") as f:
-            # Reconstruct config dict with camelCase keys for JSON
-            # WHY camelCase: Matches JavaScript/JSON conventions
-            config = {
-                "hotkey": self.hotkey,
-                "opacity": self.opacity,
-                "notificationsEnabled": self.notifications_enabled,  # snake_case -> camelCase
-            }
-            # WHY no indent or formatting: Keeps file small (though we could add indent=2
-            # for human readability at the cost of a few bytes)
-            json.dump(config, f)
+        config_path = get_config_path()
+        logger.debug("saving to: %s", config_path)
+
+        # Reconstruct config dict with camelCase keys for JSON
+        # WHY camelCase: Matches JavaScript/JSON conventions
+        config = {
+            "hotkey": self.hotkey,
+            "opacity": self.opacity,
+            "notificationsEnabled": self.notifications_enabled,  # snake_case -> camelCase
+        }
+        tmp_path = config_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            # WHY compact separators: Keeps file small (no padding after ','
+            # and ':'); the file is still valid, editable JSON
+            json.dump(config, f, separators=(",", ":"))
+        os.replace(tmp_path, config_path)
+
+        # Update the memoized dict only once the values are on disk, so later
+        # Config instances start from the saved settings without re-parsing
+        # WHY after the write: if the cache was cleared, load() re-reads the
+        # file we just wrote and the update is a harmless no-op
+        load().update(config)
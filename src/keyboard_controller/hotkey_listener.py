@@ -1,58 +1,94 @@
 """
 Global Hotkey Listener - Register and manage system-wide keyboard shortcuts.
 
-This module wraps the `keyboard` library's hotkey functionality with proper
-lifecycle management (start, stop, restart) and thread safety.
+This module matches the configured hotkeys in a single keyboard hook, with
+proper lifecycle management (register, unregister, re-register) and thread
+safety.
 
 The keyboard library (boppreh/keyboard) uses Windows low-level keyboard hooks
 to intercept key events globally, even when PawGate doesn't have focus.
 
 Threading considerations:
-    - keyboard.add_hotkey() is blocking (runs its own event loop)
-    - We run it in a daemon thread to avoid blocking the main thread
-    - The thread loops while listen_for_hotkey is True
-    - Cleanup (unhook_all_hotkeys) happens when thread exits
+    - keyboard.hook() does not block: the keyboard library invokes our
+      callback from its own hook thread for every key event
+    - So no thread of ours has to stay alive to keep a hotkey registered;
+      registering and unregistering are plain calls on the caller's thread
+    - The hook reads the compiled hotkeys from one attribute that
+      registration replaces wholesale, so it never takes hotkey_lock
+    - Cleanup is calling the remover keyboard.hook() returned
+
+WHY a bitmask matcher instead of keyboard.add_hotkey():
+    add_hotkey() runs the library's generic hotkey state machine on every
+    key event: it sorts the pressed scan codes into a tuple, looks it up,
+    and for suppressed hotkeys buffers modifier events until it knows
+    whether a hotkey follows. PawGate only ever needs "is this key-down the
+    last key of a configured combination, with exactly its keys held". Each
+    key of interest gets one bit, so the held keys are a single int and a
+    match is a few integer ops on the key-down of the trigger key.
 
 WHY separate class instead of methods in main.py:
     Hotkey management has complex lifecycle requirements (start, stop, restart)
     that deserve encapsulation. This makes the code easier to understand and test.
 
 WHY threading.Lock (hotkey_lock):
-    Without a lock, concurrent calls to start_hotkey_listener_thread could
-    create race conditions:
-    - Two threads trying to start hotkey listener simultaneously
-    - Trying to stop while another thread is starting
+    register_hotkeys() can be called from the main thread at startup and
+    from the tray thread after a settings change. Without a lock:
+    - Two callers could register the hotkey twice
+    - Unregistering could interleave with registering
     The lock ensures only one thread can modify hotkey state at a time.
 
+    It guards registration only, never the per-keystroke path. The hook
+    reads self._targets, a tuple that registration replaces in one
+    assignment (atomic under the GIL), so a keystroke sees either the old
+    hotkeys or the new ones and never waits on a settings change. A
+    generation counter would add a second read per event to detect the same
+    swap that the single assignment already rules out.
+
 See also:
     - main.py: Creates HotkeyListener instance in __init__
     - pressed_events_handler.py: Workaround for keyboard library bug
     - config.py: Stores the hotkey string (e.g., "ctrl+b")
 """
 
-import threading
-import time
-
 import keyboard
 
+# Sided modifier names. Every scan code they resolve to gets a bit even when
+# no hotkey uses it, so holding an extra modifier (Alt with Ctrl+B) prevents
+# a match, as it did with add_hotkey().
+_MODIFIER_NAMES = (
+    'left ctrl', 'right ctrl',
+    'left shift', 'right shift',
+    'left alt', 'right alt',
+    'left windows', 'right windows',
+)
+
 
 class HotkeyListener:
     """
     Manages global hotkey registration and lifecycle.
 
-    This class handles starting, stopping, and restarting the hotkey listener
-    thread with proper cleanup and state management.
+    This class handles registering, unregistering, and re-registering the
+    hotkeys with proper cleanup and state management.
 
     Attributes:
         main: Reference to PawGateCore instance (provides access to config,
               queues, and callbacks)
+        _remove_hook: Remover returned by keyboard.hook(), or None when no
+                      hotkeys are registered
+        _targets: Compiled hotkeys as (key_masks, allowed_mask, trigger_codes)
+                  tuples; replaced as a whole on (re-)registration
+        _compiled: Cache of hotkey string -> compiled hotkey, so restarts
+                   re-register without re-parsing the hotkey
+        _bits: Scan code -> bit for every key the matcher tracks
+        _held: Bitmask of tracked keys currently held down
+        _fired: Scan code of the trigger key that last fired, until released
 
     WHY pass main instance:
         The listener needs access to:
         - self.main.config.hotkey: The key combination to listen for
         - self.main.send_hotkey_signal(): Callback when hotkey is pressed
         - self.main.hotkey_lock: Thread lock for safe lifecycle management
-        - self.main.listen_for_hotkey: Flag to control listener loop
+        - self.main.listen_for_hotkey: Flag reporting whether the hotkeys are registered
 
         Passing the entire main instance is simpler than passing each piece
         individually (fewer parameters, easier to extend).
@@ -66,123 +102,224 @@ class HotkeyListener:
             main: PawGateCore instance that owns this listener
         """
         self.main = main
+        self._remove_hook = None
+        self._targets = ()
+        self._compiled = {}
+        self._bits = None
+        self._held = 0
+        self._fired = None
+
+    def _bit(self, scan_code: int) -> int:
+        """Return the bit tracking scan_code, assigning the next free one."""
+        bit = self._bits.get(scan_code)
+        if bit is None:
+            bit = self._bits[scan_code] = 1 << len(self._bits)
+        return bit
+
+    def _compile(self, hotkey: str) -> tuple[tuple[int, ...], int, frozenset[int]]:
+        """
+        Compile a hotkey string into the bitmask form matched by the hook.
+
+        Returns:
+            (key_masks, allowed_mask, trigger_codes): one mask per key of the
+            combination (a key matches if any of its scan codes is held),
+            the union of those masks, and the scan codes of the last key,
+            whose key-down fires the hotkey.
+
+        Raises:
+            ValueError: If the hotkey cannot be parsed, has several steps
+                        (e.g. "ctrl+a, b"), which PawGate does not support,
+                        or names keys the platform cannot tell apart.
+
+        WHY reject overlapping keys:
+            Each key must be satisfied by a scan code of its own. On Windows
+            the keyboard library reports both "left ctrl" and "right ctrl"
+            as scan code 29 (the extended flag is not part of scan_code), so
+            "left ctrl+right ctrl" would compile to two masks sharing one
+            bit, and a single Ctrl press would satisfy both: every Ctrl
+            key-down would fire the hotkey and be swallowed.
+
+        WHY cache: parsing resolves every key name to scan codes through the
+        OS keymap; re-registering after a settings change reuses the result.
+        """
+        compiled = self._compiled.get(hotkey)
+        if compiled is None:
+            if self._bits is None:
+                self._bits = {}
+                for name in _MODIFIER_NAMES:
+                    for code in keyboard.key_to_scan_codes(name, False):
+                        self._bit(code)
+
+            steps = keyboard.parse_hotkey(hotkey)
+            if len(steps) != 1:
+                raise ValueError(f"Hotkey must be a single key combination: {hotkey!r}")
+            keys = steps[0]
+
+            key_masks = []
+            allowed = 0
+            for scan_codes in keys:
+                mask = 0
+                for code in scan_codes:
+                    mask |= self._bit(code)
+                if mask & allowed:
+                    raise ValueError(f"Hotkey keys share a scan code on this platform: {hotkey!r}")
+                key_masks.append(mask)
+                allowed |= mask
+            compiled = (tuple(key_masks), allowed, frozenset(keys[-1]))
+            self._compiled[hotkey] = compiled
+        return compiled
+
+    def _on_key_event(self, event) -> bool:
+        """
+        Suppressing hook callback: fire on the trigger key of a hotkey.
+
+        Runs on the keyboard library's hook thread for every key event that
+        PawGateCore's lock hook lets through. Returns False to swallow the
+        trigger key (and its auto-repeats) so the hotkey never reaches the
+        focused application; every other event passes.
+
+        WHY ignore auto-repeat:
+            Holding the hotkey sends repeated key-downs for the trigger key.
+            Each one would toggle lock/unlock again, so only the first
+            key-down after a release fires.
+        """
+        code = event.scan_code
+        if event.event_type == keyboard.KEY_UP:
+            self.release_key(code)
+            return True
+
+        bit = self._bits.get(code, 0) if self._bits else 0
+        held = self._held | bit
+        self._held = held
+        if code == self._fired:
+            return False
+        for key_masks, allowed, trigger_codes in self._targets:
+            if code in trigger_codes and not held & ~allowed and all(held & mask for mask in key_masks):
+                self._fired = code
+                self.main.send_hotkey_signal()
+                return False
+        return True
+
+    def release_key(self, scan_code: int) -> None:
+        """
+        Record that a key was released.
+
+        Called from _on_key_event() for key-ups that reach this hook, and by
+        PawGateCore's lock hook for key-ups it swallows while locked.
+
+        WHY the lock hook reports swallowed key-ups:
+            That hook runs first and the library stops at the first hook
+            that returns False, so this one never sees them. A Shift, Alt or
+            Win key held when the lock starts and released during it would
+            otherwise keep its bit in _held, and the "no extra keys held"
+            check would block the hotkey after unlock until that key was
+            pressed again.
+        """
+        if self._bits:
+            self._held &= ~self._bits.get(scan_code, 0)
+        if scan_code == self._fired:
+            self._fired = None
+
+    def update_hotkey(self, hotkey: str) -> None:
+        """
+        Switch to a new hotkey and re-register the hotkeys with it.
+
+        Drops the cached compile of the old hotkey so it is re-parsed exactly
+        once; settings changes that don't touch the hotkey (opacity,
+        notifications) never re-parse it.
 
-    def start_hotkey_listener_thread(self) -> None:
+        Args:
+            hotkey: New hotkey string (e.g., "ctrl+shift+l")
         """
-        Start (or restart) the hotkey listener in a daemon thread.
+        self._compiled.pop(self.main.config.hotkey, None)
+        self.main.config.hotkey = hotkey
+        self.register_hotkeys()
+
+    def register_hotkeys(self) -> None:
+        """
+        Register (or re-register) the global and emergency hotkeys.
 
         This method:
-        1. Clears stale keyboard state (prevents stuck keys)
+        1. Clears stale keyboard state on re-registration (prevents stuck keys)
         2. Acquires hotkey_lock to prevent race conditions
-        3. Sets listen_for_hotkey flag to True
-        4. Waits for existing thread to finish (if restarting)
-        5. Creates and starts new daemon thread
+        3. Compiles the configured hotkey and the emergency hotkey
+        4. Installs the matching hook (first registration only)
+        5. Sets listen_for_hotkey flag to True
 
         WHY stash_state at the start:
             The keyboard library tracks which keys are currently pressed in
-            internal state. If we're restarting the listener (e.g., after
-            changing the hotkey), stale state could cause issues. Calling
-            stash_state() clears this, ensuring we start fresh.
-
-        WHY check if thread is alive before joining:
-            If we're starting for the first time, hotkey_thread is None, so
-            we skip the join. If we're restarting, we need to wait for the
-            old thread to fully exit before starting a new one. The complex
-            condition ensures we only join if:
-            - A thread exists (hotkey_thread is not None)
-            - We're not trying to join from within that thread (deadlock prevention)
-            - The thread is actually running (is_alive check)
-
-        WHY daemon thread:
-            Daemon threads automatically terminate when the main program exits.
-            This ensures clean shutdown without requiring explicit thread.join()
-            in every exit path.
+            internal state. If we're re-registering (e.g., after changing the
+            hotkey), stale state could cause issues. Calling stash_state()
+            clears this, ensuring we start fresh. On the very first
+            registration there is no hook and no stale state, so the call
+            is skipped.
+
+        WHY no listener thread:
+            This used to start a daemon thread that called add_hotkey() and
+            then blocked on an Event just to stay alive. The keyboard library
+            keeps hooks installed and dispatches them from its own hook
+            thread whether or not the registering thread still exists, so
+            the extra thread (and the join on every restart) bought nothing.
+
+        WHY suppress=True:
+            When the hotkey is pressed, we don't want it to reach other
+            applications. For example, if the hotkey is Ctrl+B, without
+            suppression the Ctrl+B would also reach the browser (which
+            uses Ctrl+B for bold text). A suppressing hook can return False
+            for the trigger key before it reaches other applications.
 
         Thread safety:
             The hotkey_lock ensures this method is atomic. Without it, two
-            concurrent calls could create multiple listener threads, causing
-            undefined behavior.
+            concurrent calls could install the hook twice, causing
+            duplicate signals per press.
 
         See also:
-            - hotkey_listener(): The actual thread target function
+            - unregister_hotkeys(): Cleanup counterpart
             - main.py: Calls this during initialization
+            - main.send_hotkey_signal(): Callback invoked when hotkey is pressed
         """
         # Clear keyboard library's internal state to prevent stuck keys
-        # WHY: Ensures fresh start when (re)starting listener
-        keyboard.stash_state()
+        # WHY: Ensures fresh start when re-registering
+        if self._remove_hook is not None:
+            keyboard.stash_state()
 
-        # Acquire lock to prevent race conditions during thread lifecycle changes
         with self.main.hotkey_lock:
-            # Enable the listener loop (hotkey_listener checks this flag)
+            targets = [self._compile(self.main.config.hotkey)]
+
+            # Register a built-in emergency unlock hotkey so users are never stuck
+            emergency_hotkey = getattr(self.main, "emergency_hotkey", None)
+            if emergency_hotkey and emergency_hotkey != self.main.config.hotkey:
+                targets.append(self._compile(emergency_hotkey))
+
+            # WHY one assignment: the hook thread reads _targets without the lock
+            self._targets = tuple(targets)
+            self._held = 0
+            self._fired = None
+
+            # WHY suppress=True: Prevent hotkey from reaching other applications
+            if self._remove_hook is None:
+                self._remove_hook = keyboard.hook(self._on_key_event, suppress=True)
+
             self.main.listen_for_hotkey = True
 
-            # If an old thread exists and is running, wait for it to exit
-            # WHY check current_thread: Prevent deadlock if somehow called from within hotkey thread
-            if (
-                self.main.hotkey_thread
-                and threading.current_thread() is not self.main.hotkey_thread
-                and self.main.hotkey_thread.is_alive()
-            ):
-                self.main.hotkey_thread.join()
-
-            # Create and start new hotkey listener thread
-            # WHY daemon=True: Thread exits automatically when main program exits
-            self.main.hotkey_thread = threading.Thread(target=self.hotkey_listener, daemon=True)
-            self.main.hotkey_thread.start()
-
-    def hotkey_listener(self) -> None:
+    def unregister_hotkeys(self) -> None:
         """
-        Thread target that registers the hotkey and loops until disabled.
+        Remove the hook installed by register_hotkeys().
 
-        This function:
-        1. Registers the global hotkey with keyboard.add_hotkey()
-        2. Loops while listen_for_hotkey is True (sleep to avoid busy-wait)
-        3. Cleans up by unhooking all hotkeys when loop exits
+        WHY necessary: Otherwise, pressing the hotkey after the listener
+        "stops" would still trigger the callback, causing errors
+        (attempting to signal a stopped application).
 
-        WHY suppress=True:
-            When the hotkey is pressed, we don't want it to reach other
-            applications. For example, if the hotkey is Ctrl+B, without
-                suppress=True, the Ctrl+B would also reach the browser (which
-                uses Ctrl+B for bold text). With suppress=True, the
-            keyboard library intercepts the key combination before it reaches
-            other applications.
-
-        WHY loop with sleep:
-            keyboard.add_hotkey() registers a callback but doesn't block.
-            We need to keep the thread alive so the hotkey remains registered.
-            Without the sleep, this would spin at 100% CPU. The 1-second sleep
-            is arbitrary - hotkeys are registered at the OS level, so the sleep
-            doesn't affect responsiveness.
-
-        WHY unhook_all_hotkeys:
-            When the thread exits (listen_for_hotkey becomes False), we must
-            unregister the hotkey. Otherwise, pressing the hotkey after the
-            listener "stops" would still trigger the callback, causing errors
-            (attempting to signal a stopped application).
-
-        Cleanup:
-            This method ensures proper cleanup when the listener is stopped.
-            The loop exits when listen_for_hotkey is False, and unhook_all_hotkeys()
-            ensures no dangling keyboard hooks remain.
+        WHY the remover instead of unhook_all / unhook_all_hotkeys:
+            It removes only our hook and leaves PawGateCore's lock hook, the
+            pressed-events cleaner and anything else hooked untouched.
 
         See also:
-            - start_hotkey_listener_thread(): Starts this thread
-            - main.send_hotkey_signal(): Callback invoked when hotkey is pressed
+            - register_hotkeys(): Registration counterpart
         """
-        # Register the global hotkey with the keyboard library
-        # WHY suppress=True: Prevent hotkey from reaching other applications
-        keyboard.add_hotkey(self.main.config.hotkey, self.main.send_hotkey_signal, suppress=True)
-
-        # Register a built-in emergency unlock hotkey so users are never stuck
-        emergency_hotkey = getattr(self.main, "emergency_hotkey", None)
-        if emergency_hotkey and emergency_hotkey != self.main.config.hotkey:
-            keyboard.add_hotkey(emergency_hotkey, self.main.send_hotkey_signal, suppress=True)
-
-        # Keep thread alive while hotkey should be registered
-        # WHY loop: add_hotkey() doesn't block, but we need thread alive for hook to persist
-        while self.main.listen_for_hotkey:
-            time.sleep(1)  # Sleep to avoid busy-waiting (CPU-friendly)
-
-        # Cleanup: Unregister all hotkeys when thread is stopping
-        # WHY necessary: Prevents dangling keyboard hooks that could cause errors
-        keyboard.unhook_all_hotkeys()
+        with self.main.hotkey_lock:
+            self.main.listen_for_hotkey = False
+            self._targets = ()
+            if self._remove_hook is not None:
+                self._remove_hook()
+                self._remove_hook = None
@@ -13,8 +13,9 @@ The Bug:
     See: https://github.com/boppreh/keyboard/issues/223
 
 The Workaround:
-    We periodically scan the _pressed_events dictionary and delete stale entries
-    (keys pressed more than 2 seconds ago). This prevents the stuck key state
+    Whenever a key goes down we arm a one-shot timer; when it fires it deletes
+    stale entries (keys pressed more than 2 seconds ago) from _pressed_events
+    and re-arms only if keys are still held. This prevents the stuck key state
     from accumulating and breaking hotkey detection.
 
 WHY access private members (_pressed_events, _pressed_events_lock):
@@ -22,11 +23,13 @@ WHY access private members (_pressed_events, _pressed_events_lock):
     1. The bug is in the library, not our code
     2. The library doesn't provide a public API to fix this
     3. The alternative is to fork and maintain the entire keyboard library
-    4. This workaround is isolated to one function for easy removal when fixed
+    4. This workaround is isolated to one module for easy removal when fixed
 
-WHY run in a daemon thread:
-    This cleanup needs to run continuously in the background. A daemon thread
-    ensures it doesn't prevent application shutdown.
+WHY event-driven instead of a polling thread:
+    A key can only get stuck after it was pressed, so there is nothing to
+    clean until a key-down event arrives. Arming a timer from a keyboard hook
+    means an idle desktop causes zero wakeups, instead of one per second for
+    the app's entire lifetime.
 
 WHY 2-second threshold:
     - Normal key presses are brief (< 1 second typically)
@@ -39,26 +42,163 @@ Future:
     Track: https://github.com/boppreh/keyboard/issues/223
 
 See also:
-    - main.py: Starts this thread in __init__
+    - main.py: Starts the cleaner in __init__
     - hotkey_listener.py: Benefits from this workaround (hotkeys keep working)
 """
 
+import logging
+import threading
 import time
 
 import keyboard
 
+logger = logging.getLogger(__name__)
 
-def clear_pressed_events() -> None:
+# Keys "pressed" for longer than this (seconds) are treated as stuck
+STALE_AFTER = 2.0
+
+
+class PressedEventsCleaner:
+    """
+    Removes stale entries from the keyboard library's pressed-key state.
+
+    Attributes:
+        _timer: Pending threading.Timer for the next sweep (None when idle)
+        _timer_lock: Guards arming/disarming of _timer
+        _press_times: scan code -> time.monotonic() of its latest key-down
+
+    WHY our own monotonic timestamps:
+        The keyboard library stamps events with wall-clock time.time(), which
+        can jump (NTP adjustments, manual clock changes). A backward jump
+        would keep stuck keys forever; a forward jump would drop keys that
+        are really held. Recording time.monotonic() from our own hook makes
+        the staleness check immune to clock changes without patching the
+        library.
+
+    WHY a one-shot Timer per sweep:
+        The timer only exists while at least one key is down. Each sweep
+        re-arms for exactly when the oldest remaining key would turn stale,
+        so cleanup is never late by a polling interval and never runs when
+        there is nothing to clean.
+
+    See also:
+        - clear_pressed_events(): Module entry point used by main.py
     """
-    Continuously clean up stale key press events from keyboard library's state.
 
-    This function runs in an infinite loop (daemon thread) and periodically
-    removes keys from the keyboard library's internal _pressed_events dict
-    if they've been "pressed" for more than 2 seconds.
+    def __init__(self) -> None:
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        self._press_times = {}
+
+    def start(self) -> None:
+        """
+        Install the keyboard hook that arms sweeps on key presses.
+
+        WHY keyboard.hook (not suppressing): We only observe events; the hook
+        never blocks or alters them.
+        """
+        keyboard.hook(self._on_event)
+
+    def _on_event(self, event) -> None:
+        """Record key-down times and arm a sweep (called on the keyboard hook thread)."""
+        if event.event_type == keyboard.KEY_DOWN:
+            self._press_times[event.scan_code] = time.monotonic()
+            self._arm(STALE_AFTER)
+        else:
+            self._press_times.pop(event.scan_code, None)
+
+    def _arm(self, delay: float) -> None:
+        """
+        Schedule a sweep in `delay` seconds unless one is already pending.
+
+        WHY unlocked pre-check: Held keys auto-repeat many times a second.
+        Reading _timer without the lock keeps that path free of lock traffic;
+        the check is repeated under the lock before creating a timer.
+        """
+        if self._timer is not None:
+            return
+        with self._timer_lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(delay, self._sweep)
+            self._timer.daemon = True
+            self._timer.name = 'pawgate-presscleaner'  # Shows up by name in py-spy
+            self._timer.start()
+
+    def _sweep(self) -> None:
+        """
+        Delete stale key presses, then re-arm only if keys are still held.
+
+        Thread safety:
+            The keyboard library's event handling thread also modifies
+            _pressed_events under _pressed_events_lock. We only need that lock
+            to mutate the dict: the scan works on a copy taken without it, and
+            the lock is held just long enough to pop the stale keys.
+
+        WHY keyboard._pressed_events.copy() outside the lock:
+            dict.copy() runs as a single C call under the GIL, so it can't
+            observe a half-applied write from the event thread. Filtering the
+            copy lock-free means a sweep that finds nothing stale never
+            touches the library's lock at all, and one that does holds it only
+            for the pops, not for the scan. The clock is read once per sweep
+            rather than once per key.
+
+        Edge cases:
+            - Empty dict: Returns without taking the lock, timer is not re-armed
+            - Key released (or deleted by library) after the copy: pop() is a
+              no-op, so the race is harmless
+            - Multiple keys stuck: All get cleaned up in one locked pass
+        """
+        with self._timer_lock:
+            self._timer = None
+
+        # Snapshot the held keys without the library's lock (see docstring)
+        snapshot = keyboard._pressed_events.copy()
+
+        # Nothing held (keys were released normally): nothing to do, no re-arm
+        # WHY no re-arm needed: a key pressed after the copy arms its own sweep
+        if not snapshot:
+            return
+
+        now = time.monotonic()
+
+        # Age of every held key. Keys pressed before our hook was installed
+        # have no record; setdefault starts their clock now.
+        # WHY comprehensions: the filtering runs as tight LIST_APPEND/MAP_ADD
+        # bytecode instead of a loop body with method calls
+        press_times = self._press_times
+        ages = {k: now - press_times.setdefault(k, now) for k in snapshot}
+
+        # Keys "pressed" for more than 2 seconds are stale
+        # WHY 2 seconds: Long enough to avoid false positives, short
+        # enough to catch stuck keys before user notices issues
+        stale = [k for k, age in ages.items() if age > STALE_AFTER]
+
+        if stale:
+            # Lock only for the mutation (keyboard's event thread writes too)
+            with keyboard._pressed_events_lock:
+                for k in stale:
+                    keyboard._pressed_events.pop(k, None)  # Remove stale entry
+
+            for k in stale:
+                press_times.pop(k, None)
+            # WHY check once and log outside the lock: with DEBUG off nothing
+            # is formatted, and with it on we don't format while holding the lock
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("stale keys %s", ", ".join(snapshot[k].name for k in stale))
+
+        # Keys still held: sweep again when the oldest one would turn stale
+        oldest_age = max((age for age in ages.values() if age <= STALE_AFTER), default=None)
+        if oldest_age is not None:
+            self._arm(STALE_AFTER - oldest_age + 0.01)
+
+
+def clear_pressed_events() -> PressedEventsCleaner:
+    """
+    Start cleaning up stale key press events from keyboard library's state.
 
-    WHY infinite loop:
-        This cleanup must run for the entire application lifetime. The loop
-        only exits when the application terminates (daemon thread behavior).
+    Installs a PressedEventsCleaner hook and returns immediately; sweeps run
+    on short-lived timer threads only while keys are held.
 
     WHY 2-second threshold:
         Keys held for 2+ seconds are either:
@@ -69,53 +209,13 @@ def clear_pressed_events() -> None:
         generous leeway for legitimate key holds (e.g., holding Ctrl while
         clicking multiple items) while still catching stuck keys quickly.
 
-    WHY sleep(1):
-        Cleanup doesn't need to be instant. Running every second:
-        - Keeps CPU usage low (not spinning at 100%)
-        - Still catches stuck keys within 3 seconds total (2 second threshold
-          + up to 1 second sleep delay)
-        - Reduces lock contention on _pressed_events_lock
-
-    Thread safety:
-        We must acquire _pressed_events_lock before accessing _pressed_events
-        because the keyboard library's event handling thread also modifies it.
-        Without the lock, we'd have race conditions (reading while library writes).
-
-    WHY list(keyboard._pressed_events.keys()):
-        We can't iterate over a dict while modifying it (raises RuntimeError).
-        Creating a list snapshot of the keys allows us to safely delete items
-        during iteration. The list() creates a copy, so deletions don't affect
-        the iteration.
-
-    Edge cases:
-        - Empty dict: Loop continues, no harm done
-        - Key deleted by library while we're checking: No error, our deletion
-          just becomes a no-op
-        - Multiple keys stuck: All get cleaned up (loop processes all keys)
+    Returns:
+        PressedEventsCleaner: The running cleaner
 
     See also:
-        - main.py: Starts this in a daemon thread during initialization
+        - main.py: Calls this during initialization
         - GitHub issue: https://github.com/boppreh/keyboard/issues/223
     """
-    while True:
-        # WHY this list: For debugging/logging if needed (currently unused)
-        deleted = []
-
-        # Acquire keyboard library's internal lock for thread-safe access
-        # WHY necessary: Prevents race conditions with keyboard's event thread
-        with keyboard._pressed_events_lock:
-            # Create snapshot of keys to allow safe deletion during iteration
-            # WHY list(): Can't modify dict while iterating over it directly
-            for k in list(keyboard._pressed_events.keys()):
-                item = keyboard._pressed_events[k]
-
-                # Check if this key has been "pressed" for more than 2 seconds
-                # WHY 2 seconds: Long enough to avoid false positives, short
-                # enough to catch stuck keys before user notices issues
-                if time.time() - item.time > 2:
-                    deleted.append(item.name)  # Track for potential logging
-                    del keyboard._pressed_events[k]  # Remove stale entry
-
-        # Sleep to avoid busy-waiting and reduce CPU usage
-        # WHY 1 second: Balances responsiveness vs CPU efficiency
-        time.sleep(1)
+    cleaner = PressedEventsCleaner()
+    cleaner.start()
+    return cleaner
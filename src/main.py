@@ -12,7 +12,7 @@ Architecture Overview:
     The application runs a main event loop that monitors a queue for hotkey signals.
     When triggered (via Ctrl+B by default), it:
     1. Displays a fullscreen overlay using Tkinter
-    2. Blocks ALL keyboard input (scan codes 0-255)
+    2. Blocks ALL keyboard input except the unlock hotkey's keys
     3. Waits for the hotkey to be pressed again to unlock
 
     WHY: This prevents cats/pets from accidentally typing, closing windows,
@@ -21,13 +21,17 @@ Architecture Overview:
 
 Threading Model:
     - Main thread: Event loop monitoring hotkey signals
-    - Daemon thread 1: System tray icon (pystray runs its own event loop)
-    - Daemon thread 2: Hotkey listener (keyboard.add_hotkey blocks)
-    - Daemon thread 3: Pressed events cleaner (workaround for keyboard lib bug)
+    - Daemon thread: System tray icon (pystray runs its own event loop)
+    - Daemon thread: Notification worker (shows lock toasts off the lock path)
+    - keyboard library's hook thread: Runs our hotkey and hook callbacks;
+      the pressed events cleaner only arms a one-shot Timer from it
 
     WHY daemon threads: They automatically terminate when main thread exits,
     ensuring clean shutdown without hanging processes.
 
+    WHY no hotkey listener thread: keyboard.hook() does not block, and the
+    hotkey hook stays installed without a thread of ours waiting around.
+
 See also:
     - overlay_window.py: Tkinter fullscreen overlay implementation
     - tray_icon.py: System tray menu and icon
@@ -36,38 +40,25 @@ See also:
 """
 
 import threading
-import time
-from queue import Queue
 
 import keyboard
 
 from src.config.config import Config
 from src.keyboard_controller.hotkey_listener import HotkeyListener
 from src.keyboard_controller.pressed_events_handler import clear_pressed_events
-from src.os_controller.notifications import send_notification_in_thread
+from src.os_controller.notifications import send_notification_in_thread, start_notification_worker
 from src.os_controller.tray_icon import TrayIcon
 from src.ui.overlay_window import OverlayWindow
+from src.util.hotkey_util import parse_hotkey_keys
 from src.util.lockfile_handler import check_lockfile, remove_lockfile
 
-# Extended virtual key codes that rely on the keyboard library's extended scan code
-# support. Windows assigns brightness and backlight controls to these codes instead
-# of the standard 0-255 scan code range, so we handle them explicitly.
-EXTENDED_SCAN_CODES = (
-    0x100,  # VK_BRIGHTNESS_DOWN
-    0x101,  # VK_BRIGHTNESS_UP
-    0x10A,  # VK_KBD_BRIGHTNESS_CYCLE
-    0x10B,  # VK_KBD_BRIGHTNESS_DOWN
-    0x10C,  # VK_KBD_BRIGHTNESS_UP
-    0x10D,  # VK_KBD_LIGHT_ON_OFF
-    0x10E,  # VK_KBD_LIGHT_BULB
-    0x10F,  # VK_KBD_LIGHT_MAX
-    0x110,  # VK_KBD_LIGHT_MIN
-)
-
 # Always-available emergency unlock hotkey (not user-configurable)
-# to prevent total lockout if the primary hotkey fails. Chosen to reuse
-# modifier keys we already leave available for the primary hotkey.
-EMERGENCY_UNLOCK_HOTKEY = "left ctrl+right ctrl"
+# to prevent total lockout if the primary hotkey fails.
+# WHY not "left ctrl+right ctrl": on Windows the keyboard library reports
+# both Ctrl keys as the same scan code, so that combination can't be told
+# apart from a single Ctrl press. Every key here has its own scan code, and
+# a four-key chord is still out of reach of a wandering paw.
+EMERGENCY_UNLOCK_HOTKEY = "ctrl+alt+shift+u"
 
 
 class PawGateCore:
@@ -75,25 +66,34 @@ class PawGateCore:
     Main application coordinator for PawGate.
 
     This class manages the lifecycle of all components and coordinates
-    communication between threads via queues and shared state.
+    communication between threads via events and shared state.
 
     Attributes:
-        hotkey_thread: Thread running the global hotkey listener
-        show_overlay_queue: Thread-safe queue for hotkey activation signals
+        hotkey_listener: HotkeyListener that owns hotkey registration (and its parse cache)
+        tray_icon: TrayIcon whose blocking open() runs on tray_icon_thread
+        show_overlay_event: threading.Event waking the main loop to show the overlay (or quit)
         config: Configuration manager (loads from ~/.pawgate/config/config.json)
-        root: Tkinter root window (None when not locked)
+        root: Tkinter root window while the overlay is shown (None when not locked)
+        overlay: OverlayWindow built once in start() and reused for every lock
+        locked: True from the moment a lock is requested until unlock_keyboard() runs
         hotkey_lock: Threading lock to prevent race conditions during hotkey changes
-        listen_for_hotkey: Flag to control hotkey listener loop
+        listen_for_hotkey: Flag reporting whether the hotkeys are registered
         program_running: Flag to control main event loop
-        blocked_keys: Set of scan codes currently blocked (for cleanup)
-        changing_hotkey_queue: Queue for coordinating hotkey changes (unused currently)
+        keys_blocked: True while lock_keyboard() has the suppressing hook swallowing keys
+        lock_hook: Remover for the suppressing keyboard hook (installed once in __init__)
         unlock_event: threading.Event signaling that the unlock hotkey was pressed while locked
 
-    WHY we use queues instead of direct method calls:
-        Queues provide thread-safe communication between the hotkey listener
-        thread and the main thread. Direct calls would require careful locking
+    WHY we use events instead of direct method calls:
+        Events provide thread-safe communication between the keyboard
+        library's hook thread (where hotkey callbacks run) and the main thread. Direct calls would require careful locking
         and could cause race conditions with Tkinter (which is not thread-safe).
 
+    WHY an Event instead of a Queue for the overlay signal:
+        The only message is "show the overlay" (plus "wake up and notice
+        program_running is False" at quit). A Queue carried one item per
+        press and needed a drain loop to coalesce them; an Event is a single
+        flag, so repeated signals collapse for free and nothing can pile up.
+
     See also:
         - TrayIcon: System tray interface
         - HotkeyListener: Global hotkey registration
@@ -101,15 +101,6 @@ class PawGateCore:
         - Config: Settings management
     """
 
-    # Modifier keys that have left/right variants - when user specifies "ctrl",
-    # we must unblock both "left ctrl" and "right ctrl" for the hotkey to work
-    MODIFIER_VARIANTS = {
-        'ctrl': ['ctrl', 'left ctrl', 'right ctrl'],
-        'shift': ['shift', 'left shift', 'right shift'],
-        'alt': ['alt', 'left alt', 'right alt'],
-        'windows': ['windows', 'left windows', 'right windows'],
-    }
-
     def __init__(self) -> None:
         """
         Initialize PawGate and start all background threads.
@@ -124,25 +115,27 @@ class PawGateCore:
                       happen if another low-level keyboard hook is active)
         """
         # Threading infrastructure
-        self.hotkey_thread = None
-        self.show_overlay_queue = Queue()  # Signals from hotkey to main thread
+        self.show_overlay_event = threading.Event()  # Signals from hotkey to main thread
 
         # Configuration and state
         self.config = Config()  # Loads from ~/.pawgate/config/config.json
-        self.root = None  # Tkinter window (created on-demand when locking)
+        self.root = None  # Tkinter window while shown (the overlay keeps it between locks)
+        self.overlay = None  # Created on the main thread in start()
+        self.locked = False  # Toggle state for the hotkey (guarded by hotkey_lock)
 
         # Hotkey management
-        self.hotkey_lock = threading.Lock()  # Prevents race conditions when changing hotkeys
-        self.listen_for_hotkey = True  # Flag to control hotkey listener loop
+        self.hotkey_lock = threading.Lock()  # Guards hotkey changes and the locked flag
+        self.listen_for_hotkey = True  # Flag reporting whether the hotkeys are registered
 
         # Application lifecycle
         self.program_running = True  # Controls main event loop
 
-        # Keyboard blocking state
-        self.blocked_keys = set()  # Track which scan codes are blocked (for cleanup)
+        # Keyboard blocking state (flipped by lock/unlock_keyboard)
+        self.keys_blocked = False
 
-        # Unused queue - left for future hotkey change feature
-        self.changing_hotkey_queue = Queue()
+        # (hotkey, result) caches for the unlock hotkey keys and scan codes
+        self._hotkey_keys_cache = None
+        self._hotkey_scan_codes_cache = None
 
         # Track unlock requests triggered by the hotkey while locked
         self.unlock_event = threading.Event()
@@ -150,208 +143,178 @@ class PawGateCore:
         # Hard-coded failsafe so users can always unlock
         self.emergency_hotkey = EMERGENCY_UNLOCK_HOTKEY
 
-        # Start background threads (order matters - hotkey before tray)
-        # WHY order matters: Tray icon menu callbacks reference hotkey state,
-        # so hotkey listener should be initialized first
-        self.start_hotkey_listener()
-
-        # Start the keyboard library bug workaround thread
-        # See pressed_events_handler.py for details on the bug
-        self.clear_pressed_events_thread = threading.Thread(
-            target=clear_pressed_events,
-            daemon=True,
-        )
-        self.clear_pressed_events_thread.start()
-
-        # Start system tray icon (runs in its own thread with pystray event loop)
+        # Start system tray icon first (runs in its own thread with pystray event loop)
+        # WHY first: the tray icon is the user's "PawGate is running" signal,
+        # so it shouldn't wait on keyboard hooks and hotkey parsing. Its menu
+        # only uses config, the queue and hotkey_lock, which all exist by now.
+        # WHY target=open directly: TrayIcon.open() blocks in pystray's
+        # Icon.run() until quit_program() stops it, so the thread needs no
+        # wrapper method. pystray's loop conflicts with Tkinter's, which is why
+        # it can't share the main thread.
+        self.tray_icon = TrayIcon(main=self)
         self.tray_icon_thread = threading.Thread(
-            target=self.create_tray_icon,
+            target=self.tray_icon.open,
             daemon=True,
+            name='pawgate-tray',  # Named so py-spy/threading.enumerate() can attribute it
         )
         self.tray_icon_thread.start()
 
-    def create_tray_icon(self) -> None:
-        """
-        Create and run the system tray icon.
+        # Install the suppressing hook once for the app's lifetime; locking
+        # and unlocking only flip keys_blocked (see lock_keyboard())
+        self.lock_hook = keyboard.hook(self._allow_unlock_keys_only, suppress=True)
 
-        This method is executed in a daemon thread and blocks until the
-        icon is stopped (via quit_program).
+        # Register the hotkeys (after the lock hook, so it sees events first)
+        self.start_hotkey_listener()
 
-        WHY in a separate thread: pystray.Icon.run() is blocking and runs
-        its own event loop. We need the main thread free for the Tkinter
-        event loop when the overlay is shown.
+        # Start the notification worker now so locking only has to queue a request
+        start_notification_worker()
 
-        See also: tray_icon.py for menu implementation
-        """
-        TrayIcon(main=self).open()
+        # Start the keyboard library bug workaround (event-driven, no thread)
+        # See pressed_events_handler.py for details on the bug
+        self.pressed_events_cleaner = clear_pressed_events()
 
     def start_hotkey_listener(self) -> None:
         """
-        Initialize and start the global hotkey listener thread.
+        Create the HotkeyListener and register the global hotkeys.
 
-        Delegates to HotkeyListener class which manages the keyboard
-        library's add_hotkey functionality.
+        Delegates to HotkeyListener class, which matches the hotkeys in a
+        keyboard library hook.
 
-        WHY separate class: Hotkey management has complex lifecycle
-        requirements (stopping, restarting, cleanup) that deserve
-        their own encapsulation.
+        WHY separate class: Hotkey management has lifecycle requirements
+        (unregistering, re-registering, cleanup) that deserve their own
+        encapsulation.
 
         See also: hotkey_listener.py
         """
-        HotkeyListener(self).start_hotkey_listener_thread()
-
-    def _parse_hotkey_keys(self, hotkey: str) -> list[str]:
-        """Return all key names (with modifier variants) for a given hotkey string."""
-        hotkey_keys: list[str] = []
-        for key in hotkey.lower().split('+'):
-            key = key.strip()
-            if key in self.MODIFIER_VARIANTS:
-                hotkey_keys.extend(self.MODIFIER_VARIANTS[key])
-            else:
-                hotkey_keys.append(key)
-        return hotkey_keys
-
-    def _get_hotkey_keys(self) -> list[str]:
-        """Return keys for the user-configured hotkey (legacy helper used by tests)."""
-        return self._parse_hotkey_keys(self.config.hotkey)
-
-    def _get_all_unlock_hotkey_keys(self) -> list[str]:
-        """Return a de-duplicated list of keys for primary and emergency hotkeys."""
-        all_keys = self._parse_hotkey_keys(self.config.hotkey)
-        if self.emergency_hotkey:
-            all_keys.extend(self._parse_hotkey_keys(self.emergency_hotkey))
-        # Preserve order while removing duplicates
-        return list(dict.fromkeys(all_keys))
-
-    def _get_hotkey_scan_codes(self) -> set[int]:
-        """Return the scan codes for the configured hotkey (including modifier variants)."""
-        scan_codes: set[int] = set()
-        for key_name in self._get_all_unlock_hotkey_keys():
-            try:
-                for code in keyboard.key_to_scan_codes(key_name):
-                    scan_codes.add(code)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # If keyboard cannot resolve a key name on this layout, skip it.
-                continue
-        return scan_codes
+        # WHY keep the instance: it caches the compiled hotkey across re-registrations
+        self.hotkey_listener = HotkeyListener(self)
+        self.hotkey_listener.register_hotkeys()
 
-    def lock_keyboard(self) -> None:
+    def _get_hotkey_keys(self) -> tuple[str, ...]:
+        """Return keys for the user-configured hotkey (pre-parsed by Config)."""
+        return self.config.hotkey_keys
+
+    def _get_all_unlock_hotkey_keys(self) -> tuple[str, ...]:
+        """
+        Return de-duplicated keys for primary and emergency hotkeys.
+
+        WHY cached: The result only changes when the hotkey does, so it is
+        computed once per hotkey string instead of on every lock. The cache
+        is keyed by config.hotkey, so a hotkey change invalidates it without
+        any extra bookkeeping.
+        """
+        hotkey = self.config.hotkey
+        if self._hotkey_keys_cache is None or self._hotkey_keys_cache[0] != hotkey:
+            all_keys = list(self.config.hotkey_keys)
+            if self.emergency_hotkey:
+                all_keys.extend(parse_hotkey_keys(self.emergency_hotkey))
+            # Preserve order while removing duplicates
+            self._hotkey_keys_cache = (hotkey, tuple(dict.fromkeys(all_keys)))
+        return self._hotkey_keys_cache[1]
+
+    def _get_hotkey_scan_codes(self) -> frozenset[int]:
         """
-        Block ALL keyboard input using comprehensive scan code blocking.
+        Return the scan codes for the configured hotkey (including modifier variants).
 
-        This method implements defense-in-depth keyboard blocking:
-        1. Block scan codes 0-255 (covers nearly all physical keys)
-        2. Block critical keys by name as a fallback
+        Cached per hotkey string like _get_all_unlock_hotkey_keys(), so
+        keyboard.key_to_scan_codes() runs once per hotkey change rather than
+        once per key on every lock.
+        """
+        hotkey = self.config.hotkey
+        if self._hotkey_scan_codes_cache is None or self._hotkey_scan_codes_cache[0] != hotkey:
+            scan_codes: set[int] = set()
+            for key_name in self._get_all_unlock_hotkey_keys():
+                try:
+                    for code in keyboard.key_to_scan_codes(key_name):
+                        scan_codes.add(code)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # If keyboard cannot resolve a key name on this layout, skip it.
+                    continue
+            self._hotkey_scan_codes_cache = (hotkey, frozenset(scan_codes))
+        return self._hotkey_scan_codes_cache[1]
+
+    def _allow_unlock_keys_only(self, event) -> bool:
+        """
+        Suppressing hook callback: while locked, let only the unlock hotkey's keys through.
+
+        Runs on the keyboard library's hook thread for every key event.
+        While unlocked it passes everything after a single attribute check.
+        While locked, returning False swallows the event before it reaches the
+        OS, the library's pressed-key table or any hotkey; returning True lets
+        the hotkey's keys continue to HotkeyListener's hook so the user can unlock.
+
+        WHY report swallowed key-ups to the listener:
+            The library stops at the first hook that returns False, so
+            HotkeyListener never sees them. A modifier held when the lock
+            started and released during it would otherwise stay "held" in
+            the listener and stop the hotkey matching after unlock.
+        """
+        if not self.keys_blocked:
+            return True
+        if event.scan_code in self._get_hotkey_scan_codes():
+            return True
+        if event.event_type == keyboard.KEY_UP:
+            self.hotkey_listener.release_key(event.scan_code)
+        return False
 
-        WHY block by scan code first:
+    def lock_keyboard(self) -> None:
+        """
+        Block ALL keyboard input except the keys of the unlock hotkeys.
+
+        A single suppressing hook (keyboard.hook(..., suppress=True)) is
+        installed once in __init__; locking just sets keys_blocked. While it
+        is set the hook accepts an event only if its scan code belongs to the
+        configured or emergency unlock hotkey, so everything else - letters,
+        F-keys, Windows key, media and brightness keys, regional keys - is
+        swallowed.
+
+        WHY one hook instead of keyboard.block_key() per scan code:
+            The keyboard library already runs one low-level Windows hook and
+            dispatches to Python callbacks from it. block_key() only added a
+            per-key entry to that dispatch, so locking cost ~265 library calls
+            (plus the same again to unlock) and needed a blocked_keys set for
+            cleanup. A blocking hook is consulted first for every event, so
+            one callback with a set lookup covers every key, including scan
+            codes we never enumerated, and lock/unlock are O(1).
+
+        WHY install the hook once instead of per lock:
+            Adding and removing a blocking hook mutates the library's hook
+            list while its thread may be iterating it. A permanent hook with
+            a flag makes lock/unlock a single attribute write, and while
+            unlocked the hook costs one attribute check per key event.
+
+        WHY by scan code:
             Scan codes are hardware-level identifiers that work across
             all keyboard layouts (QWERTY, AZERTY, Dvorak, international).
-            Blocking by name is layout-dependent and can miss keys.
-
-        WHY block critical keys by name too:
-            Some special keys (Windows key, media keys) may not respond
-            to scan code blocking on all hardware. Redundancy ensures
-            that mischievous cats can't Win+D to minimize windows or
-            Alt+F4 to close applications.
-
-        WHY range 0-255:
-            PS/2 scan codes and USB HID scan codes both fit in this range.
-            This covers:
-            - Standard keys (A-Z, 0-9, punctuation)
-            - Function keys (F1-F24)
-            - Numpad keys
-            - Multimedia keys (volume, play/pause, etc.)
-            - Regional keys (international keyboards)
-
-        The blocked_keys set tracks which codes were successfully blocked
-        so unlock_keyboard can clean up properly.
+            The allowed set is resolved from the hotkey names once per hotkey
+            change (see _get_hotkey_scan_codes()).
+
+        WHY not a raw ctypes SetWindowsHookExW hook:
+            A second WH_KEYBOARD_LL hook would need its own message loop and
+            would race with the keyboard library's hook, which still has to
+            see the hotkey to unlock. Suppressing inside the library's hook
+            gives the same single-hook behaviour without that coordination.
 
         See also:
             - unlock_keyboard(): Cleanup counterpart
             - overlay_window.py: Visual indication of locked state
             - notifications.py: User notification when locked
         """
-        self.blocked_keys.clear()
-
-        # Determine scan codes used by the unlock hotkey so we do NOT block them.
-        hotkey_scan_codes = self._get_hotkey_scan_codes()
-
-        # Block full scan code range (0-255) to cover all keyboards including
-        # multimedia keys, F13-F24, and regional/international layouts
-        for i in range(256):
-            if i in hotkey_scan_codes:
-                # Skip blocking the unlock hotkey scan codes so the hotkey still works.
-                continue
-            try:
-                keyboard.block_key(i)
-                self.blocked_keys.add(i)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # WHY silent exception: Some scan codes don't map to physical keys
-                # on all hardware (e.g., scan code 255 may be unmapped). This is
-                # expected and not an error - we just skip those codes.
-                pass
-
-        # Block extended scan codes that Windows uses for brightness/backlight controls.
-        # These live outside the 0-255 range and need explicit handling.
-        for extended_code in EXTENDED_SCAN_CODES:
-            if extended_code in hotkey_scan_codes:
-                continue
-            try:
-                keyboard.block_key(extended_code)
-                self.blocked_keys.add(extended_code)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # WHY silent exception: Not all hardware exposes every brightness code.
-                pass
-
-        # Also block critical keys by name for reliability
-        # WHY this list: These are the most dangerous keys for cats to press
-        # - Windows key: Brings up Start menu or shortcuts (Win+D, Win+L, etc.)
-        # - Media keys: Can disrupt music/videos in other windows
-        # - Brightness: Can make screen unusable
-        critical_keys = [
-            'windows', 'left windows', 'right windows',
-            'volume up', 'volume down', 'volume mute',
-            'play/pause media', 'next track', 'previous track',
-            'brightness up', 'brightness down',
-        ]
-        for key_name in critical_keys:
-            try:
-                keyboard.block_key(key_name)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # WHY silent exception: Not all keyboards have these keys
-                # (e.g., desktop keyboards often lack brightness controls)
-                pass
-
-        # CRITICAL: Unblock the hotkey keys so user can unlock!
-        # WHY this is necessary:
-        #     We just blocked ALL keys (scan codes 0-255), which includes the
-        #     keys needed for the unlock hotkey (e.g., Ctrl and B). Without this,
-        #     the user would be locked out with no way to unlock except rebooting.
-        #     By unblocking just the hotkey keys, the unlock hotkey works while
-        #     all other keys remain blocked.
-        # WHY unblock by name:
-        #     The keyboard library's add_hotkey() matches by key name, so we
-        #     unblock by name to ensure consistency. The suppress=True in
-        #     add_hotkey() prevents these keys from reaching other applications
-        #     when pressed as part of the hotkey combination.
-        for key_name in self._get_all_unlock_hotkey_keys():
-            try:
-                keyboard.unblock_key(key_name)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # WHY silent exception: Some key names may not be recognized
-                # on all keyboard layouts, but we try our best
-                pass
+        # Warm the allowed scan code cache before the hook starts consulting it
+        self._get_hotkey_scan_codes()
+
+        self.keys_blocked = True
 
         # Notify user that keyboard is locked (if notifications enabled)
-        send_notification_in_thread(self.config.notifications_enabled)
+        send_notification_in_thread(self.config.notifications_enabled, self.config.hotkey)
 
     def unlock_keyboard(self, _event=None) -> None:
         """
         Unblock all keyboard input and close the overlay window.
 
-        This is the cleanup counterpart to lock_keyboard(). It unblocks
-        all scan codes that were successfully blocked, closes the Tkinter
-        overlay, and calls keyboard.stash_state() to clear internal state.
+        This is the cleanup counterpart to lock_keyboard(). It stops the
+        suppressing hook from swallowing keys, closes the Tkinter overlay, and calls
+        keyboard.stash_state() to clear internal state.
 
         Args:
             event: Optional Tkinter event object (unused).
@@ -366,16 +329,19 @@ class PawGateCore:
 
         See also:
             - lock_keyboard(): Blocking counterpart
-            - overlay_window.py: Polls unlock_event to call this method
+            - overlay_window.py: Calls this from its <<Unlock>> handler
         """
-        # Unblock all scan codes that were successfully blocked
-        for key in self.blocked_keys:
-            keyboard.unblock_key(key)
-        self.blocked_keys.clear()
-
-        # Close the Tkinter overlay window if it's open
+        # Let keys through again; the hook itself stays installed
+        # WHY not keyboard.unhook_all(): it would also drop the hotkeys and
+        # the pressed-events cleaner hook
+        self.keys_blocked = False
+
+        # Hide the Tkinter overlay window if it's shown
+        # WHY withdraw + quit instead of destroy: the window is reused for the
+        # next lock (see OverlayWindow); quit() just ends its mainloop
         if self.root:
-            self.root.destroy()  # Exits the Tkinter mainloop
+            self.root.withdraw()
+            self.root.quit()  # Exits the Tkinter mainloop
             self.root = None  # Mark overlay as closed for future hotkey presses
 
         # Clear keyboard library's internal state to prevent phantom key presses
@@ -384,29 +350,48 @@ class PawGateCore:
         keyboard.stash_state()
 
         # Reset unlock event for the next lock cycle
-        self.unlock_event.clear()
+        # WHY under hotkey_lock: send_hotkey_signal() reads locked under the
+        # same lock, so a press can't see "locked" and then have its unlock
+        # request wiped by this clear()
+        with self.hotkey_lock:
+            self.locked = False
+            self.unlock_event.clear()
 
     def send_hotkey_signal(self) -> None:
         """
         Signal the main thread that the hotkey was pressed.
 
-        This method is called from the hotkey listener thread when the
-        user presses the configured hotkey (default: Ctrl+B).
+        This method is called from the keyboard library's hook thread when
+        the user presses the configured hotkey (default: Ctrl+B).
 
-        WHY mixed signalling: The hotkey listener runs in a separate thread,
+        WHY mixed signalling: Hotkey callbacks run on a separate thread,
         but Tkinter is not thread-safe. When the hotkey is pressed while
-        unlocked, we use a queue to ask the main thread to display the overlay.
-        When pressed while locked, we set unlock_event so the overlay thread
-        can safely schedule the unlock from within Tkinter's mainloop.
+        unlocked, we set show_overlay_event to ask the main thread to display the overlay.
+        When pressed while locked, we set unlock_event and ask the overlay to
+        wake its mainloop, which performs the unlock on the Tkinter thread.
+
+        WHY a locked flag instead of checking self.root:
+            root is only assigned once the main thread has built the overlay,
+            and cleared by unlock_keyboard() on another thread. Reading it here
+            was a check-then-act race: a second press before the overlay
+            appeared was routed as another "lock" instead of an unlock. The
+            flag flips as soon as the lock is requested, and both the check
+            and the flip happen under hotkey_lock.
 
         See also:
-            - start(): Main event loop that monitors this queue
+            - start(): Main event loop that waits on show_overlay_event
             - hotkey_listener.py: Calls this method when hotkey pressed
         """
-        if self.root:
+        with self.hotkey_lock:
+            if not self.locked:
+                self.locked = True
+                self.show_overlay_event.set()
+                return
             self.unlock_event.set()
-        else:
-            self.show_overlay_queue.put("lock")
+
+        # WHY outside hotkey_lock: the Tk thread's unlock handler takes it
+        if self.overlay is not None:
+            self.overlay.request_unlock()
 
     def quit_program(self, icon, _item) -> None:
         """
@@ -419,21 +404,26 @@ class PawGateCore:
             item: pystray.MenuItem instance (required for menu callback signature)
 
         Cleanup order:
-            1. Remove lockfile (allows new instance to start)
+            1. Release the single-instance lock (allows new instance to start)
             2. Set program_running flag to False (stops main event loop)
             3. Unlock keyboard if currently locked
-            4. Stop the tray icon (exits pystray event loop)
+            4. Save any settings change still waiting on the tray's debounce
+            5. Stop the tray icon (exits pystray event loop)
 
-        WHY this order: We want to remove the lockfile first so a new instance
-        can start immediately. Then we stop our own event loops (main and tray).
+        WHY this order: We release the lock first so a new instance can
+        start immediately. It only closes a file handle, so it can't fail and
+        stop the rest of Quit from running. Then we stop our own event loops
+        (main and tray).
 
         See also:
             - lockfile_handler.py: Single-instance enforcement
             - tray_icon.py: Menu item binding
         """
-        remove_lockfile()  # Allow new instance to start
+        remove_lockfile()  # Release the lock so a new instance can start
         self.program_running = False  # Stop main event loop
+        self.show_overlay_event.set()  # Wake the main loop's blocking wait()
         self.unlock_keyboard()  # Clean up keyboard blocks if active
+        self.tray_icon.flush_config()  # Don't lose a just-clicked setting
         icon.stop()  # Stop pystray event loop (exits tray thread)
 
     def start(self) -> None:
@@ -445,73 +435,85 @@ class PawGateCore:
 
         Event loop behavior:
             1. Check lockfile (enforce single instance)
-            2. Apply keyboard workaround (right Ctrl sticking issue)
-            3. Loop forever:
-               - Check queue for hotkey signals
-               - If signal received, create and show overlay
-               - Sleep briefly to avoid busy-waiting
-
-        WHY the right Ctrl remap:
-            The keyboard library has a bug on some systems where right Ctrl
-            can get "stuck" in a pressed state after blocking/unblocking.
-            Remapping it to left Ctrl works around this issue. Since most
-            users never use right Ctrl separately, this is an acceptable tradeoff.
-
-            See: https://github.com/boppreh/keyboard/issues/[various]
-
-        WHY sleep(0.1):
-            Without the sleep, this loop would spin at 100% CPU checking an
-            empty queue. The 0.1 second delay (100ms) is imperceptible to users
-            but prevents unnecessary CPU usage. Hotkey presses are queued, so
-            we won't miss any signals during the sleep.
-
-        WHY stash_state after overlay creation:
-            The overlay window creation can trigger Tkinter focus events that
-            interact poorly with the keyboard library's internal state. Calling
-            stash_state() after overlay creation prevents issues with phantom
-            key presses when the overlay appears.
+            2. Loop forever:
+               - Block on show_overlay_event until it is set
+               - Clear it, then stop if quit_program() set it
+               - Otherwise show the (reused) overlay
+
+        WHY no right Ctrl remap:
+            Earlier versions called keyboard.remap_key('right ctrl', 'left ctrl')
+            here because right Ctrl could "stick" after block_key()/unblock_key().
+            The remap was a permanent global hook running Python for every
+            keystroke system-wide. Locking now suppresses events in a single
+            hook without touching per-key block state, and the stale-key
+            cleaner (pressed_events_handler.py) drops anything left pressed.
+
+        WHY a blocking wait() instead of polling:
+            Polling a queue with a sleep woke the main thread 10 times a
+            second for the app's entire lifetime. wait() sleeps on the event's
+            condition variable and wakes only when it is set - no timeout, so
+            an idle PawGate never wakes the main thread at all.
+            quit_program() clears program_running and then sets the event,
+            which is the only way out of the loop besides program_running
+            turning False after an overlay.
+
+        WHY clear() before checking program_running:
+            Signals set while the overlay is showing collapse into the one
+            flag, so mashing the hotkey can't queue up extra overlays. A
+            second lock can't be requested until unlock_keyboard() runs
+            inside overlay.open(), so clearing never drops a real request,
+            and a quit is still seen because program_running is read after
+            the clear.
+
+        WHY no stash_state before showing the overlay:
+            This loop used to call keyboard.stash_state() before every
+            overlay.open(). It walks the library's pressed-key table and
+            releases each key, on the lock path. While locked, the
+            suppressing hook keeps new presses out of that table, and
+            unlock_keyboard() stashes once on the way out, which is where
+            stuck keys would actually show up.
+
+        WHY one OverlayWindow for the whole run:
+            Building a Tk root per lock re-initializes Tcl/Tk each time. The
+            overlay is created here, on the main thread (Tk is not thread-safe),
+            and hidden rather than destroyed between locks.
 
         See also:
-            - send_hotkey_signal(): Puts signals in the queue
+            - send_hotkey_signal(): Sets show_overlay_event
             - overlay_window.py: Creates and displays the blocking window
             - lockfile_handler.py: Single-instance enforcement
         """
         # Enforce single instance - terminates old instance if found
         check_lockfile()
 
-        # Workaround for keyboard library bug: right Ctrl can stick
-        # WHY remap works: Makes both Ctrl keys behave identically,
-        # avoiding the stateful tracking bug in right Ctrl handling
-        keyboard.remap_key('right ctrl', 'left ctrl')
+        # One overlay for the app's lifetime; Tk must live on this (main) thread
+        self.overlay = OverlayWindow(main=self)
 
         # Main event loop - runs until quit_program sets program_running = False
         while self.program_running:
-            # Check if hotkey was pressed (signal in queue)
-            if not self.show_overlay_queue.empty():
-                signal = self.show_overlay_queue.get(block=False)
-
-                if signal == "lock":
-                    # Reset unlock requests before displaying overlay
-                    self.unlock_event.clear()
+            # Wait for a hotkey signal (sleeps until the event is set)
+            self.show_overlay_event.wait()
+            self.show_overlay_event.clear()
 
-                    # Create and show the overlay (blocks until hotkey unlocks)
-                    overlay = OverlayWindow(main=self)
+            if not self.program_running:
+                break
 
-                    # Clear keyboard library state before showing overlay
-                    # WHY: Prevents keys pressed during overlay creation from appearing stuck
-                    keyboard.stash_state()
+            # WHY no unlock_event.clear() here: unlock_event is only set
+            # while locked, so anything set now is a real unlock request
+            # made before the overlay appeared and must not be dropped
 
-                    # This blocks until unlock_event fires (Tkinter mainloop)
-                    overlay.open()
+            # Show the overlay; blocks until unlock_event fires (Tkinter mainloop)
+            self.overlay.open()
 
-            # Sleep briefly to avoid busy-waiting (100ms is imperceptible)
-            time.sleep(.1)
+        # Tear the Tk window down on the thread that created it
+        self.overlay.close()
 
 
 if __name__ == "__main__":
     # Entry point: Create the PawGate core and run the main event loop
     # WHY separate __init__ and start(): Initialization starts daemon threads
-    # (tray icon, hotkey listener) but start() runs the blocking event loop.
+    # and registers hotkeys (tray icon, notifications) but start() runs the
+    # blocking event loop.
     # This separation allows for testing and alternate entry points.
     core = PawGateCore()
     core.start()
@@ -7,7 +7,8 @@ to inform users that the keyboard has been locked.
 Notification strategy:
     - Appears in Windows Action Center (bottom-right on most systems)
     - Shows PawGate icon for brand recognition
-    - Brief message: "Keyboard Locked - Press Ctrl+B to unlock"
+    - Brief message: "Keyboard Locked - Press <hotkey> to unlock", built
+      from the configured hotkey (e.g. "Press Ctrl+L to unlock")
     - Auto-dismisses after 3 seconds (doesn't clutter Action Center)
 
 WHY plyer library:
@@ -16,11 +17,11 @@ WHY plyer library:
     - Works on Windows 10/11 without complex Win32 API calls
     - No native dependencies
 
-WHY in a thread:
+WHY a single worker thread:
     Notification display can be slow (100-500ms) due to Windows API calls.
-    Running in a thread prevents blocking the main application while the
-    notification appears. The thread joins immediately to ensure the
-    notification completes before continuing.
+    One long-lived daemon worker, started at app startup, displays queued
+    notifications. Locking only puts a request on its queue, so neither the
+    notification nor thread creation sits on the lock path.
 
 WHY timeout=3:
     Notifications that stay too long clutter the Action Center. 3 seconds
@@ -41,97 +42,235 @@ See also:
     - path_util.py: get_packaged_path for PyInstaller bundled icon
 """
 
+import functools
 import os
 import threading
-import time
-
-import plyer
+from pathlib import Path
+from queue import Queue
+from xml.sax.saxutils import escape, quoteattr
 
 from src.util.path_util import get_packaged_path
 
+# Optional direct WinRT toasts (pip install winsdk); plyer is the fallback
+# WHY optional: winsdk is Windows-only and not needed for PawGate to work.
+# When it's importable we skip plyer, which builds a hidden window and a
+# temporary tray icon on every call.
+try:
+    from winsdk.windows.data.xml.dom import XmlDocument
+    from winsdk.windows.ui.notifications import (
+        NotificationSetting,
+        ToastNotification,
+        ToastNotificationManager,
+    )
+except ImportError:
+    ToastNotificationManager = None
+
+# Icon shown in the toast, resolved once at import
+# WHY module-level: the bundled path can't change while the process runs,
+# so there is no reason to re-join and re-resolve it on every notification
+_ICON_PATH = get_packaged_path(os.path.join("resources", "img", "icon.ico"))
+
+# Application ID the WinRT toasts are attributed to
+# WHY this can fail: Windows only shows toasts for an AppUserModelID that a
+# Start-menu shortcut (or installer) registered. Without one, show() succeeds
+# and nothing appears, so _get_toast_notifier() checks before we rely on it.
+_TOAST_APP_ID = "PawGate"
+
+# Toast content, matching the plyer notification below
+# WHY icon.png: WinRT toast images must be PNG/JPEG/GIF, not .ico
+_TOAST_XML = (
+    '<toast><visual><binding template="ToastGeneric">'
+    '<text>Keyboard Locked</text>'
+    '<text>{message}</text>'
+    '<image placement="appLogoOverride" src={icon}/>'
+    '</binding></visual></toast>'
+)
+_TOAST_ICON_URI = quoteattr(
+    Path(get_packaged_path(os.path.join("resources", "img", "icon.png"))).absolute().as_uri()
+)
+
+# WinRT toast notifier, created on the first successful use (worker thread only)
+_toast_notifier = None
+
+# Requests for the notification worker (one unlock hotkey per notification)
+_notification_queue = Queue()
+_worker_thread = None
+_worker_lock = threading.Lock()
+
+
+def _unlock_message(hotkey: str) -> str:
+    """
+    Build the notification body for the configured hotkey.
+
+    WHY from config: the hotkey is user-configurable, so a fixed
+    "Press Ctrl+B" would tell users the wrong keys to press.
+    str.title() turns "ctrl+shift+l" into "Ctrl+Shift+L".
+    """
+    return f"Press {hotkey.title()} to unlock"
+
+
+def _get_toast_notifier():
+    """
+    Return the WinRT toast notifier, or None if it can't show toasts right now.
+
+    WHY check notifier.setting: for an unregistered app ID Windows drops the
+    toast without raising, so the only way to notice is to ask up front.
+    Reading the setting raises OSError when the app ID isn't registered, and
+    returns a DISABLED_* value when the user or policy turned toasts off. In
+    both cases returning None sends this notification through plyer.
+
+    WHY only the notifier is kept, not the verdict:
+        The setting can change while PawGate runs (the user re-enables
+        notifications, or a shortcut registers the app ID), so it is asked
+        again on every lock, and one failure never disables toasts for good.
+        That is one property read per lock.
+
+    WHY lazily on first use (not at import): the only caller is the
+    notification worker thread, so the WinRT objects are created on the
+    thread that uses them, and importing this module stays cheap.
+    """
+    global _toast_notifier
+    try:
+        if _toast_notifier is None:
+            _toast_notifier = ToastNotificationManager.create_toast_notifier(_TOAST_APP_ID)
+        if _toast_notifier.setting != NotificationSetting.ENABLED:
+            return None
+    except OSError:
+        return None
+    return _toast_notifier
+
+
+@functools.lru_cache(maxsize=1)
+def _get_toast_xml(message: str):
+    """
+    Parse the toast XML for a message, reusing it until the message changes.
+
+    WHY keyed on the message: the hotkey only changes when the user picks a
+    new one, so consecutive locks reuse the same parsed document.
+    """
+    xml = XmlDocument()
+    xml.load_xml(_TOAST_XML.format(message=escape(message), icon=_TOAST_ICON_URI))
+    return xml
 
-def send_lock_notification() -> None:
+
+def send_lock_notification(hotkey: str) -> None:
     """
     Display a Windows toast notification that keyboard is locked.
 
+    Args:
+        hotkey: The configured lock/unlock hotkey (e.g. "ctrl+l")
+
     This shows a system notification with:
     - App name: "PawGate"
     - Title: "Keyboard Locked"
-    - Message: "Press Ctrl+B to unlock"
+    - Message: "Press <hotkey> to unlock" (see _unlock_message())
     - Icon: PawGate icon (for brand recognition)
     - Timeout: 3 seconds (auto-dismiss)
 
-    WHY brief sleep after notify:
-        The plyer.notification.notify() call returns immediately, but the
-        actual notification display happens asynchronously in Windows.
-        A brief sleep (100ms) gives Windows time to process the notification
-        request before this thread exits. Without it, rapid thread termination
-        could sometimes cancel the notification before it appears.
+    WHY no sleep after notify:
+        Notifications used to run on a short-lived thread, and a 100ms sleep
+        kept that thread alive long enough for Windows to pick up the
+        request. They now run on the long-lived worker thread, which never
+        exits after notifying, so the sleep only delayed the next request.
 
     Edge cases:
         - Icon file missing: Notification shows without icon (not critical)
         - Windows notifications disabled: plyer fails silently (user choice)
         - Action Center full: Windows handles (oldest notifications removed)
 
+    WHY WinRT first:
+        With winsdk installed, showing a toast is one call on a notifier and
+        XML template built once (see _get_toast_xml()). plyer stays the
+        fallback so the app works without winsdk, and also takes over when
+        Windows won't show toasts for our app ID or show() raises.
+
     See also:
         - send_notification_in_thread(): Wrapper that checks if enabled
     """
-    # Build path to icon file in bundled resources
-    path = os.path.join("resources", "img", "icon.ico")
+    message = _unlock_message(hotkey)
+
+    if ToastNotificationManager is not None:
+        notifier = _get_toast_notifier()
+        if notifier is not None:
+            try:
+                notifier.show(ToastNotification(_get_toast_xml(message)))
+                return
+            except OSError:
+                pass  # Fall through to plyer rather than lose the notification
+
+    # WHY import here: plyer is only the fallback, and importing it pulls in
+    # its platform facades; startup (and WinRT users) never pay for it.
+    # The first fallback notification imports it, later ones hit sys.modules.
+    from plyer import notification  # pylint: disable=import-outside-toplevel
 
     # Send Windows toast notification
     # WHY .ico file: Windows notifications prefer .ico format for consistency
-    plyer.notification.notify(
+    notification.notify(
         app_name="PawGate",  # Shows in notification header
         title="Keyboard Locked",  # Bold text in notification
-        message="Press Ctrl+B to unlock",  # Body text with unlock instructions
-        app_icon=get_packaged_path(path),  # PawGate icon for branding
+        message=message,  # Body text with unlock instructions
+        app_icon=_ICON_PATH,  # PawGate icon for branding
         timeout=3,  # Auto-dismiss after 3 seconds
     )
 
-    # Brief pause to let Windows process notification request
-    # WHY: Prevents thread exit from cancelling notification display
-    time.sleep(.1)
 
+def _notification_worker() -> None:
+    """
+    Display queued notifications one at a time, forever (daemon thread).
 
-def send_notification_in_thread(notifications_enabled: bool) -> None:
+    WHY catch everything: A failure in plyer or the Windows notification
+    API must not kill the worker, or every later lock would silently skip
+    its notification.
     """
-    Send lock notification in a background thread (if notifications enabled).
+    while True:
+        hotkey = _notification_queue.get()
+        try:
+            send_lock_notification(hotkey)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
 
-    Args:
-        notifications_enabled: Whether user has notifications enabled in settings
 
-    WHY in a thread:
-        Notification display can take 100-500ms due to Windows API calls.
-        Threading prevents blocking the main application while the OS
-        processes the notification request.
+def start_notification_worker() -> None:
+    """
+    Start the notification worker thread if it isn't running yet.
+
+    Called from PawGateCore.__init__ so the thread already exists when the
+    first lock happens. Safe to call more than once.
+    """
+    global _worker_thread
+    with _worker_lock:
+        if _worker_thread is None:
+            _worker_thread = threading.Thread(
+                target=_notification_worker, daemon=True, name='pawgate-notify'
+            )
+            _worker_thread.start()
+
 
-    WHY join immediately:
-        Even though we use a thread, we join() before returning. This ensures
-        the notification completes before we continue, which:
-        - Maintains predictable execution order
-        - Prevents race conditions if called rapidly
-        - Ensures notification appears before overlay (good UX)
+def send_notification_in_thread(notifications_enabled: bool, hotkey: str) -> None:
+    """
+    Queue a lock notification for the worker thread (if notifications enabled).
 
-    WHY daemon thread:
-        If the application exits while sending a notification, the daemon
-        thread will terminate automatically without blocking shutdown.
+    Args:
+        notifications_enabled: Whether user has notifications enabled in settings
+        hotkey: The configured hotkey, shown in the "how to unlock" message
+
+    WHY a queue put instead of a new thread:
+        Spawning (and joining) a thread per lock put OS thread creation and
+        the notification's own latency on the lock path, delaying the overlay.
+        put_nowait() on the worker's queue takes microseconds and returns.
 
     Conditional execution:
         Respects user's notification preference (configurable in tray menu).
-        If disabled, this function returns immediately without creating a thread.
+        If disabled, this function returns immediately without queueing.
 
     See also:
         - main.lock_keyboard(): Calls this when keyboard locks
+        - start_notification_worker(): Starts the consumer thread
         - config.py: notifications_enabled setting
         - tray_icon.py: Toggle notifications in menu
     """
     # Only send notification if user has them enabled
     if notifications_enabled:
-        # Create daemon thread to send notification (non-blocking)
-        notification_thread = threading.Thread(target=send_lock_notification, daemon=True)
-        notification_thread.start()
-
-        # Wait for notification to complete (ensures proper sequencing)
-        # WHY join: Guarantees notification appears before continuing
-        notification_thread.join()
+        # WHY start here too: keeps this usable even if startup didn't run it
+        start_notification_worker()
+        _notification_queue.put_nowait(hotkey)
@@ -22,6 +22,11 @@ WHY run in a separate thread:
     Windows messages). Running it in a daemon thread keeps the main thread
     free for the Tkinter event loop and hotkey signal processing.
 
+    WHY no macOS run_detached() branch: AppKit only works on the main
+    thread, and open() runs on the 'pawgate-tray' worker thread, so
+    run_detached() there would not attach the icon to any running loop.
+    A macOS port has to create and run the icon on the main thread instead.
+
 Menu structure:
     - Lock Keyboard (immediate action)
     - Enable/Disable Notifications (toggle with checkmark)
@@ -45,8 +50,8 @@ WHY these opacity options:
     which is disorienting and prevents users from seeing what's protected.
 
 Icon design:
-    We load icon.png and draw on it (for visual variety or animation in
-    future versions). Currently just loads and displays the icon as-is.
+    We load icon.png and display it as-is. Any future decoration (status
+    badge, animation) should be drawn onto the copy made in open().
 
 See also:
     - main.py: Creates TrayIcon instance in daemon thread
@@ -54,14 +59,49 @@ See also:
     - web_browser_util.py: Opens help/about URLs
 """
 
+import functools
 import os
-
-from PIL import Image, ImageDraw
-from pystray import Icon, Menu, MenuItem
+import threading
 
 from src.util.path_util import get_packaged_path
 from src.util.web_browser_util import open_about, open_buy_me_a_coffee, open_help
 
+# Opacity choices offered in the tray menu (see "WHY these opacity options")
+OPACITY_OPTIONS = (0.05, 0.1, 0.3, 0.5, 0.7, 0.9)
+
+# Seconds a settings change waits for further changes before being saved
+_SAVE_DELAY = 0.5
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tray_image():
+    """
+    Load the tray icon image once per process.
+
+    Returns the cached PIL image; callers get a .copy() from TrayIcon.open()
+    because PIL images are mutable.
+
+    WHY cache: decoding the PNG and resolving its bundled path (inside
+    PyInstaller's _MEIPASS) only has to happen once. Recreating the icon
+    later reuses the decoded pixels.
+
+    WHY convert inside a with block: Image.open() is lazy - it keeps the file
+    open and defers the PNG decode until pixels are first touched, which
+    would otherwise happen later inside pystray. convert() decodes now into
+    an in-memory RGBA image, and the with block closes the file as soon as
+    that's done instead of whenever the lazy image is garbage collected.
+
+    WHY no drawing: The icon used to get a placeholder white rectangle via
+    ImageDraw for features that never arrived. Importing ImageDraw only for
+    that cost startup time; decorations can be added when one is real.
+    """
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    # Load icon image from bundled resources
+    path = os.path.join("resources", "img", "icon.png")
+    with Image.open(get_packaged_path(path)) as image:
+        return image.convert("RGBA")
+
 
 class TrayIcon:
     """
@@ -89,6 +129,12 @@ class TrayIcon:
         """
         self.main = main
 
+        # Pending debounced config save (see _schedule_save())
+        # WHY a lock: the timer fires on its own thread while menu clicks
+        # and quit_program() reschedule or flush from the tray thread
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+
     def set_opacity(self, opacity: float) -> None:
         """
         Update overlay opacity setting and persist to disk.
@@ -96,15 +142,18 @@ class TrayIcon:
         Args:
             opacity: New opacity value (0.0-1.0, e.g., 0.3 = 30%)
 
-        WHY immediate save: User expects settings to persist across restarts.
-        If we don't save immediately, changes would be lost on crash or
-        forced termination.
+        WHY debounced save: Users often click through several opacities to
+        find the one they like; each click would otherwise rewrite the config
+        file. The new value takes effect immediately (the overlay reads
+        config.opacity); only the write waits _SAVE_DELAY for the clicks to
+        settle.
 
         See also:
             - config.py: Handles persistence to ~/.pawgate/config/config.json
+            - flush_config(): Writes a pending change immediately
         """
         self.main.config.opacity = opacity
-        self.main.config.save()
+        self._schedule_save()
 
     def toggle_notifications(self) -> None:
         """
@@ -119,34 +168,45 @@ class TrayIcon:
             - notifications.py: Sends Windows toast when keyboard locks
         """
         self.main.config.notifications_enabled = not self.main.config.notifications_enabled
-        self.main.config.save()
+        self._schedule_save()
 
-    def is_opacity_checked(self, opacity: float) -> bool:
+    def _schedule_save(self) -> None:
         """
-        Check if given opacity matches current setting (for menu checkmarks).
-
-        Args:
-            opacity: Opacity value to check (e.g., 0.3)
-
-        Returns:
-            bool: True if this opacity is currently selected
+        Save the config after _SAVE_DELAY, restarting the delay on each call.
 
-        WHY separate method: pystray's checked parameter expects a callable
-        that takes an item parameter. We could use lambda with closures, but
-        this is cleaner and more testable.
+        WHY daemon timer: A pending save must never keep the process alive;
+        the quit path calls flush_config() so a clean exit loses nothing.
+        Only a crash within _SAVE_DELAY of a click can drop that click.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(_SAVE_DELAY, self.flush_config)
+            self._save_timer.daemon = True
+            self._save_timer.name = 'pawgate-configsave'
+            self._save_timer.start()
+
+    def flush_config(self) -> None:
+        """
+        Write any pending settings change to disk now.
 
-        Used by:
-            Menu checkmarks to show which opacity is currently selected.
+        Called by the debounce timer, and by main.quit_program() so a change
+        made just before quitting isn't lost. A no-op when nothing is pending.
         """
-        return self.main.config.opacity == opacity
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+            if timer is None:
+                return
+            timer.cancel()  # Harmless when called from the timer itself
+            self.main.config.save()
 
     def open(self) -> None:
         """
         Create and run the system tray icon (blocks until icon.stop() called).
 
         This method:
-        1. Loads icon image from bundled resources
-        2. Draws on the image (currently just a white rectangle for demo)
+        1. Gets the icon image (decoded once, see _load_tray_image())
+        2. Copies it so the cached image is never handed out
         3. Constructs menu hierarchy with callbacks and checkmarks
         4. Creates pystray.Icon instance
         5. Runs the icon's event loop (blocks until Quit)
@@ -164,10 +224,6 @@ class TrayIcon:
         callables, even though we don't use it. We need to accept it to match
         the signature.
 
-        WHY draw white rectangle: Placeholder for potential future features
-        (status indicator, animation, badge count). Currently just demonstrates
-        programmatic image manipulation.
-
         Edge cases:
             - Icon file missing: Would crash with FileNotFoundError, indicating
               broken installation (should be caught by packaging tests)
@@ -175,17 +231,24 @@ class TrayIcon:
               pystray but wouldn't crash the icon (graceful degradation)
 
         See also:
-            - main.create_tray_icon(): Calls this from daemon thread
+            - main.PawGateCore.__init__(): Runs this as the tray thread target
             - path_util.py: get_packaged_path handles PyInstaller bundling
         """
-        # Load icon image from bundled resources
-        path = os.path.join("resources", "img", "icon.png")
-        image = Image.open(get_packaged_path(path))
-
-        # Draw on the icon (currently just demo white rectangle)
-        # WHY: Placeholder for future features (status badges, animations)
-        draw = ImageDraw.Draw(image)
-        draw.rectangle((16, 16, 48, 48), fill="white")
+        # WHY import here: Pillow and pystray (with its platform backend) are
+        # only needed once the icon is built, and open() runs on the tray
+        # thread. Importing them at module level put that cost on the main
+        # thread's startup path, before the tray thread even existed.
+        # pylint: disable=import-outside-toplevel
+        from pystray import Icon, Menu, MenuItem
+
+        image = _load_tray_image().copy()
+
+        # WHY bind config once: pystray re-evaluates every checked= callable
+        # each time the menu is drawn. Closing over cfg saves the
+        # self.main.config hops (and a method call) per item per repaint.
+        # main.config is created once in PawGateCore.__init__ and never
+        # replaced, so the binding can't go stale.
+        cfg = self.main.config
 
         # Construct menu hierarchy with callbacks and dynamic checkmarks
         menu = Menu(
@@ -197,19 +260,25 @@ class TrayIcon:
             MenuItem(
                 "Enable/Disable Notifications",
                 self.toggle_notifications,
-                checked=lambda item: self.main.config.notifications_enabled,
+                checked=lambda item: cfg.notifications_enabled,
             ),
 
             # Opacity submenu: Checkmarks show currently selected value
+            # WHY v=<value> default: binds each item's value at definition time
+            # (a bare closure over the loop variable would make every item 90%)
+            # WHY keyword-only v in the action: pystray counts positional
+            # parameters to decide what to pass, so `lambda *, v=v` is called
+            # with no arguments. functools.partial has no __code__, so pystray
+            # would call it with (icon, item) and set_opacity() would fail.
             # WHY nested Menu: Cleaner than 6 top-level items
-            MenuItem("Set Opacity", Menu(
-                MenuItem("5%", lambda: self.set_opacity(0.05), checked=lambda item: self.is_opacity_checked(0.05)),
-                MenuItem("10%", lambda: self.set_opacity(0.1), checked=lambda item: self.is_opacity_checked(0.1)),
-                MenuItem("30%", lambda: self.set_opacity(0.3), checked=lambda item: self.is_opacity_checked(0.3)),
-                MenuItem("50%", lambda: self.set_opacity(0.5), checked=lambda item: self.is_opacity_checked(0.5)),
-                MenuItem("70%", lambda: self.set_opacity(0.7), checked=lambda item: self.is_opacity_checked(0.7)),
-                MenuItem("90%", lambda: self.set_opacity(0.9), checked=lambda item: self.is_opacity_checked(0.9)),
-            )),
+            MenuItem("Set Opacity", Menu(*(
+                MenuItem(
+                    f"{round(opacity * 100)}%",
+                    lambda *, v=opacity: self.set_opacity(v),
+                    checked=lambda item, v=opacity: cfg.opacity == v,
+                )
+                for opacity in OPACITY_OPTIONS
+            ))),
 
             # Help submenu: External links to documentation and support
             MenuItem("About", Menu(
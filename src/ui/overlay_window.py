@@ -26,8 +26,8 @@ WHY screeninfo library:
 
 Multi-monitor strategy:
     We create a SINGLE window large enough to cover ALL monitors. The window
-    starts at the minimum X,Y coordinates and extends to cover the maximum
-    width and height. This handles any monitor arrangement (stacked, side-by-side,
+    starts at the minimum X,Y coordinates and extends to the largest right
+    and bottom monitor edges (the bounding box). This handles any monitor arrangement (stacked, side-by-side,
     L-shaped, etc.).
 
 Alternative rejected: Create separate windows per monitor
@@ -41,10 +41,75 @@ See also:
     - notifications.py: Toast notification when overlay appears
 """
 
+import ctypes
+import threading
 import tkinter as tk
 
 from screeninfo import get_monitors
 
+# user32 for the cheap display-change check (None off Windows)
+try:
+    _user32 = ctypes.windll.user32
+except AttributeError:
+    _user32 = None
+
+# GetSystemMetrics indices: SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN,
+# SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN, SM_CMONITORS
+_DISPLAY_METRICS = (76, 77, 78, 79, 80)
+
+# (display signature, overlay geometry) from the last monitor query
+_geometry_cache = None
+
+
+def _display_signature():
+    """
+    Return a cheap fingerprint of the display layout, or None if unavailable.
+
+    WHY GetSystemMetrics: it reads values Windows already keeps current (and
+    updates on WM_DISPLAYCHANGE) without enumerating monitors, so comparing
+    it costs microseconds. Off Windows there is no equivalent, so the caller
+    re-queries every time.
+    """
+    if _user32 is None:
+        return None
+    return tuple(_user32.GetSystemMetrics(index) for index in _DISPLAY_METRICS)
+
+
+def _get_overlay_geometry() -> tuple[int, int, int, int]:
+    """
+    Return (width, height, x, y) for a window covering all monitors.
+
+    Re-enumerates monitors through screeninfo only when the display
+    signature changed since the last call (always, if there is none).
+
+    WHY cache: screeninfo calls into EnumDisplayMonitors (or Xrandr) on
+    every query. Monitors rarely change between locks, so most locks can
+    reuse the last result.
+    """
+    global _geometry_cache
+    signature = _display_signature()
+    if signature is not None and _geometry_cache is not None and _geometry_cache[0] == signature:
+        return _geometry_cache[1]
+
+    # Calculate the true bounding box of all monitors in one pass
+    monitors = get_monitors()
+    first = monitors[0]
+    min_x, min_y = first.x, first.y
+    max_x, max_y = first.x + first.width, first.y + first.height
+    for monitor in monitors:
+        if monitor.x < min_x:
+            min_x = monitor.x
+        if monitor.y < min_y:
+            min_y = monitor.y
+        if monitor.x + monitor.width > max_x:
+            max_x = monitor.x + monitor.width
+        if monitor.y + monitor.height > max_y:
+            max_y = monitor.y + monitor.height
+
+    geometry = (max_x - min_x, max_y - min_y, min_x, min_y)
+    _geometry_cache = (signature, geometry)
+    return geometry
+
 
 class OverlayWindow:
     """
@@ -56,11 +121,24 @@ class OverlayWindow:
 
     Attributes:
         main: Reference to PawGateCore instance (for config and callbacks)
+        root: The Tk window, built on the first open() and reused (withdrawn
+              between locks) until close()
+        accepting_unlock: True while mainloop() is running and able to take
+                          an <<Unlock>> event from another thread
+        _unlock_lock: Held by request_unlock() across its check of
+                      accepting_unlock and its event_generate() call, and by
+                      _handle_unlock() while clearing the flag
+
+    WHY reuse one window instead of a Tk() per lock:
+        Creating a Tk root on Windows initializes Tcl/Tk, fonts and a native
+        window every time (hundreds of ms before the overlay appears), and
+        destroying it throws all of that away again. Withdrawing the window on
+        unlock and deiconifying it on the next lock only changes visibility.
 
     WHY pass main instance:
         The overlay needs:
         - self.main.config.opacity: User's transparency preference
-        - self.main.root: Store reference for cleanup later
+        - self.main.root: Set while the overlay is shown, so unlock can hide it
         - self.main.lock_keyboard(): Trigger keyboard blocking
         - self.main.unlock_keyboard(): Cleanup when unlock hotkey pressed
     """
@@ -73,61 +151,85 @@ class OverlayWindow:
             main: PawGateCore instance that owns this overlay
         """
         self.main = main
+        self.root = None
+        self.accepting_unlock = False
+        self._unlock_lock = threading.Lock()
+
+    def _build_root(self) -> tk.Tk:
+        """
+        Create the overlay's Tk window with its fixed styling (first lock only).
+
+        WHY overrideredirect(True):
+            Removes all window decorations (title bar, borders, close button).
+            This creates a clean overlay without UI chrome. Users can't accidentally
+            click the close button, and the overlay looks intentionally minimal.
+
+        WHY attributes('-topmost', True):
+            Ensures the overlay stays above all other windows. Without this,
+            the cat could bring another window to the front and type there.
+            topmost guarantees the overlay always blocks interaction.
+        """
+        root = tk.Tk()
+        root.overrideredirect(True)
+        root.attributes('-topmost', True)
+        root.bind('<<Unlock>>', self._handle_unlock)
+        return root
 
     def open(self) -> None:
         """
-        Create, configure, and display the fullscreen overlay.
+        Configure and display the fullscreen overlay.
 
         This method:
-        1. Queries all monitor configurations
-        2. Calculates bounding box to cover all monitors
-        3. Creates Tkinter window with transparent overlay styling
-        4. Sets up polling to detect unlock hotkey
-        5. Locks the keyboard
-        6. Enters Tkinter mainloop (blocks until window closed)
-
-        WHY query monitors every time:
+        1. Gets the bounding box of all monitors (cached until the displays change)
+        2. Builds the Tk window on first use, otherwise reuses the hidden one
+        3. Arranges to accept <<Unlock>> events once mainloop is running
+        4. Locks the keyboard
+        5. Enters Tkinter mainloop (blocks until unlock hides the window)
+
+        WHY check the displays every time:
             Users might connect/disconnect monitors between lock activations.
-            Querying fresh ensures the overlay adapts to the current configuration.
+            _get_overlay_geometry() compares a cheap display signature and
+            only re-enumerates monitors when it changed.
 
-        WHY sum/max/min calculations:
+        WHY a bounding box (min/max of the edges):
             In multi-monitor setups, monitors can be arranged arbitrarily:
-            - Side by side: total_width = sum of widths
-            - Stacked: max_height = tallest monitor
-            - Offset: min_x/min_y might be negative (monitor left/above primary)
+            - Side by side, stacked, or offset from each other
+            - min_x/min_y might be negative (monitor left/above primary)
+            The window spans from the smallest left/top edge to the largest
+            right/bottom edge. Summing widths (as this used to) over-counts
+            stacked monitors and misses offsets.
 
             Example: Two 1920x1080 monitors side-by-side
                 Monitor 0: x=0, y=0, width=1920, height=1080
                 Monitor 1: x=1920, y=0, width=1920, height=1080
-                Result: total_width=3840, max_height=1080, min_x=0, min_y=0
+                Result: width=3840, height=1080, min_x=0, min_y=0
+
+            Example: Two 1920x1080 monitors stacked
+                Monitor 0: x=0, y=0, width=1920, height=1080
+                Monitor 1: x=0, y=1080, width=1920, height=1080
+                Result: width=1920, height=2160, min_x=0, min_y=0
 
             Example: Two monitors in L-shape (one above-left of primary)
                 Monitor 0: x=-1920, y=-1080, width=1920, height=1080
                 Monitor 1: x=0, y=0, width=1920, height=1080
-                Result: total_width=3840, max_height=2160, min_x=-1920, min_y=-1080
+                Result: width=3840, height=2160, min_x=-1920, min_y=-1080
 
-        WHY overrideredirect(True):
-            Removes all window decorations (title bar, borders, close button).
-            This creates a clean overlay without UI chrome. Users can't accidentally
-            click the close button, and the overlay looks intentionally minimal.
-
-        WHY attributes('-topmost', True):
-            Ensures the overlay stays above all other windows. Without this,
-            the cat could bring another window to the front and type there.
-            topmost guarantees the overlay always blocks interaction.
-
-        WHY attributes('-alpha', ...):
+        WHY attributes('-alpha', ...) on every open:
             Makes the window semi-transparent so users can see their desktop
             underneath. This:
             - Provides visual confirmation of what's protected
             - Looks less jarring than a solid color
             - Allows users to see if anything important is happening (video, download)
+            The user may change opacity from the tray between locks, so it is
+            re-applied each time along with the geometry.
 
-        WHY poll unlock_event:
-            The overlay runs on Tkinter's main thread. Polling allows us to
-            respond to the hotkey listener (running in another thread) without
-            making unsafe cross-thread Tk calls. When the unlock hotkey is
-            detected, unlock_event is set, and the overlay closes itself.
+        WHY an <<Unlock>> virtual event instead of polling unlock_event:
+            This used to re-check unlock_event every 50ms with after(), which
+            woke the main thread 20 times a second while locked and added up
+            to 50ms of unlock latency. Now the hotkey thread sets unlock_event
+            and calls request_unlock(), which queues <<Unlock>> with
+            event_generate(when='tail'). tkinter marshals that call onto this
+            thread, and the bound handler unlocks.
 
         WHY lock_keyboard AFTER creating window:
             If we locked before window creation, there's a brief moment where
@@ -136,71 +238,112 @@ class OverlayWindow:
 
         WHY mainloop():
             Tkinter's mainloop() blocks and processes events (mouse clicks,
-            keyboard input, repaints). It runs until the window is destroyed
-            (via self.main.unlock_keyboard calling root.destroy()).
+            keyboard input, repaints). It runs until unlock_keyboard() hides
+            the window and calls root.quit(); the window itself survives for
+            the next lock.
 
         Threading note:
             This method MUST be called from the main thread because Tkinter
-            is not thread-safe. That's why we use a queue in main.py to signal
-            from the hotkey thread to the main thread.
+            is not thread-safe. That's why main.py signals the main thread
+            through show_overlay_event, and unlocks arrive as <<Unlock>>.
 
         See also:
             - main.start(): Main event loop that calls this method
             - main.lock_keyboard(): Blocks all keyboard input
             - main.unlock_keyboard(): Cleanup and close overlay
         """
-        # Query current monitor configuration
-        # WHY every time: Monitors might have changed since last lock
-        monitors = get_monitors()
-
-        # Calculate bounding box to cover all monitors (handles any arrangement)
-        total_width = sum([monitor.width for monitor in monitors])
-        max_height = max([monitor.height for monitor in monitors])
-        min_x = min([monitor.x for monitor in monitors])
-        min_y = min([monitor.y for monitor in monitors])
-
-        # Create Tkinter root window and store in main for cleanup
-        self.main.root = tk.Tk()
+        # Bounding box of all monitors (re-queried only if the displays changed)
+        width, height, min_x, min_y = _get_overlay_geometry()
 
-        # Remove window decorations (title bar, borders, close button)
-        # WHY: Creates clean, minimal overlay without UI chrome
-        self.main.root.overrideredirect(True)
+        # Build the window once; later locks reuse the withdrawn one
+        if self.root is None:
+            self.root = self._build_root()
+        root = self.root
 
         # Size and position window to cover all monitors
         # Format: WIDTHxHEIGHT+XOFFSET+YOFFSET
         # WHY this format: Tkinter geometry string standard
-        self.main.root.geometry(f'{total_width}x{max_height}+{min_x}+{min_y}')
-
-        # Ensure window stays on top of all other windows
-        # WHY: Prevents cat from bringing other windows forward
-        self.main.root.attributes('-topmost', True)
+        root.geometry(f'{width}x{height}+{min_x}+{min_y}')
 
         # Set transparency level from user config (0.05 to 0.9)
         # WHY configurable: Some users want more visibility, others less
-        self.main.root.attributes('-alpha', self.main.config.opacity)
+        root.attributes('-alpha', self.main.config.opacity)
+
+        # Show the window and store it in main so unlock can hide it
+        self.main.root = root
+        root.deiconify()
+        root.focus_force()
 
-        # Poll for unlock hotkey requests from the main application
-        # WHY polling: Allows background hotkey thread to signal unlock via event
-        self.main.root.after(50, self._wait_for_hotkey_unlock)
+        # Start accepting <<Unlock>> once mainloop runs (and catch any unlock
+        # requested while the overlay was still being shown)
+        root.after_idle(self._start_accepting_unlock)
 
         # Lock the keyboard AFTER window is created (ensures visual feedback)
         # WHY order matters: Don't block keyboard without showing overlay first
         self.main.lock_keyboard()
 
-        # Enter Tkinter event loop (blocks until window destroyed)
+        # Enter Tkinter event loop (blocks until unlock)
         # WHY blocks: Keeps window responsive to mouse clicks and repaints
-        # Exits when main.unlock_keyboard() calls root.destroy()
-        self.main.root.mainloop()
+        # Exits when main.unlock_keyboard() withdraws the window and calls root.quit()
+        root.mainloop()
+        self.accepting_unlock = False
 
-    def _wait_for_hotkey_unlock(self) -> None:
-        """Poll unlock_event and close overlay when hotkey is pressed."""
-        if not self.main.root:
-            return
+    def close(self) -> None:
+        """
+        Destroy the overlay window for good (at shutdown, on the Tk thread).
+        """
+        if self.root is not None:
+            self.root.destroy()
+            self.root = None
 
-        if self.main.unlock_event.is_set():
-            self.main.unlock_event.clear()
-            self.main.unlock_keyboard()
-            return
+    def request_unlock(self) -> None:
+        """
+        Wake the overlay to handle a pending unlock (safe from any thread).
+
+        The caller sets main.unlock_event first. Does nothing until mainloop
+        is running: a cross-thread Tk call made before then would block the
+        caller (the keyboard hook thread) waiting for a loop that isn't
+        there. _start_accepting_unlock() picks up such early requests.
+
+        WHY hold _unlock_lock across the check and the call:
+            Without it, the Tk thread could handle an earlier unlock and quit
+            mainloop between our check and event_generate(), leaving this
+            thread stuck in a cross-thread call nobody services. The Tk side
+            only flips the flag under the lock and never waits for it (see
+            _handle_unlock()), so the lock is at most held for a flag write.
+        """
+        with self._unlock_lock:
+            if self.accepting_unlock:
+                self.root.event_generate('<<Unlock>>', when='tail')
+
+    def _start_accepting_unlock(self) -> None:
+        """
+        Mark mainloop as running, then handle any unlock requested before it was.
 
-        # Reschedule polling while overlay remains active
-        self.main.root.after(50, self._wait_for_hotkey_unlock)
+        WHY flag first, check second: request_unlock() sets unlock_event and
+        then reads the flag, so at least one side always sees the other's
+        write. Both may fire; _handle_unlock() is idempotent.
+        """
+        self.accepting_unlock = True
+        self._handle_unlock()
+
+    def _handle_unlock(self, _event=None) -> None:
+        """
+        Unlock if an unlock was requested (runs on the Tk thread).
+
+        WHY a non-blocking acquire with an after() retry:
+            If request_unlock() holds the lock, it is waiting for this thread
+            to service its event_generate(). Blocking here would deadlock, so
+            we return to mainloop, let it finish, and try again in 1ms.
+        """
+        if not self.main.unlock_event.is_set():
+            return
+        if not self._unlock_lock.acquire(blocking=False):
+            self.root.after(1, self._handle_unlock)
+            return
+        try:
+            self.accepting_unlock = False
+        finally:
+            self._unlock_lock.release()
+        self.main.unlock_event.clear()
+        self.main.unlock_keyboard()
@@ -0,0 +1,46 @@
+"""
+Hotkey Utilities - Expand hotkey strings into the key names they involve.
+
+Both Config (which stores the hotkey) and PawGateCore (which must leave the
+hotkey's keys unblocked while locked) need the same parse, so it lives here
+rather than on either class.
+
+WHY expand modifiers:
+    A user-facing hotkey says "ctrl", but the keyboard library tracks
+    "left ctrl" and "right ctrl" separately. When locking we must leave every
+    variant unblocked, or the hotkey only works with one side of the keyboard.
+
+See also:
+    - config.py: Exposes the parsed form as Config.hotkey_keys
+    - main.py: Uses it to decide which keys stay unblocked during a lock
+"""
+
+# Modifier keys that have left/right variants - when user specifies "ctrl",
+# we must unblock both "left ctrl" and "right ctrl" for the hotkey to work
+MODIFIER_VARIANTS = {
+    'ctrl': ('ctrl', 'left ctrl', 'right ctrl'),
+    'shift': ('shift', 'left shift', 'right shift'),
+    'alt': ('alt', 'left alt', 'right alt'),
+    'windows': ('windows', 'left windows', 'right windows'),
+}
+
+
+def parse_hotkey_keys(hotkey: str) -> tuple[str, ...]:
+    """
+    Return all key names (with modifier variants) for a given hotkey string.
+
+    Args:
+        hotkey: Hotkey string such as "ctrl+shift+l"
+
+    Returns:
+        tuple[str, ...]: Lowercased key names, e.g. ("ctrl", "left ctrl",
+        "right ctrl", "shift", "left shift", "right shift", "l")
+    """
+    hotkey_keys: list[str] = []
+    for key in hotkey.lower().split('+'):
+        key = key.strip()
+        if key in MODIFIER_VARIANTS:
+            hotkey_keys.extend(MODIFIER_VARIANTS[key])
+        else:
+            hotkey_keys.append(key)
+    return tuple(hotkey_keys)
@@ -1,14 +1,16 @@
 """
 Lockfile Handler - Enforce single instance of PawGate.
 
-This module ensures only one instance of PawGate runs at a time by using a
-lockfile that stores the process ID (PID) of the running instance.
+This module ensures only one instance of PawGate runs at a time by holding an
+OS-level advisory lock on a lockfile for the whole life of the process. The
+file also stores the process ID (PID) of the instance holding the lock.
 
 Single instance enforcement strategy:
-    1. On startup: Check if lockfile exists
-    2. If exists: Read PID, try to terminate that process, create new lockfile
-    3. If doesn't exist: Create lockfile with current PID
-    4. On shutdown: Remove lockfile
+    1. On startup: Open the lockfile and try to lock it without blocking
+    2. If another instance holds the lock: Terminate the PID stored in the
+       file, then wait for the kernel to hand the lock over
+    3. Write the current PID into the file and keep it open (and locked)
+    4. On shutdown: Release the lock (the file itself stays)
 
 WHY single instance:
     - Multiple instances would register duplicate keyboard hooks (conflicts)
@@ -19,10 +21,17 @@ WHY single instance:
 Lockfile location:
     ~/.pawgate/lockfile.lock (same directory as config)
 
-WHY store PID in lockfile:
-    If an old PawGate instance crashed without cleanup, the lockfile remains.
-    We try to terminate the old process (gracefully) before starting. If the
-    PID is stale (process doesn't exist), we just overwrite the lockfile.
+WHY an advisory lock instead of just a PID:
+    Taking the lock is a single atomic kernel operation, so two instances
+    starting at the same moment can never both believe they are alone. The
+    kernel also releases the lock when a process exits or crashes, so a
+    lockfile left behind by a crash is simply lockable again - whether the
+    file exists no longer means anything.
+
+WHY still store the PID:
+    The lock tells us *that* another instance is running, not *which* one.
+    The PID lets us terminate it so the newly launched instance takes over,
+    which is what users expect when they relaunch PawGate.
 
 Alternative approaches rejected:
     - Windows mutex: Platform-specific, harder to debug
@@ -30,108 +39,250 @@ Alternative approaches rejected:
     - Registry key: Doesn't survive crashes cleanly
 
 Edge cases:
-    - Lockfile exists but process is dead: We overwrite (stale lockfile)
-    - Permission denied: Would crash (rare, indicates system issues)
-    - Rapid restart: Old process terminates, new process starts cleanly
+    - Lockfile exists but process is dead: Kernel already released the lock
+    - Old instance won't exit: After _TAKEOVER_TIMEOUT we start anyway
+    - Lockfile deleted by hand while running: The next launch locks a new
+      file, so avoid that; the file is never deleted by PawGate itself
+    - Permission denied opening the file: Would crash (rare, indicates system issues)
 
 See also:
     - main.start(): Calls check_lockfile() at startup
     - main.quit_program(): Calls remove_lockfile() at shutdown
 """
 
+import functools
+import logging
 import os
 import signal
+import time
 from pathlib import Path
 
-# Lockfile path in user's home directory
-# WHY same directory as config: Keeps all PawGate user data together
-home = str(Path.home())
-LOCKFILE_PATH = os.path.join(home, '.pawgate', 'lockfile.lock')
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
 
+logger = logging.getLogger(__name__)
 
-def check_lockfile():
+# Byte offset locked on Windows
+# WHY not byte 0: msvcrt locks are mandatory byte-range locks, so locking the
+# bytes holding the PID would stop the next instance from reading it. Windows
+# allows locking past end-of-file, so we lock a byte no PID will ever reach.
+_LOCK_OFFSET = 64
+
+# How long to wait for a terminated instance to release the lock (seconds)
+_TAKEOVER_TIMEOUT = 5.0
+
+# Linux 5.3+ process file descriptors (see _terminate_holder)
+_HAVE_PIDFD = hasattr(os, 'pidfd_open') and hasattr(signal, 'pidfd_send_signal')
+
+# Open handle on the lockfile, kept for the life of the process
+# WHY module-level: Closing (or garbage collecting) the handle releases the lock
+_lock_handle = None
+
+
+@functools.lru_cache(maxsize=1)
+def _lockfile_path() -> str:
     """
-    Check for existing PawGate instance and create lockfile for current instance.
+    Return the lockfile path in the user's home directory.
+
+    WHY same directory as config: Keeps all PawGate user data together
+
+    WHY a cached function instead of a module constant:
+        Path.home() reads the environment (and may query the user database),
+        which is wasted work at import time for code that only needs the
+        path once at startup and once at shutdown. It also means importing
+        this module never depends on $HOME being set.
+    """
+    return os.path.join(str(Path.home()), '.pawgate', 'lockfile.lock')
+
+
+def _try_lock(fh) -> bool:
+    """
+    Try to take the advisory lock on an open lockfile without blocking.
+
+    Returns:
+        bool: True if this process now holds the lock, False if another does
+    """
+    try:
+        if os.name == 'nt':
+            fh.seek(_LOCK_OFFSET)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _open_pidfd(pid: int):
+    """
+    Return a pidfd pinning pid, or None if os.kill() must be used instead.
+
+    WHY fall back on OSError:
+        _HAVE_PIDFD only says Python exposes the call. Kernels older than 5.3
+        fail it with ENOSYS, and seccomp sandboxes may fail it with EPERM.
+        Giving up there would send no signal at all and make the new instance
+        wait out _TAKEOVER_TIMEOUT beside the old one. ProcessLookupError
+        still propagates: the PID is gone, so os.kill() can't help either.
+    """
+    if not _HAVE_PIDFD:
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError as e:
+        logger.debug("pidfd_open unavailable (%s); using os.kill()", e)
+        return None
 
-    This function:
-    1. Checks if lockfile exists (indicates another instance is/was running)
-    2. If exists, reads PID and attempts to terminate that process
-    3. Creates new lockfile with current process's PID
+
+def _terminate_holder(fh) -> None:
+    """
+    Send SIGTERM to the instance whose PID is stored in the lockfile.
 
     WHY SIGTERM (graceful termination):
         Gives the old process a chance to clean up (remove keyboard hooks,
         close tray icon, etc.) before exiting. SIGKILL would force immediate
         termination without cleanup, potentially leaving keyboard hooks active.
 
-    WHY silent exception handling:
-        If os.kill() fails, the process is likely already dead (stale lockfile).
-        This is expected and not an error - we just overwrite the lockfile.
+    WHY no os.kill(pid, 0) liveness probe first:
+        We only get here because the kernel says the lock is held, so the
+        holder is alive by definition. On Windows os.kill() with signal 0
+        would also *terminate* the process rather than probe it.
+
+    WHY a pidfd on Linux:
+        The PID is only a number. If the holder exits after we read it, the
+        number can be reused and os.kill() would hit an unrelated process.
+        pidfd_open() pins the exact process the PID names right now; if the
+        lock is still held *after* that, the pinned process is the holder,
+        and pidfd_send_signal() can only ever reach it. Other platforms (and
+        kernels that refuse pidfd_open(), see _open_pidfd()) fall back to
+        os.kill().
+
+    WHY log instead of raise:
         Possible failure reasons:
-        - ProcessLookupError: PID doesn't exist (stale lockfile)
+        - ValueError: Holder hasn't written its PID yet (it just started)
+        - ProcessLookupError: PID exited between our lock attempt and now
         - PermissionError: PID belongs to different user (rare)
-        - Other OSError: System-level issues
+        - Plain OSError: How Windows reports a PID that doesn't exist
+        In every case we just wait for the lock, but the reason is logged
+        so a takeover that times out can be diagnosed. Nothing else is
+        caught, so genuine bugs still surface.
+    """
+    fh.seek(0)
+    data = fh.read().strip()
+    try:
+        pid = int(data)
+    except ValueError:
+        logger.debug("lock holder has not recorded a PID yet (%r)", data)
+        return
+
+    try:
+        pidfd = _open_pidfd(pid)
+        if pidfd is not None:
+            try:
+                # WHY recheck: a free lock means the holder exited and pid may
+                # now name someone else (see above); the caller keeps the lock
+                if _try_lock(fh):
+                    logger.debug("lock holder %d exited before it was signalled", pid)
+                    return
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            finally:
+                os.close(pidfd)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except OSError as e:
+        logger.debug("could not terminate lock holder %d: %s", pid, e)
+    else:
+        logger.debug("sent SIGTERM to lock holder %d", pid)
+
+
+def check_lockfile():
+    """
+    Take the single-instance lock, terminating any instance that holds it.
+
+    This function:
+    1. Opens (creating if needed) the lockfile and tries to lock it
+    2. If another instance holds the lock, terminates it and waits for the
+       kernel to release its lock
+    3. Replaces the file's contents with the current process's PID
+    4. Keeps the file open so the lock lasts until this process exits
+
+    WHY 'a+' mode:
+        Creates the file if missing without truncating it, so a losing
+        instance can still read the winner's PID.
+
+    WHY poll instead of a blocking lock:
+        fcntl.flock() would wait forever on an instance that ignores SIGTERM,
+        and msvcrt's blocking mode gives up after a fixed 10 seconds. Polling
+        gives both platforms the same bounded wait. This only runs while
+        taking over from another instance, never in the common case.
+
+    WHY start anyway after the timeout:
+        Refusing to start would leave the user without PawGate because of an
+        instance they can't see. Running unlocked is the old PID-file
+        behaviour; the next launch will still find and terminate the holder.
 
     Thread safety:
         Not thread-safe, but called only once from main thread at startup.
 
-    Race condition:
-        If two instances start simultaneously, both might read no lockfile
-        and both create one. Last writer wins. This is acceptable because:
-        - Extremely rare (requires ~1ms timing coincidence)
-        - Both instances would still function (keyboard library handles multiple hooks)
-        - Worst case: User sees two tray icons briefly, quits one manually
-
     See also:
         - remove_lockfile(): Cleanup counterpart
         - main.start(): Calls this at startup
     """
-    # Check if another instance is (or was) running
-    if os.path.exists(LOCKFILE_PATH):
-        with open(LOCKFILE_PATH, 'r') as f:
-            pid = int(f.read().strip())
-            try:
-                # Attempt graceful termination of old process
-                # WHY SIGTERM: Allows old process to cleanup (unlike SIGKILL)
-                os.kill(pid, signal.SIGTERM)
-            except Exception as e:
-                # Process not found or can't be terminated
-                # WHY silent: This is expected if process already exited or crashed
-                # Common causes:
-                # - Process already terminated normally
-                # - Process crashed without cleaning up lockfile
-                # - PID reused by different process (very rare)
-                pass
-
-    # Create (or overwrite) lockfile with current process ID
-    # WHY overwrite: Even if old lockfile exists, we're the new instance now
-    with open(LOCKFILE_PATH, 'w') as f:
-        f.write(str(os.getpid()))
+    global _lock_handle
+
+    fh = open(_lockfile_path(), 'a+')
+    try:
+        if not _try_lock(fh):
+            _terminate_holder(fh)
+            deadline = time.monotonic() + _TAKEOVER_TIMEOUT
+            while not _try_lock(fh):
+                if time.monotonic() >= deadline:
+                    logger.warning("previous instance still holds %s; starting anyway", fh.name)
+                    break
+                time.sleep(0.1)
+    except BaseException:
+        fh.close()
+        raise
+
+    # Record our PID for the next instance
+    # WHY truncate: 'a+' always appends, so clear the old PID first
+    fh.seek(0)
+    fh.truncate()
+    fh.write(str(os.getpid()))
+    fh.flush()
+    _lock_handle = fh
 
 
 def remove_lockfile():
     """
-    Remove lockfile on clean shutdown.
+    Release the single-instance lock on clean shutdown.
 
-    Called by quit_program() to allow new instances to start cleanly.
+    Called by quit_program() so a new instance can take the lock at once.
+    Closing the handle releases the lock.
 
-    WHY check existence:
-        Defensive programming - avoid FileNotFoundError if lockfile was
-        manually deleted or cleanup was already called. Silent no-op is
-        better than crashing during shutdown.
+    WHY the file is not deleted:
+        With an advisory lock the file's existence means nothing, and
+        unlinking it would break the lock. An instance waiting in
+        check_lockfile() can lock the old file between our close and the
+        unlink; the next launch then creates and locks a new file, and both
+        run. On Windows unlink() also raises PermissionError while any other
+        instance still has the file open, which would abort Quit.
 
     Thread safety:
         Not thread-safe, but only called from main thread during shutdown.
 
     Edge cases:
-        - Lockfile already removed: Silent no-op (exists check prevents error)
-        - Permission denied: Would raise PermissionError (rare, indicates system issues)
-        - Lockfile locked by another process: Would block or fail (extremely rare)
+        - Lock never taken (or already released): Silent no-op
 
     See also:
         - check_lockfile(): Startup counterpart
         - main.quit_program(): Calls this during shutdown
     """
-    # Remove lockfile if it exists (allow new instances to start)
-    # WHY check exists: Defensive programming to avoid FileNotFoundError
-    if os.path.exists(LOCKFILE_PATH):
-        os.remove(LOCKFILE_PATH)
+    global _lock_handle
+
+    if _lock_handle is not None:
+        _lock_handle.close()
+        _lock_handle = None
@@ -33,11 +33,42 @@ See also:
     - notifications.py: Uses get_packaged_path() for notification icon
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
 
 
+def _resolve_base() -> str:
+    """
+    Find the directory bundled resources are resolved against.
+
+    Returns:
+        str: sys._MEIPASS when running from a PyInstaller bundle, otherwise
+        the project root
+
+    WHY getattr() with a default:
+        In production (PyInstaller), sys._MEIPASS exists and points to the
+        temporary extraction directory. In development it doesn't exist, and
+        getattr() falls back without raising - so there is no except clause
+        that could swallow KeyboardInterrupt while a frozen app starts up.
+
+    WHY resolve():
+        __file__ can be relative in development; resolving it once makes
+        every path get_packaged_path() returns absolute, like _MEIPASS is.
+    """
+    # WHY parent.parent.parent: This file is at src/util/path_util.py,
+    # so we need to go up 3 levels to reach project root
+    return getattr(sys, '_MEIPASS', None) or str(Path(__file__).resolve().parent.parent.parent)
+
+
+# Resolved once at import
+# WHY: Neither sys._MEIPASS nor this file's location can change while the
+# process runs, so there is no reason to recompute them per lookup
+_BASE = _resolve_base()
+
+
+@functools.lru_cache(maxsize=None)
 def get_packaged_path(path: str) -> str:
     """
     Resolve path to a bundled resource, handling PyInstaller temp directory.
@@ -48,14 +79,15 @@ def get_packaged_path(path: str) -> str:
     Returns:
         str: Absolute path to the resource, accounting for PyInstaller
 
-    WHY try/except:
-        In production (PyInstaller), sys._MEIPASS exists and points to the
-        temporary extraction directory. In development, it doesn't exist and
-        raises AttributeError. We catch this and fall back to project directory.
+    WHY lru_cache:
+        The same handful of resources (icon.png, the notification icon) are
+        looked up repeatedly; each lookup after the first returns the same
+        string without touching os.path. The cache stays tiny because the
+        set of bundled resources is fixed.
 
-    WHY not hasattr():
-        Using try/except is more Pythonic than hasattr() for checking attributes.
-        "Easier to Ask Forgiveness than Permission" (EAFP).
+    WHY no abspath():
+        _BASE is already absolute, so joining a relative path onto it is
+        too - abspath() would only add work.
 
     Example:
         Development: get_packaged_path("resources/img/icon.png")
@@ -70,20 +102,15 @@ def get_packaged_path(path: str) -> str:
         - Absolute paths: Don't use - this function expects relative paths
 
     See also:
+        - _resolve_base(): Picks between _MEIPASS and the project root
         - PyInstaller documentation on --add-data flag
         - get_config_path(): For user data, NOT bundled resources
     """
-    try:
-        # Production: PyInstaller temporary extraction directory
-        # WHY sys._MEIPASS: PyInstaller sets this to the temp dir containing bundled files
-        wd = sys._MEIPASS
-        return os.path.abspath(os.path.join(wd, path))
-    except:
-        # Development: Calculate path relative to project root
-        # WHY parent.parent.parent: This file is at src/util/path_util.py,
-        # so we need to go up 3 levels to reach project root
-        base = Path(__file__).parent.parent.parent
-        return os.path.join(base, path)
+    return os.path.join(_BASE, path)
+
+
+# Memoized result of get_config_path()
+_config_path: str | None = None
 
 
 def get_config_path() -> str:
@@ -108,6 +135,12 @@ def get_config_path() -> str:
         os.makedirs() creates all intermediate directories (like 'mkdir -p').
         If only .pawgate/ exists but config/ doesn't, makedirs() creates it.
 
+    WHY memoized:
+        The home directory doesn't change during a run, so only the first
+        call builds the path and touches the filesystem. The trade-off: if
+        the user deletes ~/.pawgate/ while PawGate is running, the next
+        save() fails loudly instead of silently recreating the directory.
+
     Permissions:
         No special permissions needed - this goes in user's home directory
         which is always writable by the user (no admin rights required).
@@ -125,6 +158,10 @@ def get_config_path() -> str:
         - config.py: Main consumer of this function
         - Path.home(): Python's cross-platform way to get user's home directory
     """
+    global _config_path
+    if _config_path is not None:
+        return _config_path
+
     # Get user's home directory (cross-platform)
     # WHY Path.home(): Works on Windows, Linux, macOS consistently
     home = str(Path.home())
@@ -133,9 +170,10 @@ def get_config_path() -> str:
     config_dir = os.path.join(home, '.pawgate', 'config')
 
     # Create directory if it doesn't exist (first run or manual deletion)
-    # WHY exist_ok not used: os.path.exists() check is more explicit
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)  # Creates .pawgate/ and .pawgate/config/
+    # WHY exist_ok=True: One atomic call instead of exists() + makedirs(),
+    # with no window for another process to create the directory in between
+    os.makedirs(config_dir, exist_ok=True)  # Creates .pawgate/ and .pawgate/config/
 
     # Return full path to config.json
-    return os.path.join(config_dir, "config.json")
+    _config_path = os.path.join(config_dir, "config.json")
+    return _config_path
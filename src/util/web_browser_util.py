@@ -34,13 +34,54 @@ URL strategy:
     - Analytics on which docs users access
     - SEO benefits for project visibility
 
+WHY a background thread:
+    webbrowser.open() can block for 100ms+ while it spawns the browser
+    process on Windows. The tray menu callbacks run on pystray's event
+    thread, so opening inline would freeze the menu until the browser
+    starts.
+
 See also:
     - tray_icon.py: Menu items that call these functions
     - config.py: Calls open_about() on first run
 """
 
+import threading
 import webbrowser
 
+# Page opened by each open_*() helper, keyed by open_url()'s argument
+# WHY one table: URLs are updated in one place, and every page is opened
+# by the same code path
+_URLS = {
+    "about": "https://catlock.app/about/",
+    "help": "https://catlock.app/faq/",
+    "support": "https://buymeacoffee.com/richiehowelll",
+}
+
+
+def open_url(page: str) -> None:
+    """
+    Open one of PawGate's pages in a new browser tab without blocking.
+
+    Args:
+        page: Key into _URLS ("about", "help" or "support")
+
+    Raises:
+        KeyError: Unknown page - raised here, on the caller's thread, rather
+        than inside the background thread where it would go unnoticed
+
+    WHY daemon thread: A browser that is slow to start must never keep
+    PawGate from exiting.
+    """
+    url = _URLS[page]
+    # Open in new tab (new=2) to avoid disrupting existing browser session
+    threading.Thread(
+        target=webbrowser.open,
+        args=(url,),
+        kwargs={"new": 2},
+        daemon=True,
+        name="pawgate-browser",
+    ).start()
+
 
 def open_about():
     """
@@ -62,8 +103,7 @@ def open_about():
         - config.py: Calls this on first run (config file doesn't exist)
         - tray_icon.py: Menu item "About"
     """
-    # Open in new tab (new=2) to avoid disrupting existing browser session
-    webbrowser.open("https://catlock.app/about/", new=2)
+    open_url("about")
 
 
 def open_buy_me_a_coffee():
@@ -88,8 +128,7 @@ def open_buy_me_a_coffee():
     See also:
         - tray_icon.py: Menu item "Support ☕"
     """
-    # Open in new tab (new=2) to avoid disrupting existing browser session
-    webbrowser.open("https://buymeacoffee.com/richiehowelll", new=2)
+    open_url("support")
 
 
 def open_help():
@@ -114,6 +153,4 @@ def open_help():
     See also:
         - tray_icon.py: Menu item "Help"
     """
-    # Open in new tab (new=2) to avoid disrupting existing browser session
-    webbrowser.open("https://catlock.app/faq/", new=2)
-
+    open_url("help")
@@ -5,81 +5,80 @@ WHY: Centralize common test setup (mocks, temp files, fixtures) to avoid
 duplication across test modules and ensure consistent test isolation.
 """
 
+import functools
 import json
 import os
-import tempfile
 from pathlib import Path
-from typing import Dict, Any, Generator
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
 
+# Default settings written by the temp/mock config file fixtures
+# WHY module-level: One literal shared by every fixture that writes a file
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "hotkey": "ctrl+b",
+    "opacity": 0.3,
+    "notificationsEnabled": False,
+}
+# WHY serialized once: every file-writing fixture writes the same bytes
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG)
+
+
 # =============================================================================
 # Config Data Fixtures
 # =============================================================================
 
-@pytest.fixture
-def valid_config_data() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def valid_config_data() -> Mapping[str, Any]:
     """
     Provide a valid PawGate configuration dictionary.
 
     WHY: Tests need known-good config data to verify loading behavior.
+
+    WHY session scope + read-only: The data never changes, so it is built
+    once per run and shared. MappingProxyType makes accidental mutation in
+    one test fail loudly instead of leaking into the next; tests that need
+    a real dict (e.g. for json.dump) take dict(valid_config_data).
     """
-    return {
+    return MappingProxyType({
         "hotkey": "ctrl+b",
         "opacity": 0.3,
         "notificationsEnabled": False,
-    }
+    })
 
 
-@pytest.fixture
-def partial_config_data() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def partial_config_data() -> Mapping[str, Any]:
     """
     Provide a partial PawGate configuration with missing keys.
 
     WHY: Tests need to verify Config handles missing keys gracefully
-    by falling back to defaults.
+    by falling back to defaults. Shared read-only like valid_config_data.
     """
-    return {
+    return MappingProxyType({
         "hotkey": "ctrl+shift+l",
         # opacity and notificationsEnabled intentionally missing
-    }
+    })
 
 
 @pytest.fixture
-def tmp_config_file() -> Generator[Path, None, None]:
+def tmp_config_file(tmp_path) -> Path:
     """
     Create a temporary JSON configuration file for testing.
 
     WHY: Tests need isolated config files to avoid polluting the user's
-    actual configuration. Using tempfile ensures automatic cleanup.
+    actual configuration. tmp_path is created and cleaned up by pytest, so
+    there is no file handle or unlink to manage here.
 
-    Yields:
+    Returns:
         Path to temporary config file with default PawGate settings
     """
-    default_config: Dict[str, Any] = {
-        "hotkey": "ctrl+b",
-        "opacity": 0.3,
-        "notificationsEnabled": False,
-    }
-
-    tmp_file = tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.json',
-        delete=False,
-        encoding='utf-8'
-    )
-
-    try:
-        json.dump(default_config, tmp_file, indent=2)
-        tmp_file.close()
-        yield Path(tmp_file.name)
-    finally:
-        try:
-            Path(tmp_file.name).unlink(missing_ok=True)
-        except Exception:
-            pass
+    config_file = tmp_path / "config.json"
+    config_file.write_text(_DEFAULT_CONFIG_JSON)
+    return config_file
 
 
 # =============================================================================
@@ -87,42 +86,52 @@ def tmp_config_file() -> Generator[Path, None, None]:
 # =============================================================================
 
 @pytest.fixture
-def mock_config_path(tmp_path, mocker) -> Path:
+def mock_config_path(tmp_path, monkeypatch) -> Path:
     """
     Mock get_config_path() to return a temp directory config file.
 
     WHY: Prevents tests from modifying the user's actual config file.
     All config operations redirect to an isolated temp directory.
 
+    WHY no file is created: Most tests write their own config (or want the
+    first-run path, which copies the bundled defaults), so pre-writing one
+    is wasted I/O. tmp_path already exists, which is all the real
+    get_config_path() guarantees. Use mock_config_file for a pre-written
+    default config.
+
     Returns:
-        Path to temp config.json file
+        Path to temp config.json file (not yet created)
     """
-    config_dir = tmp_path / ".pawgate" / "config"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    config_file = config_dir / "config.json"
+    config_file = tmp_path / "config.json"
 
-    # Create default config
-    default_config = {
-        "hotkey": "ctrl+b",
-        "opacity": 0.3,
-        "notificationsEnabled": False,
-    }
-    config_file.write_text(json.dumps(default_config))
+    # WHY monkeypatch instead of mocker.patch: no test asserts on these
+    # calls, so a plain function swapped in with setattr is enough and skips
+    # building a MagicMock and a patcher per target
+    def mock_path() -> str:
+        return str(config_file)
 
-    mocker.patch(
-        'src.util.path_util.get_config_path',
-        return_value=str(config_file)
-    )
-    mocker.patch(
-        'src.config.config.get_config_path',
-        return_value=str(config_file)
-    )
+    monkeypatch.setattr('src.util.path_util.get_config_path', mock_path)
+    monkeypatch.setattr('src.config.config.get_config_path', mock_path)
 
     return config_file
 
 
 @pytest.fixture
-def mock_packaged_path(tmp_path, mocker) -> Path:
+def mock_config_file(mock_config_path) -> Path:
+    """
+    Like mock_config_path, but with the default config already written.
+
+    WHY: For tests that need an existing user config (i.e. not a first run).
+
+    Returns:
+        Path to temp config.json file
+    """
+    mock_config_path.write_text(_DEFAULT_CONFIG_JSON)
+    return mock_config_path
+
+
+@pytest.fixture
+def mock_packaged_path(tmp_path, monkeypatch) -> Path:
     """
     Mock get_packaged_path() to return temp directory for bundled resources.
 
@@ -136,25 +145,14 @@ def mock_packaged_path(tmp_path, mocker) -> Path:
     resources_dir.mkdir(parents=True, exist_ok=True)
 
     # Create bundled default config
-    bundled_config = {
-        "hotkey": "ctrl+b",
-        "opacity": 0.3,
-        "notificationsEnabled": False,
-    }
     bundled_file = resources_dir / "config.json"
-    bundled_file.write_text(json.dumps(bundled_config))
+    bundled_file.write_text(_DEFAULT_CONFIG_JSON)
 
     def mock_path(path: str) -> str:
         return str(tmp_path / path)
 
-    mocker.patch(
-        'src.util.path_util.get_packaged_path',
-        side_effect=mock_path
-    )
-    mocker.patch(
-        'src.config.config.get_packaged_path',
-        side_effect=mock_path
-    )
+    monkeypatch.setattr('src.util.path_util.get_packaged_path', mock_path)
+    monkeypatch.setattr('src.config.config.get_packaged_path', mock_path)
 
     return tmp_path
 
@@ -163,34 +161,59 @@ def mock_packaged_path(tmp_path, mocker) -> Path:
 # Application Component Mocks
 # =============================================================================
 
+# Public methods of the components replaced by the mocks below
+# WHY spec the mocks: a bare MagicMock accepts any attribute, so a test that
+# calls a method the real class doesn't have (or no longer has) still passes.
+# Speccing makes that fail fast and stops stray child mocks being created.
+_OVERLAY_WINDOW_API = ('open', 'close', 'request_unlock')
+_TRAY_ICON_API = ('open', 'set_opacity', 'toggle_notifications', 'flush_config')
+_HOTKEY_LISTENER_API = ('register_hotkeys', 'unregister_hotkeys', 'update_hotkey', 'release_key')
+
 @pytest.fixture
-def mock_open_about(mocker) -> MagicMock:
+def mock_open_about(monkeypatch) -> MagicMock:
     """
     Mock open_about() to prevent browser from opening during tests.
 
     WHY: Opening browser windows during tests is disruptive and
     causes CI/CD failures.
     """
-    mock = mocker.patch('src.config.config.open_about')
-    mocker.patch('src.util.web_browser_util.open_about')
+    # WHY patch the source module: config.py imports open_about lazily,
+    # inside its first-run branch
+    mock = MagicMock()
+    monkeypatch.setattr('src.util.web_browser_util.open_about', mock)
     return mock
 
 
 @pytest.fixture
 def mock_keyboard(mocker) -> MagicMock:
     """
-    Mock the keyboard library to prevent actual global hotkey registration.
+    Mock the keyboard library to prevent real global keyboard hooks.
 
     WHY: The keyboard library requires admin privileges on Windows and
     can interfere with developer workflow during testing.
-    """
-    mock_kb = mocker.patch('keyboard.add_hotkey', autospec=True)
-    mocker.patch('keyboard.remove_hotkey', autospec=True)
-    mocker.patch('keyboard.unhook_all', autospec=True)
-    mocker.patch('keyboard.block_key', autospec=True)
-    mocker.patch('keyboard.unblock_key', autospec=True)
-    mocker.patch('keyboard.remap_key', autospec=True)
-    return mock_kb
+
+    Returns:
+        The mocked keyboard.hook. PawGateCore and the hotkey listener both
+        install their suppressing hooks through it.
+    """
+    # WHY patch.multiple: one target lookup and one finalizer for the whole
+    # set, instead of one mocker.patch() per function
+    # WHY no autospec: no test relies on signature checking here, and
+    # autospec re-inspects every function on each fixture setup
+    # WHY these names: they are the whole keyboard API PawGate calls at
+    # runtime (the event-based listener replaced add_hotkey/block_key)
+    mocks = mocker.patch.multiple(
+        'keyboard',
+        hook=DEFAULT,
+        parse_hotkey=DEFAULT,
+        key_to_scan_codes=DEFAULT,
+        stash_state=DEFAULT,
+    )
+    # WHY: hotkeys are registered on the constructing thread, and the real
+    # parse_hotkey() needs OS keymaps (dumpkeys on Linux)
+    mocks['parse_hotkey'].return_value = (((48,),),)
+    mocks['key_to_scan_codes'].return_value = ()
+    return mocks['hook']
 
 
 @pytest.fixture
@@ -200,37 +223,41 @@ def mock_tray(mocker) -> MagicMock:
 
     WHY: System tray icons require a GUI event loop and can leave orphaned
     processes if tests crash.
+
+    WHY per test rather than a session-wide fake module: tests/unit/
+    test_tray_icon.py builds real pystray menus to check their callbacks, so
+    a stub installed for the whole session would leak into those tests.
     """
     mock_icon = MagicMock()
     mock_icon.run.return_value = None
     mock_icon.stop.return_value = None
     mock_icon.notify.return_value = None
 
-    mock_icon_class = mocker.patch('pystray.Icon', autospec=True)
-    mock_icon_class.return_value = mock_icon
-
-    mocker.patch('pystray.MenuItem', autospec=True)
-    mocker.patch('pystray.Menu', autospec=True)
+    # WHY patch.multiple: one target lookup and finalizer for all three
+    # WHY no autospec: specing Icon walks the whole class on every setup
+    mocks = mocker.patch.multiple(
+        'pystray',
+        Icon=DEFAULT,
+        MenuItem=DEFAULT,
+        Menu=DEFAULT,
+    )
+    mocks['Icon'].return_value = mock_icon
 
     return mock_icon
 
 
 @pytest.fixture
-def mock_tray_icon(mocker) -> MagicMock:
+def mock_tray_icon(mock_tray, mocker) -> MagicMock:
     """
     Mock TrayIcon class to prevent actual system tray operations.
 
-    WHY: Alias for mock_tray with additional TrayIcon class mocking.
-    Some tests refer to this fixture name.
+    WHY: Builds on mock_tray (which stubs pystray) and also replaces the
+    TrayIcon class. Some tests refer to this fixture name.
     """
-    mock_icon = MagicMock()
+    mock_icon = MagicMock(spec=_TRAY_ICON_API)
     mock_icon.open.return_value = None
-    mock_icon.close.return_value = None
 
     mocker.patch('src.os_controller.tray_icon.TrayIcon', return_value=mock_icon)
-    mocker.patch('pystray.Icon', autospec=True)
-    mocker.patch('pystray.MenuItem', autospec=True)
-    mocker.patch('pystray.Menu', autospec=True)
 
     return mock_icon
 
@@ -243,9 +270,9 @@ def mock_overlay_window(mocker) -> MagicMock:
     WHY: GUI windows require a display and event loop, which
     can fail in headless CI/CD environments.
     """
-    mock_window = MagicMock()
-    mock_window.show.return_value = None
-    mock_window.hide.return_value = None
+    mock_window = MagicMock(spec=_OVERLAY_WINDOW_API)
+    mock_window.open.return_value = None
+    mock_window.close.return_value = None
 
     mocker.patch('src.ui.overlay_window.OverlayWindow', return_value=mock_window)
 
@@ -274,7 +301,7 @@ def mock_hotkey_listener(mocker) -> MagicMock:
     WHY: Hotkey listener spawns threads and registers global hotkeys,
     which can interfere with other tests and require cleanup.
     """
-    mock_listener = MagicMock()
+    mock_listener = MagicMock(spec=_HOTKEY_LISTENER_API)
     mock_class = mocker.patch(
         'src.keyboard_controller.hotkey_listener.HotkeyListener',
         return_value=mock_listener
@@ -291,14 +318,30 @@ def mock_windows_lock(mocker) -> MagicMock:
     WHY: Actually locking the workstation during tests would be incredibly
     annoying and break CI/CD.
     """
-    mock_lock = mocker.patch(
-        'ctypes.windll.user32.LockWorkStation',
-        autospec=True
-    )
+    mock_lock = mocker.patch('ctypes.windll.user32.LockWorkStation')
     mock_lock.return_value = 1
     return mock_lock
 
 
+@functools.lru_cache(maxsize=1)
+def _dummy_frame():
+    """
+    Return one shared, read-only black 640x480 BGR frame.
+
+    WHY cached: the frame is ~900KB of zeros; allocating it once instead of
+    per test avoids re-zeroing it every time. It is read-only so a test
+    can't alter what the next one sees - take a .copy() to modify it.
+
+    WHY import numpy here: only camera tests need it, so collecting the
+    rest of the suite never pays for importing numpy.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame.flags.writeable = False
+    return frame
+
+
 @pytest.fixture
 def mock_cv2_capture(mocker) -> MagicMock:
     """
@@ -309,10 +352,7 @@ def mock_cv2_capture(mocker) -> MagicMock:
     """
     mock_cap = MagicMock()
     mock_cap.isOpened.return_value = True
-
-    import numpy as np
-    dummy_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-    mock_cap.read.return_value = (True, dummy_frame)
+    mock_cap.read.return_value = (True, _dummy_frame())
 
     mocker.patch('cv2.VideoCapture', return_value=mock_cap)
 
@@ -352,5 +392,9 @@ def reset_singletons():
     WHY: If PawGate uses singleton patterns, state can leak between tests.
     This fixture resets them before each test.
     """
+    # WHY: config.load() is memoized; a cached dict from one test's temp
+    # config path must not leak into the next
+    from src.config.config import load
+    load.cache_clear()
     yield
-    # Add singleton reset logic here when needed
+    load.cache_clear()
@@ -2,39 +2,128 @@
 Integration tests for keyboard locking functionality.
 
 WHY: These tests verify the keyboard blocking mechanism integrates
-correctly with the boppreh/keyboard library. We mock keyboard.block_key
-and keyboard.unblock_key to avoid actually blocking the test runner's
-keyboard (which would be... problematic).
+correctly with the boppreh/keyboard library. We mock keyboard.hook to
+avoid actually blocking the test runner's keyboard (which would be...
+problematic) and drive the captured hook callback with fake events.
 
 Tests cover:
-- Full scan code range blocking (0-255)
-- Named key blocking for critical system keys
-- Proper cleanup via unblock_key
-- Graceful handling of invalid scan codes
+- Every scan code outside the unlock hotkeys is suppressed
+- Unlock hotkey (primary and emergency) keys are let through
+- Proper cleanup by removing the hook
 """
 
+import threading
 import unittest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
-from src.main import PawGateCore, EXTENDED_SCAN_CODES
+import keyboard
+
+from src.main import PawGateCore
+from src.util.hotkey_util import parse_hotkey_keys
 
 # Tests intentionally touch semi-private helpers for coverage
 # pylint: disable=protected-access
 
 
+# Scan codes the lock hook must let through for the default test hotkeys
+# Primary hotkey: ctrl+shift+l ; Emergency: ctrl+alt+shift+u
+_HOTKEY_SCAN_CODES = frozenset({29, 285, 42, 54, 38, 56, 312, 22})
+
+# Every scan code the suppression sweep feeds the hook: the basic 0-255
+# range plus the extended brightness codes
+_SWEPT_SCAN_CODES = (*range(256), *range(0x100, 0x111))
+
+
+# Deterministic key name -> scan codes mapping used in place of the OS keymap
+# WHY module-level tuples: built once and shared, instead of a fresh dict
+# literal on every key_to_scan_codes() call
+_SCAN_MAP = {
+    'ctrl': (29,),
+    'left ctrl': (29,),
+    'right ctrl': (285,),
+    'shift': (42,),
+    'left shift': (42,),
+    'right shift': (54,),
+    'alt': (56,),
+    'left alt': (56,),
+    'right alt': (312,),
+    'l': (38,),
+    'u': (22,),
+}
+
+
+def _start_core_patches(owner, add_cleanup) -> None:
+    """
+    Patch PawGateCore's external dependencies and expose the mocks on owner.
+
+    Args:
+        owner: Test instance (per-test setup) or class (setUpClass)
+        add_cleanup: addCleanup or addClassCleanup, to stop each patch
+    """
+    # WHY one patch.multiple: a single target lookup and one batch of
+    # attribute swaps on src.main instead of a patcher per name. Thread is
+    # patched on its own because the module's threading.Event/Lock must stay
+    # real for the signalling the tests exercise.
+    # WHY spec_set: only the keyboard library's real attributes exist, so a
+    # misspelled call in main.py fails instead of auto-creating a child mock
+    # that silently records it
+    mock_keyboard = MagicMock(spec_set=keyboard)
+    patchers = (
+        patch('src.main.threading.Thread'),
+        patch.multiple(
+            'src.main',
+            keyboard=mock_keyboard,
+            check_lockfile=DEFAULT,
+            Config=DEFAULT,
+            HotkeyListener=DEFAULT,
+            send_notification_in_thread=DEFAULT,
+            clear_pressed_events=DEFAULT,
+            start_notification_worker=DEFAULT,
+        ),
+    )
+    started = []
+    for patcher in patchers:
+        started.append(patcher.start())
+        add_cleanup(patcher.stop)
+    owner.mock_thread, mocks = started
+
+    owner.mock_keyboard = mock_keyboard
+    owner.mock_check_lockfile = mocks['check_lockfile']
+    owner.mock_config = mocks['Config']
+    owner.mock_hotkey_listener = mocks['HotkeyListener']
+    owner.mock_send_notification = mocks['send_notification_in_thread']
+
+    # Configure mock behavior
+    owner.mock_thread.return_value = Mock()
+    owner.mock_config.return_value.notifications_enabled = True
+    owner.mock_config.return_value.hotkey = 'ctrl+shift+l'
+    # WHY: Config derives hotkey_keys from hotkey; mirror that on the mock
+    type(owner.mock_config.return_value).hotkey_keys = property(
+        lambda config: parse_hotkey_keys(config.hotkey)
+    )
+
+    # The lock hook compares event types against the real constants
+    owner.mock_keyboard.KEY_UP = keyboard.KEY_UP
+
+    # Deterministic scan code mapping for hotkey parsing in tests
+    owner.mock_keyboard.key_to_scan_codes.side_effect = lambda name: _SCAN_MAP.get(name, ())
+
+
 class TestKeyboardController(unittest.TestCase):
     """
     Integration tests for keyboard locking in PawGateCore.
 
     WHY: We test at the PawGateCore level (not isolated functions) because
     keyboard blocking requires coordination between state management
-    (blocked_keys set) and library calls (keyboard.block_key/unblock_key).
+    (the installed lock hook) and library calls (keyboard.hook/stash_state).
     This is true integration testing.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Set up test fixtures with mocked dependencies.
+        Patch PawGateCore's dependencies once for the whole class.
 
         WHY: We patch threading, keyboard library, and external dependencies
         to prevent:
@@ -42,173 +131,146 @@ class TestKeyboardController(unittest.TestCase):
         2. Real keyboard hooks (would block IDE/terminal)
         3. File I/O for lockfile operations
         4. System tray creation (requires GUI context)
+
+        The patched targets never change between tests, so they are applied
+        once and stopped by addClassCleanup(), even if a test fails.
         """
-        # Patch all external dependencies before instantiation
-        self.patcher_thread = patch('src.main.threading.Thread')
-        self.patcher_keyboard_lib = patch('src.main.keyboard')
-        self.patcher_check_lockfile = patch('src.main.check_lockfile')
-        self.patcher_config = patch('src.main.Config')
-        self.patcher_hotkey_listener = patch('src.main.HotkeyListener')
-        self.patcher_send_notification = patch('src.main.send_notification_in_thread')
-
-        self.mock_thread = self.patcher_thread.start()
-        self.mock_keyboard = self.patcher_keyboard_lib.start()
-        self.mock_check_lockfile = self.patcher_check_lockfile.start()
-        self.mock_config = self.patcher_config.start()
-        self.mock_hotkey_listener = self.patcher_hotkey_listener.start()
-        self.mock_send_notification = self.patcher_send_notification.start()
-
-        # Configure mock behavior
-        self.mock_thread.return_value = Mock()
-        self.mock_config.return_value.notifications_enabled = True
-        self.mock_config.return_value.hotkey = 'ctrl+shift+l'
+        _start_core_patches(cls, cls.addClassCleanup)
 
-        # Deterministic scan code mapping for hotkey parsing in tests
-        self.mock_keyboard.key_to_scan_codes.side_effect = lambda name: {
-            'ctrl': [29],
-            'left ctrl': [29],
-            'right ctrl': [285],
-            'shift': [42],
-            'left shift': [42],
-            'right shift': [54],
-            'alt': [56],
-            'left alt': [56],
-            'right alt': [312],
-            'l': [38],
-            'u': [22],
-        }.get(name, [])
+    def setUp(self) -> None:
+        """
+        Give each test clean mocks and a fresh PawGateCore.
+
+        WHY reset_mock() instead of re-patching: it clears the call history
+        the assertions read while keeping configured return values and the
+        scan code side_effect, so tests stay isolated without paying for
+        eight patch start/stop cycles each.
+        """
+        for mock in (
+            self.mock_thread,
+            self.mock_keyboard,
+            self.mock_check_lockfile,
+            self.mock_config,
+            self.mock_hotkey_listener,
+            self.mock_send_notification,
+        ):
+            mock.reset_mock()
+        # Tests reassign the hotkey; restore the default they all start from
+        self.mock_config.return_value.hotkey = 'ctrl+shift+l'
 
         # WHY: Create core after all patches are active to ensure
         # __init__ doesn't trigger real system interactions
         self.core = PawGateCore()
 
-    def tearDown(self) -> None:
+    def _lock_and_get_hook(self):
+        """Lock the keyboard and return the suppressing hook callback from __init__."""
+        self.core.lock_keyboard()
+        self.mock_keyboard.hook.assert_called_once()
+        self.assertEqual(self.mock_keyboard.hook.call_args.kwargs, {'suppress': True})
+        return self.mock_keyboard.hook.call_args.args[0]
+
+    @staticmethod
+    def _key_event(scan_code):
         """
-        Clean up all patches after each test.
+        Build the minimal keyboard event the lock hook inspects.
 
-        WHY: unittest.mock patches must be stopped to avoid leaking
-        mocks into subsequent tests. This is critical for test isolation.
+        WHY SimpleNamespace instead of Mock: the suppression sweep builds
+        hundreds of events, and a Mock costs far more to construct while
+        also hiding typos in the attributes the hook reads.
         """
-        self.patcher_thread.stop()
-        self.patcher_keyboard_lib.stop()
-        self.patcher_check_lockfile.stop()
-        self.patcher_config.stop()
-        self.patcher_hotkey_listener.stop()
-        self.patcher_send_notification.stop()
+        return SimpleNamespace(scan_code=scan_code, event_type='down')
 
-    def test_lock_keyboard_blocks_all_scan_codes(self) -> None:
+    def test_lock_keyboard_suppresses_all_scan_codes(self) -> None:
         """
-        Verify that lock_keyboard blocks all scan codes including extended brightness keys.
+        Verify that the lock hook swallows every scan code except the unlock hotkeys.
 
         WHY: Modern keyboards (especially non-US layouts) use extended
-        scan codes beyond the basic ASCII range. Testing the full 0-255
-        range ensures multimedia keys, F13-F24, and international keys
-        are blocked. This prevents sneaky cats from hitting Play/Pause!
+        scan codes beyond the basic ASCII range. Checking the full 0-255
+        range plus the extended brightness codes ensures multimedia keys,
+        F13-F24, and international keys are blocked. This prevents sneaky
+        cats from hitting Play/Pause!
         """
         # Act
-        self.core.lock_keyboard()
-
-        # Assert - verify expected scan codes were attempted (excluding unlock hotkeys)
-        block_key_calls = [
-            call_args for call_args in self.mock_keyboard.block_key.call_args_list
-            if isinstance(call_args[0][0], int)
-        ]
-
-        blocked_scan_codes = {call_args[0][0] for call_args in block_key_calls}
+        allow = self._lock_and_get_hook()
 
-        # Primary hotkey: ctrl+shift+l ; Emergency: left ctrl + right ctrl
-        skipped_for_hotkeys = {29, 285, 42, 54, 38}
-        attempted_codes = (set(range(256)) - skipped_for_hotkeys) | set(EXTENDED_SCAN_CODES)
+        # WHY one set comparison: a single assertion instead of one
+        # assertEqual (and formatted message) per swept code, and a failure
+        # still lists exactly which codes leaked or were wrongly swallowed
+        passed = frozenset(code for code in _SWEPT_SCAN_CODES if allow(self._key_event(code)))
+        self.assertEqual(passed, _HOTKEY_SCAN_CODES.intersection(_SWEPT_SCAN_CODES))
 
-        self.assertEqual(
-            attempted_codes,
-            blocked_scan_codes,
-            f"Expected {len(attempted_codes)} scan codes, got {len(blocked_scan_codes)}",
-        )
+        # WHY: The per-key block_key() loop is gone; one hook covers everything
+        self.mock_keyboard.block_key.assert_not_called()
 
-    def test_lock_keyboard_blocks_critical_keys_by_name(self) -> None:
+    def test_lock_keyboard_suppresses_critical_keys(self) -> None:
         """
-        Verify that lock_keyboard blocks critical system keys by name.
+        Verify that critical system keys are suppressed while locked.
 
-        WHY: Some keys (Windows key, media controls) are more reliably
-        blocked by name than scan code due to driver/OS variations.
-        This test ensures we use the belt-and-suspenders approach.
+        WHY: The Windows key and media controls used to need separate
+        by-name blocks. The hook rejects anything not explicitly allowed,
+        so they're covered even when their scan codes fall outside 0-255.
 
         Real-world impact: Prevents cats from:
         - Opening Start menu (Windows key)
         - Changing volume/brightness
         - Playing/pausing media (Spotify interruption during standups!)
         """
-        # Act
-        self.core.lock_keyboard()
+        allow = self._lock_and_get_hook()
 
-        # Assert - verify named keys were blocked
-        # WHY: Filter to string arguments to isolate named key calls
-        named_key_calls = [
-            call_args[0][0] for call_args in self.mock_keyboard.block_key.call_args_list
-            if isinstance(call_args[0][0], str)
-        ]
-
-        # WHY: These are the exact keys from the implementation that
-        # are most dangerous for cats to press
-        expected_critical_keys = [
-            'windows', 'left windows', 'right windows',
-            'volume up', 'volume down', 'volume mute',
-            'play/pause media', 'next track', 'previous track',
-            'brightness up', 'brightness down',
-        ]
-
-        for critical_key in expected_critical_keys:
-            self.assertIn(
-                critical_key,
-                named_key_calls,
-                f"Critical key '{critical_key}' was not blocked"
-            )
+        # Left/right Windows, volume mute, play/pause (extended-flagged codes)
+        for code in (91, 92, 0xE05B, 0x120, 0x122):
+            self.assertFalse(allow(self._key_event(code)), f"Scan code {code} was not suppressed")
+
+    def test_swallowed_key_up_is_reported_to_hotkey_listener(self) -> None:
+        """
+        Verify the lock hook tells the listener about key-ups it swallows.
 
-    def test_unlock_keyboard_clears_blocked_keys(self) -> None:
+        WHY: HotkeyListener's hook runs after this one and never sees a
+        swallowed event. A modifier released during the lock would stay
+        "held" there and stop the hotkey matching after unlock.
         """
-        Verify that unlock_keyboard properly cleans up all blocked keys.
+        allow = self._lock_and_get_hook()
+        release_key = self.core.hotkey_listener.release_key
 
-        WHY: Failing to unblock keys would leave the keyboard in a broken
-        state after the program exits. This is a catastrophic failure mode
-        that requires a reboot to fix. We MUST test this!
+        self.assertFalse(allow(self._key_event(30)))
+        release_key.assert_not_called()
+
+        self.assertFalse(allow(SimpleNamespace(scan_code=30, event_type=keyboard.KEY_UP)))
+        release_key.assert_called_once_with(30)
+
+        # Unlock keys pass through to the listener's own hook instead
+        self.assertTrue(allow(SimpleNamespace(scan_code=38, event_type=keyboard.KEY_UP)))
+        release_key.assert_called_once()
+
+    def test_unlock_keyboard_lets_keys_through(self) -> None:
+        """
+        Verify that unlock_keyboard stops the hook from swallowing keys.
+
+        WHY: Failing to unblock would leave the keyboard in a broken state
+        after unlocking. This is a catastrophic failure mode that requires
+        a reboot to fix. We MUST test this!
 
         Test approach:
-        1. Lock keyboard (populates blocked_keys set)
+        1. Lock keyboard (hook starts suppressing)
         2. Unlock keyboard
-        3. Verify unblock_key called for each blocked key
-        4. Verify blocked_keys set is cleared
+        3. Verify the hook passes every key again
+        4. Verify the hook stays installed for the next lock
         """
-        # Arrange - simulate successful blocking of some keys
-        # WHY: Only keys that were successfully blocked get added to
-        # blocked_keys set, so we simulate this behavior
-        test_scan_codes = [1, 2, 3, 28, 57]  # Representative sample
-        self.core.blocked_keys = set(test_scan_codes)
+        # Arrange
+        allow = self._lock_and_get_hook()
+        self.assertFalse(allow(self._key_event(30)))
 
         # Act
         self.core.unlock_keyboard()
 
-        # Assert - verify each key was unblocked
-        # WHY: We must call unblock_key for each key that was blocked,
-        # otherwise those keys remain hooked by the keyboard library
-        unblock_calls = [
-            call_args[0][0] for call_args in self.mock_keyboard.unblock_key.call_args_list
-        ]
-
-        for scan_code in test_scan_codes:
-            self.assertIn(
-                scan_code,
-                unblock_calls,
-                f"Scan code {scan_code} was not unblocked"
-            )
+        # Assert - every key passes, without reinstalling or removing hooks
+        for code in (30, 91, 0x122):
+            self.assertTrue(allow(self._key_event(code)))
+        self.mock_keyboard.hook.assert_called_once()
+        self.mock_keyboard.hook.return_value.assert_not_called()
 
-        # Assert - verify blocked_keys set was cleared
-        # WHY: Cleared set indicates clean state for potential re-lock
-        self.assertEqual(
-            len(self.core.blocked_keys),
-            0,
-            "blocked_keys set should be empty after unlock"
-        )
+        # WHY: unhook_all() would also drop the hotkeys and the cleaner hook
+        self.mock_keyboard.unhook_all.assert_not_called()
 
         # Assert - verify keyboard.stash_state() was called
         # WHY: stash_state() clears any lingering key press events in the
@@ -216,56 +278,266 @@ class TestKeyboardController(unittest.TestCase):
         # can "stick" after unlock (see GitHub issue #223)
         self.mock_keyboard.stash_state.assert_called_once()
 
-    def test_lock_handles_invalid_scan_codes(self) -> None:
+    def test_hook_passes_keys_while_unlocked(self) -> None:
+        """
+        Verify the permanent hook never suppresses anything while unlocked.
+
+        WHY: The hook is installed at startup and sees every keystroke for
+        the app's whole lifetime; it must be a pure pass-through until
+        lock_keyboard() runs.
         """
-        Verify that lock_keyboard gracefully handles keyboard.block_key exceptions.
+        allow = self.mock_keyboard.hook.call_args.args[0]
 
-        WHY: Not all scan codes map to physical keys on all keyboards.
-        block_key(177) might work on a Logitech keyboard but throw on
-        a Microsoft keyboard. We MUST handle this gracefully via try/except,
-        otherwise the entire lock operation fails.
+        for code in (30, 38, 91):
+            self.assertTrue(allow(self._key_event(code)))
 
-        Test approach:
-        - Simulate keyboard.block_key raising exception for some scan codes
-        - Verify lock_keyboard completes without crashing
-        - Verify successful blocks are recorded in blocked_keys
-        """
-        # Arrange - simulate block_key failing for certain scan codes
-        # WHY: Real keyboards have gaps in their scan code mappings
-        failing_scan_codes = {100, 150, 200}
-
-        def block_key_side_effect(key):
-            """Simulate intermittent block_key failures."""
-            if isinstance(key, int) and key in failing_scan_codes:
-                raise KeyError(f"Invalid scan code: {key}")
-            # Otherwise succeed silently
-            return None
-
-        self.mock_keyboard.block_key.side_effect = block_key_side_effect
-
-        # Act - should NOT raise exception
-        try:
-            self.core.lock_keyboard()
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            self.fail(f"lock_keyboard raised exception: {exc}")
-
-        # Assert - verify successful blocks were recorded
-        # WHY: Can't directly compare sets because named keys also get blocked
-        # Just verify the failing codes are NOT in blocked_keys
-        for failing_code in failing_scan_codes:
-            self.assertNotIn(
-                failing_code,
-                self.core.blocked_keys,
-                f"Failing scan code {failing_code} should not be in blocked_keys"
+    def test_lock_keyboard_allows_hotkey_keys(self) -> None:
+        """
+        Verify that the lock hook lets the hotkey keys through.
+
+        WHY: This is the critical fix for the lockout bug. If we block ALL
+        keys without exempting the hotkey keys, the user cannot press the
+        hotkey to unlock. This test ensures the fix works.
+
+        Real-world impact: Without this fix, users had to reboot their
+        machine to regain keyboard control. That's a TERRIBLE user experience.
+        """
+        # Arrange - set a known hotkey
+        self.core.config.hotkey = 'alt+u'
+
+        # Act
+        allow = self._lock_and_get_hook()
+
+        # WHY: These are the scan codes that MUST pass for Alt+U to work
+        for code in (56, 312, 22):
+            self.assertTrue(
+                allow(self._key_event(code)),
+                f"Hotkey scan code {code} was suppressed - user would be locked out!"
             )
 
-        # Assert - verify some keys WERE successfully blocked
-        # WHY: We want to confirm the function didn't just silently fail
-        self.assertGreater(
-            len(self.core.blocked_keys),
-            0,
-            "Some keys should have been successfully blocked"
-        )
+    def test_lock_keyboard_allows_emergency_hotkey(self) -> None:
+        """Verify the built-in emergency hotkey keys are also let through."""
+        # Arrange - a primary hotkey without the emergency one's Alt, Shift or U
+        self.core.config.hotkey = 'ctrl+l'
+
+        # Act
+        allow = self._lock_and_get_hook()
+
+        # Assert - Alt, Shift and U must still reach the hotkey listener
+        for code in (56, 312, 42, 54, 22):
+            self.assertTrue(
+                allow(self._key_event(code)),
+                f"Emergency hotkey scan code {code} was suppressed"
+            )
+
+    def test_hotkey_scan_codes_cached_until_hotkey_changes(self) -> None:
+        """
+        Verify hotkey scan codes are resolved once per hotkey, not per lock.
+
+        WHY: Resolving names to scan codes on every lock is wasted work; the
+        cache must still follow hotkey changes so the new hotkey is never
+        blocked.
+        """
+        self.core.lock_keyboard()
+        calls_after_first_lock = self.mock_keyboard.key_to_scan_codes.call_count
+        self.core.lock_keyboard()
+
+        self.assertEqual(self.mock_keyboard.key_to_scan_codes.call_count, calls_after_first_lock)
+
+        self.core.config.hotkey = 'ctrl+u'
+        self.assertIn(22, self.core._get_hotkey_scan_codes())
+        self.assertNotIn(38, self.core._get_hotkey_scan_codes())
+
+    def test_quit_program_wakes_main_loop(self) -> None:
+        """
+        Verify quit_program sets the event that releases the blocking wait().
+
+        WHY: The main loop sleeps in show_overlay_event.wait() instead of
+        polling. wait() has no timeout, so without a wake-up signal start()
+        would never return.
+        """
+        with patch('src.main.remove_lockfile'):
+            self.core.quit_program(Mock(), None)
+
+        self.assertFalse(self.core.program_running)
+        self.assertTrue(self.core.show_overlay_event.is_set())
+
+        # start() must return without waiting once the program is stopped
+        self.core.start()
+
+    def test_start_does_not_remap_keys(self) -> None:
+        """
+        Verify start() installs no right-ctrl remap.
+
+        WHY: remap_key() adds a global hook that runs Python for every
+        keystroke the user types, for as long as PawGate runs.
+        """
+        self.core.program_running = False
+
+        self.core.start()
+
+        self.mock_keyboard.remap_key.assert_not_called()
+
+    def test_main_loop_coalesces_queued_lock_signals(self) -> None:
+        """
+        Verify several overlay signals open a single overlay.
+
+        WHY: Signals raised while we were already locking must collapse into
+        one, or each would show the overlay again after unlock.
+        """
+        for _ in range(3):
+            self.core.show_overlay_event.set()
+
+        def stop_after_open():
+            self.core.program_running = False
+
+        with patch('src.main.OverlayWindow') as mock_overlay:
+            mock_overlay.return_value.open.side_effect = stop_after_open
+            self.core.start()
+
+        mock_overlay.assert_called_once_with(main=self.core)
+        self.assertFalse(self.core.show_overlay_event.is_set())
+
+    def test_main_loop_reuses_overlay_across_locks(self) -> None:
+        """
+        Verify consecutive locks reuse one OverlayWindow and close it at exit.
+
+        WHY: Building a Tk root per lock re-initializes Tcl/Tk every time the
+        cat walks across the keyboard; the window should be hidden, not rebuilt.
+        """
+        opens = []
+
+        def lock_again_then_stop():
+            opens.append(True)
+            if len(opens) == 1:
+                self.core.show_overlay_event.set()
+            else:
+                self.core.program_running = False
+
+        self.core.show_overlay_event.set()
+        with patch('src.main.OverlayWindow') as mock_overlay:
+            mock_overlay.return_value.open.side_effect = lock_again_then_stop
+            self.core.start()
+
+        mock_overlay.assert_called_once_with(main=self.core)
+        self.assertEqual(mock_overlay.return_value.open.call_count, 2)
+        mock_overlay.return_value.close.assert_called_once()
+
+        # WHY: unlock_keyboard() stashes once; the lock path must not walk
+        # the pressed-key table again before every open()
+        self.mock_keyboard.stash_state.assert_not_called()
+
+    def test_hotkey_toggles_without_waiting_for_overlay(self) -> None:
+        """
+        Verify a second press before the overlay exists requests an unlock.
+
+        WHY: The toggle used to check self.root, which is only set once the
+        main thread builds the overlay. A quick double press signalled two
+        locks and the user's unlock was lost.
+        """
+        self.core.send_hotkey_signal()
+        self.assertTrue(self.core.show_overlay_event.is_set())
+        self.core.show_overlay_event.clear()  # As the main loop does on waking
+
+        self.core.send_hotkey_signal()
+
+        self.assertIsNone(self.core.root)
+        self.assertFalse(self.core.show_overlay_event.is_set(), "Second press must not lock again")
+        self.assertTrue(self.core.unlock_event.is_set())
+
+        self.core.unlock_keyboard()
+        self.core.send_hotkey_signal()
+
+        self.assertFalse(self.core.unlock_event.is_set())
+        self.assertTrue(self.core.show_overlay_event.is_set())
+
+    def test_unlock_press_wakes_overlay(self) -> None:
+        """
+        Verify a press while locked asks the overlay to handle the unlock.
+
+        WHY: The overlay no longer polls unlock_event; without the wake-up
+        the unlock would wait for some unrelated Tk event.
+        """
+        self.core.overlay = Mock()
+
+        self.core.send_hotkey_signal()
+        self.core.overlay.request_unlock.assert_not_called()
+
+        self.core.send_hotkey_signal()
+
+        self.assertTrue(self.core.unlock_event.is_set())
+        self.core.overlay.request_unlock.assert_called_once_with()
+
+
+class TestUnlockKeyboard(unittest.TestCase):
+    """
+    Tests for PawGateCore.unlock_keyboard() on a bare instance.
+
+    WHY skip __init__: unlock_keyboard() only touches the lock flags, the
+    overlay root and keyboard.stash_state(). Building a full core would
+    run Config, tray, hook and hotkey setup that these tests never read.
+    """
+
+    def setUp(self) -> None:
+        """Patch the keyboard library and build a core with only unlock state."""
+        patcher = patch('src.main.keyboard', MagicMock(spec_set=keyboard))
+        self.mock_keyboard = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.core = PawGateCore.__new__(PawGateCore)
+        self.core.keys_blocked = True
+        self.core.root = None
+        self.core.hotkey_lock = threading.Lock()
+        self.core.locked = True
+        self.core.unlock_event = threading.Event()
+        self.core.unlock_event.set()
+
+    def test_unlock_hides_overlay_instead_of_destroying(self) -> None:
+        """
+        Verify unlock withdraws the window and ends its mainloop.
+
+        WHY: Destroying the root would force the next lock to rebuild it.
+        """
+        root = Mock()
+        self.core.root = root
+
+        self.core.unlock_keyboard()
+
+        root.withdraw.assert_called_once()
+        root.quit.assert_called_once()
+        root.destroy.assert_not_called()
+        self.assertIsNone(self.core.root)
+
+    def test_unlock_resets_lock_state(self) -> None:
+        """
+        Verify unlock clears the lock flags and the keyboard library's state.
+
+        WHY: A leftover unlock_event or locked flag would make the next
+        hotkey press unlock instead of lock.
+        """
+        self.core.unlock_keyboard()
+
+        self.assertFalse(self.core.keys_blocked)
+        self.assertFalse(self.core.locked)
+        self.assertFalse(self.core.unlock_event.is_set())
+        self.mock_keyboard.stash_state.assert_called_once_with()
+
+
+class TestHotkeyKeyParsing(unittest.TestCase):
+    """
+    Tests for PawGateCore._get_hotkey_keys() on one shared instance.
+
+    WHY setUpClass: These tests only set config.hotkey and read back the
+    parsed keys; they never lock, unlock or inspect mock call history. One
+    patched PawGateCore for the whole class saves re-patching and
+    re-constructing it per test.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Patch dependencies and build the shared core once for the class."""
+        _start_core_patches(cls, cls.addClassCleanup)
+        cls.core = PawGateCore()
 
     def test_get_hotkey_keys_parses_simple_hotkey(self) -> None:
         """
@@ -282,10 +554,7 @@ class TestKeyboardController(unittest.TestCase):
         keys = self.core._get_hotkey_keys()
 
         # Assert - should include ctrl variants and b
-        self.assertIn('b', keys)
-        self.assertIn('ctrl', keys)
-        self.assertIn('left ctrl', keys)
-        self.assertIn('right ctrl', keys)
+        self.assertLessEqual({'b', 'ctrl', 'left ctrl', 'right ctrl'}, frozenset(keys))
 
     def test_get_hotkey_keys_expands_all_modifiers(self) -> None:
         """
@@ -303,69 +572,16 @@ class TestKeyboardController(unittest.TestCase):
         keys = self.core._get_hotkey_keys()
 
         # Assert - should include all modifier variants
-        expected_keys = [
+        # WHY one set difference: reports every missing key at once instead
+        # of stopping at the first
+        expected_keys = frozenset({
             'ctrl', 'left ctrl', 'right ctrl',
             'shift', 'left shift', 'right shift',
             'alt', 'left alt', 'right alt',
             'f12'
-        ]
-        for expected_key in expected_keys:
-            self.assertIn(
-                expected_key,
-                keys,
-                f"Expected key '{expected_key}' not found in parsed hotkey"
-            )
-
-    def test_lock_keyboard_unblocks_hotkey_keys(self) -> None:
-        """
-        Verify that lock_keyboard unblocks hotkey keys after blocking all.
-
-        WHY: This is the critical fix for the lockout bug. If we block ALL
-        keys (scan codes 0-255) without unblocking the hotkey keys, the user
-        cannot press Ctrl+B to unlock. This test ensures the fix works.
-
-        Real-world impact: Without this fix, users had to reboot their
-        machine to regain keyboard control. That's a TERRIBLE user experience.
-        """
-        # Arrange - set a known hotkey
-        self.core.config.hotkey = 'ctrl+b'
-
-        # Act
-        self.core.lock_keyboard()
-
-        # Assert - verify unblock_key was called for hotkey keys
-        unblock_calls = [
-            call_args[0][0] for call_args in self.mock_keyboard.unblock_key.call_args_list
-        ]
-
-        # WHY: These are the keys that MUST be unblocked for Ctrl+B to work
-        required_unblocked = ['ctrl', 'left ctrl', 'right ctrl', 'b']
-        for key in required_unblocked:
-            self.assertIn(
-                key,
-                unblock_calls,
-                f"Hotkey key '{key}' was not unblocked - user would be locked out!"
-            )
-
-    def test_lock_keyboard_unblocks_emergency_hotkey(self) -> None:
-        """Verify the built-in emergency hotkey keys are also unblocked."""
-        # Arrange - use defaults configured in setUp
-
-        # Act
-        self.core.lock_keyboard()
-
-        # Assert - emergency combo keys should be unblocked
-        unblock_calls = [
-            call_args[0][0] for call_args in self.mock_keyboard.unblock_key.call_args_list
-        ]
-
-        emergency_keys = ['left ctrl', 'right ctrl']
-        for key in emergency_keys:
-            self.assertIn(
-                key,
-                unblock_calls,
-                f"Emergency hotkey key '{key}' was not unblocked"
-            )
+        })
+        missing = expected_keys - frozenset(keys)
+        self.assertFalse(missing, f"Expected keys {sorted(missing)} not found in parsed hotkey")
 
 
 if __name__ == '__main__':
@@ -6,11 +6,28 @@ They catch import errors, basic instantiation failures, and environment
 issues before running the full test suite. Fast feedback loop is critical.
 """
 
+import importlib
+
 import pytest  # type: ignore  # pylint: disable=import-error
 
 # Allow deferred imports inside tests and fixture args that are intentionally unused
 # pylint: disable=import-error,import-outside-toplevel,unused-argument
 
+# Every module the app loads; importlib returns the sys.modules entry
+# directly for any that an earlier test already imported
+_CORE_MODULES = (
+    'src.config.config',
+    'src.main',
+    'src.keyboard_controller.hotkey_listener',
+    'src.keyboard_controller.pressed_events_handler',
+    'src.os_controller.notifications',
+    'src.os_controller.tray_icon',
+    'src.ui.overlay_window',
+    'src.util.lockfile_handler',
+    'src.util.path_util',
+    'src.util.web_browser_util',
+)
+
 
 def test_imports_succeed():
     """
@@ -23,67 +40,13 @@ def test_imports_succeed():
     This is the most basic smoke test - if imports fail, nothing else
     will work. Run this first to fail fast.
     """
-    # WHY: Use try-except to provide informative error messages
-    # about which specific import failed
-    try:
-        import src.config.config
-        assert src.config.config is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.config.config: {e}")
-
-    try:
-        import src.main
-        assert src.main is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.main: {e}")
-
-    try:
-        import src.keyboard_controller.hotkey_listener
-        assert src.keyboard_controller.hotkey_listener is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.keyboard_controller.hotkey_listener: {e}")
-
-    try:
-        import src.keyboard_controller.pressed_events_handler
-        assert src.keyboard_controller.pressed_events_handler is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.keyboard_controller.pressed_events_handler: {e}")
-
-    try:
-        import src.os_controller.notifications
-        assert src.os_controller.notifications is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.os_controller.notifications: {e}")
-
-    try:
-        import src.os_controller.tray_icon
-        assert src.os_controller.tray_icon is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.os_controller.tray_icon: {e}")
-
-    try:
-        import src.ui.overlay_window
-        assert src.ui.overlay_window is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.ui.overlay_window: {e}")
-
-    try:
-        import src.util.lockfile_handler
-        assert src.util.lockfile_handler is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.util.lockfile_handler: {e}")
-
-    try:
-        import src.util.path_util
-        assert src.util.path_util is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.util.path_util: {e}")
-
-    try:
-        import src.util.web_browser_util
-        assert src.util.web_browser_util is not None
-    except ImportError as e:
-        pytest.fail(f"Failed to import src.util.web_browser_util: {e}")
+    # WHY: Catch per module to report which specific import failed
+    for name in _CORE_MODULES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            pytest.fail(f"Failed to import {name}: {e}")
+        assert module is not None
 
 
 def test_pawgate_core_initializes(
@@ -125,7 +88,7 @@ def test_pawgate_core_initializes(
     # WHY: Instantiation itself exercises significant initialization logic:
     # - Config loading and parsing
     # - Thread creation (mocked)
-    # - Queue initialization
+    # - Event initialization
     # - Lock object creation
     try:
         core = PawGateCore()
@@ -135,14 +98,14 @@ def test_pawgate_core_initializes(
     # WHY: Verify critical attributes exist and have correct types
     # These are needed for the application to function
     assert hasattr(core, 'config'), "PawGateCore missing 'config' attribute"
-    assert hasattr(core, 'hotkey_thread'), "PawGateCore missing 'hotkey_thread' attribute"
-    assert hasattr(core, 'show_overlay_queue'), "PawGateCore missing 'show_overlay_queue' attribute"
+    assert hasattr(core, 'hotkey_listener'), "PawGateCore missing 'hotkey_listener' attribute"
+    assert hasattr(core, 'show_overlay_event'), "PawGateCore missing 'show_overlay_event' attribute"
     assert hasattr(core, 'program_running'), "PawGateCore missing 'program_running' attribute"
-    assert hasattr(core, 'blocked_keys'), "PawGateCore missing 'blocked_keys' attribute"
+    assert hasattr(core, 'keys_blocked'), "PawGateCore missing 'keys_blocked' attribute"
 
     # WHY: Verify initial state is correct
     assert core.program_running is True, "program_running should start as True"
-    assert isinstance(core.blocked_keys, set), "blocked_keys should be a set"
+    assert core.keys_blocked is False, "keyboard should not start locked"
     assert core.config is not None, "config should be loaded"
 
     # NOTE: We don't assert mock_hotkey_listener.assert_called_once() because
@@ -50,7 +50,7 @@ def test_load_valid_config(
     """
     # WHY: Create a valid config file to test loading
     with open(mock_config_path, "w") as f:
-        json.dump(valid_config_data, f)
+        json.dump(dict(valid_config_data), f)
 
     # WHY: load() should read and parse the JSON successfully
     loaded_config = load()
@@ -65,7 +65,8 @@ def test_load_valid_config(
 def test_load_missing_config_uses_defaults(
     mock_config_path,
     mock_packaged_path,
-    partial_config_data
+    partial_config_data,
+    mock_open_about
 ):
     """
     Test that missing config keys fall back to default values.
@@ -82,10 +83,11 @@ def test_load_missing_config_uses_defaults(
         mock_config_path: Fixture providing temp config file path
         mock_packaged_path: Fixture mocking bundled resources
         partial_config_data: Fixture with incomplete config dict
+        mock_open_about: Fixture mocking browser opening
     """
     # WHY: Create a config file with some missing keys
     with open(mock_config_path, "w") as f:
-        json.dump(partial_config_data, f)
+        json.dump(dict(partial_config_data), f)
 
     # WHY: Config() should load without errors and use defaults
     # for missing keys
@@ -143,30 +145,36 @@ def test_config_save_persists_values(
     assert saved_data["notificationsEnabled"] is False, "notificationsEnabled not saved correctly"
 
 
-def test_config_survives_empty_file(
+@pytest.mark.parametrize("contents", [
+    pytest.param("", id="empty-file"),
+    pytest.param("{this is not valid json}", id="invalid-json"),
+])
+def test_config_survives_corrupt_file(
+    contents,
     mock_config_path,
     mock_packaged_path,
     mock_open_about
 ):
     """
-    Test that Config handles an empty JSON file gracefully.
+    Test that Config falls back to bundled defaults for an unreadable file.
 
-    WHY: Edge case where config file exists but is empty (0 bytes).
-    This can happen due to:
-    - Crash during write
+    WHY: Config file can become empty (0 bytes) or hold malformed JSON due to:
+    - Partial write from crash
     - Disk full scenario
-    - User manually deleting contents
+    - User manual editing
 
-    Config should fall back to bundled defaults without crashing.
+    Config should detect this and fall back to bundled defaults rather
+    than crashing the application. Both cases take the same recovery path,
+    so one parametrized test covers them.
 
     Args:
+        contents: Corrupt config file contents to write
         mock_config_path: Fixture providing temp config file path
         mock_packaged_path: Fixture mocking bundled resources
         mock_open_about: Fixture mocking browser opening
     """
-    # WHY: Create an empty file to simulate corruption
-    with open(mock_config_path, "w") as f:
-        pass  # Empty file
+    # WHY: Write the corrupt file that load() must recover from
+    Path(mock_config_path).write_text(contents)
 
     # WHY: Config() should not crash, should load bundled defaults
     config = Config()
@@ -177,68 +185,223 @@ def test_config_survives_empty_file(
     assert config.notifications_enabled is False, "Should fall back to bundled default notifications"
 
 
-def test_config_survives_invalid_json(
+def test_config_round_trip(
     mock_config_path,
     mock_packaged_path,
     mock_open_about
 ):
     """
-    Test that Config handles malformed JSON gracefully.
-
-    WHY: Config file can become corrupted due to:
-    - Partial write from crash
-    - User manual editing
-    - Disk errors
+    Test that saving and loading preserves all config values.
 
-    Config should detect invalid JSON and fall back to bundled defaults
-    rather than crashing the application.
+    WHY: This is a critical integration test for config persistence.
+    If values get corrupted during save/load cycle, user settings
+    will be lost. This test ensures no data loss occurs.
 
     Args:
         mock_config_path: Fixture providing temp config file path
         mock_packaged_path: Fixture mocking bundled resources
         mock_open_about: Fixture mocking browser opening
     """
-    # WHY: Create a file with invalid JSON
+    # WHY: Create config with specific values
+    config1 = Config()
+    config1.hotkey = "ctrl+alt+l"
+    config1.opacity = 0.8
+    config1.notifications_enabled = True
+    config1.save()
+
+    # WHY: Load a fresh config from the saved file
+    config2 = Config()
+
+    # WHY: Verify all values match after round-trip
+    assert config2.hotkey == "ctrl+alt+l", "Hotkey lost during round-trip"
+    assert config2.opacity == 0.8, "Opacity lost during round-trip"
+    assert config2.notifications_enabled is True, "Notifications setting lost during round-trip"
+
+
+def test_load_is_memoized(
+    mock_config_path,
+    mock_packaged_path,
+    valid_config_data
+):
+    """
+    Test that load() parses the config file once and serves later calls from cache.
+
+    WHY: Config() may be constructed more than once (tests, tray recreation).
+    Only the first construction should pay for the file read and JSON parse;
+    load.cache_clear() is the explicit way to force a re-read.
+
+    Args:
+        mock_config_path: Fixture providing temp config file path
+        mock_packaged_path: Fixture mocking bundled resources
+        valid_config_data: Fixture with valid config dictionary
+    """
     with open(mock_config_path, "w") as f:
-        f.write("{this is not valid json}")
+        json.dump(dict(valid_config_data), f)
 
-    # WHY: Config() should not crash, should load bundled defaults
+    first = load()
+
+    # WHY: Change the file behind load()'s back - the cache should not notice
+    with open(mock_config_path, "w") as f:
+        json.dump({**valid_config_data, "hotkey": "ctrl+alt+m"}, f)
+
+    assert load() is first, "Second load() should return the cached dict"
+
+    # WHY: After clearing the cache the new file contents are picked up
+    load.cache_clear()
+    assert load()["hotkey"] == "ctrl+alt+m"
+
+
+def test_config_save_is_atomic_and_compact(
+    mock_config_path,
+    mock_packaged_path,
+    mock_open_about
+):
+    """
+    Test that save() replaces the config via a temp file and writes compact JSON.
+
+    WHY: Writing through config.json.tmp + os.replace() means a crash mid-save
+    can never leave a truncated config behind. The temp file must not linger
+    after a successful save.
+
+    Args:
+        mock_config_path: Fixture providing temp config file path
+        mock_packaged_path: Fixture mocking bundled resources
+        mock_open_about: Fixture mocking browser opening
+    """
     config = Config()
+    config.opacity = 0.5
+    config.save()
 
-    # WHY: Verify defaults were loaded from bundled config
-    assert config.hotkey == "ctrl+b"
-    assert config.opacity == 0.3
-    assert config.notifications_enabled is False
+    assert not os.path.exists(str(mock_config_path) + ".tmp"), "Temp file should be renamed away"
 
+    raw = Path(mock_config_path).read_text()
+    assert ", " not in raw and ": " not in raw, f"Expected compact JSON, got {raw!r}"
+    assert json.loads(raw)["opacity"] == 0.5
 
-def test_config_round_trip(
+
+def test_dev_mode_skips_rewrite_when_config_matches_bundled(
+    mock_config_path,
+    mock_packaged_path,
+    monkeypatch,
+    mocker
+):
+    """
+    Test that dev-mode reset leaves an identical user config untouched.
+
+    WHY: With PAWGATE_DEV set, load() resets to bundled defaults on every
+    launch. When the user file already holds exactly the bundled bytes,
+    rewriting it is a wasted disk write.
+
+    Args:
+        mock_config_path: Fixture providing temp config file path
+        mock_packaged_path: Fixture mocking bundled resources
+        monkeypatch: pytest fixture for setting the dev env var
+        mocker: pytest-mock fixture for spying on file writes
+    """
+    monkeypatch.setenv("PAWGATE_DEV", "1")
+    bundled = (mock_packaged_path / "resources" / "config" / "config.json").read_bytes()
+    Path(mock_config_path).write_bytes(bundled)
+
+    write_spy = mocker.spy(Path, "write_bytes")
+
+    assert load() == json.loads(bundled)
+    write_spy.assert_not_called()
+
+
+def test_about_page_opens_only_on_first_run(
     mock_config_path,
     mock_packaged_path,
     mock_open_about
 ):
     """
-    Test that saving and loading preserves all config values.
+    Test that the about page opens once, gated by the .welcomed marker.
 
-    WHY: This is a critical integration test for config persistence.
-    If values get corrupted during save/load cycle, user settings
-    will be lost. This test ensures no data loss occurs.
+    WHY: Spawning a browser on every launch would be disruptive. The marker
+    file next to config.json records that the user has been welcomed.
 
     Args:
         mock_config_path: Fixture providing temp config file path
         mock_packaged_path: Fixture mocking bundled resources
         mock_open_about: Fixture mocking browser opening
     """
-    # WHY: Create config with specific values
-    config1 = Config()
-    config1.hotkey = "ctrl+alt+l"
-    config1.opacity = 0.8
-    config1.notifications_enabled = True
-    config1.save()
+    Config()
+    Config()
 
-    # WHY: Load a fresh config from the saved file
-    config2 = Config()
+    mock_open_about.assert_called_once()
+    assert (Path(mock_config_path).parent / ".welcomed").exists()
 
-    # WHY: Verify all values match after round-trip
-    assert config2.hotkey == "ctrl+alt+l", "Hotkey lost during round-trip"
-    assert config2.opacity == 0.8, "Opacity lost during round-trip"
-    assert config2.notifications_enabled is True, "Notifications setting lost during round-trip"
+
+def test_about_page_not_opened_when_upgrading(
+    mock_config_file,
+    mock_packaged_path,
+    mock_open_about
+):
+    """
+    Test that an existing config without the marker counts as already welcomed.
+
+    WHY: Releases before the .welcomed marker never wrote it. Users upgrading
+    from them already have a config.json and must not see the about page
+    again; the marker is created silently instead.
+
+    Args:
+        mock_config_file: Fixture providing an existing temp config file
+        mock_packaged_path: Fixture mocking bundled resources
+        mock_open_about: Fixture mocking browser opening
+    """
+    Config()
+
+    mock_open_about.assert_not_called()
+    assert (Path(mock_config_file).parent / ".welcomed").exists()
+
+
+def test_unsaved_changes_stay_on_their_instance(
+    mock_config_path,
+    mock_packaged_path,
+    mock_open_about
+):
+    """
+    Test that only saved values reach later Config instances.
+
+    WHY: load() returns one cached dict per process. If instances edited it
+    directly, a setting changed but never saved would leak into every later
+    Config() and be written out by an unrelated save().
+
+    Args:
+        mock_config_path: Fixture providing temp config file path
+        mock_packaged_path: Fixture mocking bundled resources
+        mock_open_about: Fixture mocking browser opening
+    """
+    config = Config()
+    config.opacity = 0.9
+
+    assert Config().opacity == 0.3, "Unsaved change leaked into a new instance"
+    assert load()["opacity"] == 0.3, "Unsaved change leaked into load()'s cache"
+
+    config.save()
+
+    assert Config().opacity == 0.9, "Saved change should reach new instances"
+
+
+def test_hotkey_keys_follow_hotkey_changes(
+    mock_config_path,
+    mock_packaged_path,
+    mock_open_about
+):
+    """
+    Test that Config.hotkey_keys expands modifiers and tracks the hotkey.
+
+    WHY: Locking reads hotkey_keys to decide which keys stay unblocked. A
+    stale parse after a hotkey change would block the new hotkey's keys and
+    lock the user out.
+
+    Args:
+        mock_config_path: Fixture providing temp config file path
+        mock_packaged_path: Fixture mocking bundled resources
+        mock_open_about: Fixture mocking browser opening
+    """
+    config = Config()
+
+    assert config.hotkey_keys == ("ctrl", "left ctrl", "right ctrl", "b")
+
+    config.hotkey = "Shift + K"
+    assert config.hotkey_keys == ("shift", "left shift", "right shift", "k")
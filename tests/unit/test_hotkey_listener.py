@@ -3,164 +3,305 @@ Unit tests for HotkeyListener module.
 
 WHY: HotkeyListener is the critical component that detects when the user
 presses the lock/unlock hotkey. If this fails, users can't control the app.
-These tests verify hotkey registration, callback invocation, and cleanup.
+These tests verify hotkey registration, matching, and cleanup.
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
-from queue import Queue
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
+from src.main import EMERGENCY_UNLOCK_HOTKEY
 
-class TestHotkeyListener:
+
+# Deterministic scan codes standing in for the OS keymap
+_SCAN_CODES = {
+    'left ctrl': (29,), 'right ctrl': (285,), 'ctrl': (29, 285),
+    'left shift': (42,), 'right shift': (54,), 'shift': (42, 54),
+    'left alt': (56,), 'right alt': (312,), 'alt': (56, 312),
+    'left windows': (91,), 'right windows': (92,),
+    'b': (48,), 'k': (37,), 'u': (22,),
+}
+
+# The same keys as the keyboard library reports them on Windows, where the
+# extended flag is not part of scan_code: both Ctrl keys are 29 and both
+# Alt keys are 56
+_WINDOWS_SCAN_CODES = {
+    **_SCAN_CODES,
+    'left ctrl': (29,), 'right ctrl': (29,), 'ctrl': (29,),
+    'left alt': (56,), 'right alt': (56,), 'alt': (56,),
+}
+
+
+def _parse_hotkey(hotkey, scan_codes=_SCAN_CODES):
+    """Mimic keyboard.parse_hotkey(): steps of keys of scan-code alternatives."""
+    return tuple(
+        tuple(scan_codes[name] for name in step.strip().split('+'))
+        for step in hotkey.split(',')
+    )
+
+
+def _down(scan_code):
+    return SimpleNamespace(event_type='down', scan_code=scan_code)
+
+
+def _up(scan_code):
+    return SimpleNamespace(event_type='up', scan_code=scan_code)
+
+
+class TestHotkeyListenerLifecycle:
     """
-    Unit tests for HotkeyListener class.
+    Tests for registering, matching and unregistering the hotkeys.
 
-    WHY: We mock the keyboard library because:
-    1. Real hotkey registration requires admin privileges on Windows
-    2. Would interfere with the developer's keyboard during tests
-    3. We want fast, isolated unit tests
+    WHY: Hotkeys are matched in one suppressing keyboard hook installed on
+    the caller's thread (no listener thread, no add_hotkey()). A leaked hook
+    would keep firing after shutdown, and a matcher bug either swallows the
+    user's typing or leaves them unable to unlock.
     """
 
     @pytest.fixture
     def mock_keyboard(self, mocker):
-        """Mock keyboard library to prevent real hotkey registration."""
+        """Mock keyboard library with a deterministic scan-code table."""
         mock_kb = mocker.patch('src.keyboard_controller.hotkey_listener.keyboard')
+        mock_kb.KEY_UP = 'up'
+        mock_kb.parse_hotkey.side_effect = _parse_hotkey
+        mock_kb.key_to_scan_codes.side_effect = lambda name, error_if_missing=True: _SCAN_CODES[name]
         return mock_kb
 
     @pytest.fixture
-    def sample_queue(self):
-        """Provide a queue for hotkey signals."""
-        return Queue()
+    def main(self):
+        """Provide the minimal PawGateCore surface the listener touches."""
+        import threading
+
+        return SimpleNamespace(
+            config=SimpleNamespace(hotkey="ctrl+b"),
+            send_hotkey_signal=Mock(),
+            hotkey_lock=threading.Lock(),
+            listen_for_hotkey=False,
+            emergency_hotkey=EMERGENCY_UNLOCK_HOTKEY,
+        )
+
+    @pytest.fixture
+    def listener(self, mock_keyboard, main):
+        """Provide a listener with its hotkeys registered."""
+        from src.keyboard_controller.hotkey_listener import HotkeyListener
+
+        listener = HotkeyListener(main)
+        listener.register_hotkeys()
+        return listener
 
-    def test_listener_registers_hotkey(self, mock_keyboard, sample_queue):
+    def test_unregister_removes_hook(self, mock_keyboard, main):
         """
-        Verify HotkeyListener registers the hotkey on initialization.
+        Verify registering installs one suppressing hook and unregistering removes it.
 
-        WHY: The hotkey must be registered for the app to respond to
-        user input. This is the core functionality.
+        WHY: Shutdown must not leave a dangling keyboard hook, and must not
+        touch hooks installed by anything else.
         """
+        import threading
+
         from src.keyboard_controller.hotkey_listener import HotkeyListener
 
-        hotkey = "ctrl+b"
-        listener = HotkeyListener(sample_queue, hotkey)
+        threads_before = threading.active_count()
+
+        listener = HotkeyListener(main)
+        listener.register_hotkeys()
+        assert main.listen_for_hotkey is True
+        assert threading.active_count() == threads_before, "Registering must not start a thread"
+        mock_keyboard.hook.assert_called_once_with(listener._on_key_event, suppress=True)
+        mock_keyboard.add_hotkey.assert_not_called()
 
-        # Verify keyboard.add_hotkey was called with correct args
-        mock_keyboard.add_hotkey.assert_called_once()
-        call_args = mock_keyboard.add_hotkey.call_args
-        assert call_args[0][0] == hotkey, f"Expected hotkey {hotkey}, got {call_args[0][0]}"
+        listener.unregister_hotkeys()
 
-    def test_listener_callback_puts_signal_in_queue(self, mock_keyboard, sample_queue):
+        assert main.listen_for_hotkey is False
+        mock_keyboard.hook.return_value.assert_called_once_with()
+        mock_keyboard.unhook_all.assert_not_called()
+        mock_keyboard.stash_state.assert_not_called()
+
+    def test_reregister_keeps_single_hook(self, mock_keyboard, listener):
         """
-        Verify that pressing the hotkey puts a signal in the queue.
+        Verify re-registering swaps the hotkeys without installing a second hook.
 
-        WHY: The main thread polls the queue to know when to toggle lock.
-        If the signal doesn't reach the queue, the app becomes unresponsive.
+        WHY: Two hooks would signal twice per press, toggling lock and unlock
+        in the same keystroke.
         """
-        from src.keyboard_controller.hotkey_listener import HotkeyListener
+        listener.register_hotkeys()
 
-        # Capture the callback when add_hotkey is called
-        callback = None
+        mock_keyboard.hook.assert_called_once()
+        mock_keyboard.hook.return_value.assert_not_called()
+        mock_keyboard.stash_state.assert_called_once()
 
-        def capture_callback(hotkey, cb, *args, **kwargs):
-            nonlocal callback
-            callback = cb
+    def test_hotkey_is_compiled_once_across_registrations(self, mock_keyboard, main, listener):
+        """
+        Verify each hotkey string is parsed once, and again only after it changes.
 
-        mock_keyboard.add_hotkey.side_effect = capture_callback
+        WHY: Parsing resolves key names through the OS keymap; re-registering
+        after an unrelated settings change should not repeat it.
+        """
+        listener.register_hotkeys()
 
-        listener = HotkeyListener(sample_queue, "ctrl+b")
+        parsed = [c.args[0] for c in mock_keyboard.parse_hotkey.call_args_list]
+        assert parsed == ["ctrl+b", EMERGENCY_UNLOCK_HOTKEY]
 
-        # Simulate hotkey press by calling the callback
-        assert callback is not None, "Callback was not registered"
-        callback()
+        listener.update_hotkey("ctrl+shift+k")
 
-        # Verify signal was added to queue
-        assert not sample_queue.empty(), "Queue should have a signal"
-        signal = sample_queue.get_nowait()
-        assert signal is True, "Signal should be True"
+        assert main.config.hotkey == "ctrl+shift+k"
+        assert mock_keyboard.parse_hotkey.call_args.args[0] == "ctrl+shift+k"
 
-    def test_listener_handles_complex_hotkeys(self, mock_keyboard, sample_queue):
+    def test_trigger_key_fires_once_and_is_suppressed(self, main, listener):
         """
-        Verify HotkeyListener handles complex modifier combinations.
+        Verify the hotkey fires on the trigger key-down and swallows its repeats.
 
-        WHY: Users may configure hotkeys like Ctrl+Shift+Alt+F12.
-        The listener must handle these correctly.
+        WHY: Returning False keeps Ctrl+B from also reaching the focused app,
+        and auto-repeat must not toggle lock/unlock while the key is held.
         """
-        from src.keyboard_controller.hotkey_listener import HotkeyListener
+        assert listener._on_key_event(_down(29)) is True
+        assert listener._on_key_event(_down(48)) is False
+        assert listener._on_key_event(_down(48)) is False
+        main.send_hotkey_signal.assert_called_once()
 
-        complex_hotkeys = [
-            "ctrl+shift+l",
-            "ctrl+alt+f12",
-            "ctrl+shift+alt+p",
-            "win+pause",
-        ]
+        assert listener._on_key_event(_up(48)) is True
+        assert listener._on_key_event(_down(48)) is False
+        assert main.send_hotkey_signal.call_count == 2
 
-        for hotkey in complex_hotkeys:
-            mock_keyboard.reset_mock()
-            listener = HotkeyListener(sample_queue, hotkey)
+        listener._on_key_event(_up(48))
+        listener._on_key_event(_up(29))
+        assert listener._on_key_event(_down(48)) is True, "B alone must reach the app"
+        assert main.send_hotkey_signal.call_count == 2
 
-            # Verify hotkey was registered
-            mock_keyboard.add_hotkey.assert_called_once()
-            call_args = mock_keyboard.add_hotkey.call_args
-            assert hotkey in str(call_args), f"Hotkey {hotkey} not found in call args"
+    def test_hook_does_not_take_hotkey_lock(self, main, listener):
+        """
+        Verify keystrokes are matched while a registration holds hotkey_lock.
+
+        WHY: The hook runs for every key the user types. It reads one
+        immutable tuple instead of locking, so a concurrent settings change
+        can never stall typing system-wide.
+        """
+        with main.hotkey_lock:
+            listener._on_key_event(_down(29))
+            assert listener._on_key_event(_down(48)) is False
 
-    def test_listener_cleanup_removes_hotkey(self, mock_keyboard, sample_queue):
+        main.send_hotkey_signal.assert_called_once()
+
+    def test_extra_modifier_prevents_match(self, main, listener):
         """
-        Verify that listener cleanup removes the registered hotkey.
+        Verify Ctrl+Alt+B does not fire a Ctrl+B hotkey.
 
-        WHY: If we don't clean up, the hotkey remains registered after
-        the app exits, potentially causing conflicts or zombie hooks.
+        WHY: add_hotkey() required exactly the hotkey's keys; other apps'
+        shortcuts that extend ours must keep working.
+        """
+        listener._on_key_event(_down(29))
+        listener._on_key_event(_down(56))
+
+        assert listener._on_key_event(_down(48)) is True
+        main.send_hotkey_signal.assert_not_called()
+
+    def test_emergency_hotkey_fires(self, main, listener):
+        """
+        Verify the emergency hotkey fires alongside the configured one.
+
+        WHY: It is the escape hatch when the configured hotkey is unusable.
+        """
+        for code in (29, 56, 42):  # Ctrl, Alt, Shift
+            assert listener._on_key_event(_down(code)) is True
+
+        assert listener._on_key_event(_down(22)) is False
+        main.send_hotkey_signal.assert_called_once()
+
+    def test_windows_scan_codes_never_fire_on_single_ctrl(self, mock_keyboard, main):
+        """
+        Verify a plain Ctrl press is never taken for a hotkey on Windows.
+
+        WHY: Windows reports left and right Ctrl as the same scan code. A
+        "left ctrl+right ctrl" hotkey compiled anyway would fire (and swallow
+        Ctrl) on every single Ctrl press, breaking Ctrl+C and friends, so it
+        must be rejected; the built-in emergency hotkey must stay usable.
         """
         from src.keyboard_controller.hotkey_listener import HotkeyListener
 
-        listener = HotkeyListener(sample_queue, "ctrl+b")
+        mock_keyboard.parse_hotkey.side_effect = lambda hotkey: _parse_hotkey(hotkey, _WINDOWS_SCAN_CODES)
+        mock_keyboard.key_to_scan_codes.side_effect = (
+            lambda name, error_if_missing=True: _WINDOWS_SCAN_CODES[name]
+        )
 
-        # Trigger cleanup (implementation-dependent)
-        if hasattr(listener, 'stop'):
-            listener.stop()
-        elif hasattr(listener, 'cleanup'):
-            listener.cleanup()
+        with pytest.raises(ValueError):
+            HotkeyListener(main)._compile("left ctrl+right ctrl")
 
-        # Note: The actual cleanup method depends on implementation
-        # This test documents the expected behavior
+        listener = HotkeyListener(main)
+        listener.register_hotkeys()
 
+        assert listener._on_key_event(_down(29)) is True, "Ctrl must reach the app"
+        assert listener._on_key_event(_down(46)) is True, "Ctrl+C must reach the app"
+        main.send_hotkey_signal.assert_not_called()
 
-class TestHotkeyParsing:
-    """
-    Tests for hotkey string parsing functionality.
+        listener._on_key_event(_up(46))
+        for code in (56, 42):  # Ctrl is still held; add Alt and Shift
+            listener._on_key_event(_down(code))
+        assert listener._on_key_event(_down(22)) is False
+        main.send_hotkey_signal.assert_called_once()
 
-    WHY: Hotkey strings from config need to be parsed correctly.
-    Invalid hotkeys should be handled gracefully.
-    """
+    def test_key_released_while_locked_does_not_block_hotkey(self, main, listener):
+        """
+        Verify a key-up swallowed by the lock hook still clears the held key.
+
+        WHY: The lock hook runs first and drops the key-up of any key that
+        isn't an unlock key, so this hook never sees it. PawGateCore reports
+        it through release_key(); without that, a Shift held as the lock
+        started would count as an extra modifier and Ctrl+B would stop
+        matching after unlock.
+        """
+        listener._on_key_event(_down(42))  # Shift held as the lock starts
+        listener.release_key(42)           # Its key-up, swallowed while locked
 
-    def test_parse_simple_hotkey(self):
-        """Verify simple hotkey parsing."""
-        # This would test a parse function if exposed
-        # For now, test via HotkeyListener behavior
-        pass
+        listener._on_key_event(_down(29))
+        assert listener._on_key_event(_down(48)) is False
+        main.send_hotkey_signal.assert_called_once()
 
-    def test_invalid_hotkey_handled_gracefully(self, mocker):
+    def test_multi_step_hotkey_rejected(self, mock_keyboard, main):
         """
-        Verify invalid hotkeys don't crash the application.
+        Verify a multi-step hotkey raises instead of registering something else.
 
-        WHY: Users might typo their hotkey config. The app should
-        handle this gracefully, perhaps with a warning or default.
+        WHY: The matcher handles one combination; silently matching only part
+        of "ctrl+b, k" would lock on an unexpected keystroke.
         """
+        from src.keyboard_controller.hotkey_listener import HotkeyListener
+
+        main.config.hotkey = "ctrl+b, k"
+
+        with pytest.raises(ValueError):
+            HotkeyListener(main).register_hotkeys()
+        mock_keyboard.hook.assert_not_called()
+
+
+class TestHotkeyParsing:
+    """
+    Tests for how hotkey strings from config are compiled.
+
+    WHY: Users might typo their hotkey config. A hotkey that can't be parsed
+    must fail loudly at registration, before any hook is installed, rather
+    than leave a half-registered listener behind.
+    """
+
+    def test_invalid_hotkey_raises_before_hooking(self, mocker):
+        """Verify a hotkey the keyboard library rejects installs no hook."""
         mock_keyboard = mocker.patch('src.keyboard_controller.hotkey_listener.keyboard')
-        mock_keyboard.add_hotkey.side_effect = ValueError("Invalid hotkey")
+        mock_keyboard.key_to_scan_codes.return_value = ()
+        mock_keyboard.parse_hotkey.side_effect = ValueError("Invalid hotkey")
+
+        import threading
 
         from src.keyboard_controller.hotkey_listener import HotkeyListener
 
-        queue = Queue()
+        main = SimpleNamespace(
+            config=SimpleNamespace(hotkey="invalid+++hotkey"),
+            hotkey_lock=threading.Lock(),
+            listen_for_hotkey=False,
+        )
+
+        with pytest.raises(ValueError):
+            HotkeyListener(main).register_hotkeys()
 
-        # Should not raise - should handle gracefully
-        try:
-            listener = HotkeyListener(queue, "invalid+++hotkey")
-            # If it gets here without exception, that's acceptable
-        except ValueError:
-            # Also acceptable if it raises but is caught elsewhere
-            pass
+        mock_keyboard.hook.assert_not_called()
+        assert main.listen_for_hotkey is False
 
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ These tests verify notifications are sent correctly without
 actually displaying toast notifications during tests.
 """
 
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 import pytest
 
@@ -123,6 +123,57 @@ class TestNotifications:
         pass
 
 
+class TestNotificationWorker:
+    """
+    Tests for the long-lived notification worker.
+
+    WHY: Locking hands notifications to a single pre-started worker. The
+    hand-off must return immediately and the worker must survive plyer
+    failures, or later locks would silently lose their notifications.
+    """
+
+    def test_queued_notification_is_displayed_by_worker(self, mocker):
+        """
+        Verify send_notification_in_thread returns at once and the worker shows it.
+
+        WHY: The lock path must not wait on the notification API.
+        """
+        import threading
+
+        from src.os_controller import notifications
+
+        shown = threading.Event()
+        calls = []
+
+        def fake_send(hotkey):
+            calls.append(hotkey)
+            if len(calls) == 1:
+                raise RuntimeError("notifications unavailable")
+            shown.set()
+
+        mocker.patch.object(notifications, 'send_lock_notification', side_effect=fake_send)
+
+        notifications.send_notification_in_thread(True, "ctrl+l")
+        notifications.send_notification_in_thread(True, "ctrl+l")
+
+        assert shown.wait(timeout=1), "Worker should display the queued notification"
+        assert calls == ["ctrl+l", "ctrl+l"], "Worker should keep running after a failed notification"
+
+    def test_disabled_notifications_are_not_queued(self, mocker):
+        """
+        Verify nothing is queued when notifications are turned off.
+
+        WHY: Users can disable notifications in the tray menu.
+        """
+        from src.os_controller import notifications
+
+        put = mocker.patch.object(notifications._notification_queue, 'put_nowait')
+
+        notifications.send_notification_in_thread(False, "ctrl+l")
+
+        put.assert_not_called()
+
+
 class TestNotificationContent:
     """
     Tests for notification message content.
@@ -148,5 +199,122 @@ class TestNotificationContent:
         pass
 
 
+class TestLockNotificationBackend:
+    """
+    Tests for choosing between WinRT toasts and the plyer fallback.
+
+    WHY: winsdk is optional. Without it, locking must still notify via
+    plyer; with it, plyer must not be touched at all.
+    """
+
+    def test_uses_winrt_toast_when_available(self, mocker):
+        """Verify the cached WinRT notifier shows the toast and plyer is skipped."""
+        from src.os_controller import notifications
+
+        notifier = Mock()
+        mocker.patch.object(notifications, 'ToastNotificationManager', Mock(), create=True)
+        mocker.patch.object(notifications, 'ToastNotification', create=True)
+        mocker.patch.object(notifications, '_get_toast_notifier', return_value=notifier)
+        mocker.patch.object(notifications, '_get_toast_xml')
+        mock_notify = mocker.patch('plyer.notification.notify')
+
+        notifications.send_lock_notification("ctrl+l")
+        notifications.send_lock_notification("ctrl+l")
+
+        assert notifier.show.call_count == 2
+        mock_notify.assert_not_called()
+
+    def test_falls_back_to_plyer_without_winsdk(self, mocker):
+        """Verify plyer is used when winsdk could not be imported."""
+        from src.os_controller import notifications
+
+        mocker.patch.object(notifications, 'ToastNotificationManager', None)
+        mock_notify = mocker.patch('plyer.notification.notify')
+
+        notifications.send_lock_notification("ctrl+l")
+
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args.kwargs['title'] == "Keyboard Locked"
+
+    def test_falls_back_to_plyer_when_toasts_cannot_show(self, mocker):
+        """
+        Verify plyer is used when Windows won't show toasts for our app ID.
+
+        WHY: An unregistered app ID makes show() a silent no-op, so reading
+        notifier.setting raising must route the notification through plyer.
+        """
+        from src.os_controller import notifications
+
+        notifier = Mock()
+        type(notifier).setting = PropertyMock(side_effect=OSError("Element not found"))
+        manager = Mock()
+        manager.create_toast_notifier.return_value = notifier
+        mocker.patch.object(notifications, 'ToastNotificationManager', manager, create=True)
+        mocker.patch.object(notifications, 'NotificationSetting', create=True)
+        mocker.patch.object(notifications, '_toast_notifier', None)
+        mock_notify = mocker.patch('plyer.notification.notify')
+
+        notifications.send_lock_notification("ctrl+l")
+
+        notifier.show.assert_not_called()
+        mock_notify.assert_called_once()
+
+    def test_toasts_resume_once_windows_allows_them(self, mocker):
+        """
+        Verify a failed check is not remembered for the rest of the process.
+
+        WHY: Users can re-enable notifications while PawGate runs; the next
+        lock should use the native toast again instead of plyer.
+        """
+        from src.os_controller import notifications
+
+        setting = Mock()
+        notifier = Mock()
+        type(notifier).setting = PropertyMock(side_effect=[OSError("Element not found"), setting.ENABLED])
+        manager = Mock()
+        manager.create_toast_notifier.return_value = notifier
+        mocker.patch.object(notifications, 'ToastNotificationManager', manager, create=True)
+        mocker.patch.object(notifications, 'NotificationSetting', setting, create=True)
+        mocker.patch.object(notifications, '_toast_notifier', None)
+
+        assert notifications._get_toast_notifier() is None
+        assert notifications._get_toast_notifier() is notifier
+        manager.create_toast_notifier.assert_called_once()
+
+    def test_message_names_configured_hotkey(self, mocker):
+        """
+        Verify the unlock instructions come from the configured hotkey.
+
+        WHY: The hotkey is configurable; a fixed "Ctrl+B" would be wrong
+        for everyone using the default (ctrl+l) or a custom one.
+        """
+        from src.os_controller import notifications
+
+        mocker.patch.object(notifications, 'ToastNotificationManager', None)
+        mock_notify = mocker.patch('plyer.notification.notify')
+
+        notifications.send_lock_notification("ctrl+shift+l")
+
+        assert mock_notify.call_args.kwargs['message'] == "Press Ctrl+Shift+L to unlock"
+
+    def test_plyer_not_imported_at_module_import(self):
+        """
+        Verify importing the module leaves plyer unloaded.
+
+        WHY: plyer is only the fallback backend; startup shouldn't pay for it.
+        """
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys; import src.os_controller.notifications; "
+            "sys.exit('plyer' in sys.modules)"
+        )
+        repo_root = Path(__file__).resolve().parents[2]
+        result = subprocess.run([sys.executable, '-c', code], cwd=repo_root, check=False)
+        assert result.returncode == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,178 @@
+"""
+Unit tests for overlay_window module.
+
+WHY: The overlay must cover every monitor, and it is recomputed on each lock.
+These tests check the geometry without creating a real Tk window.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _monitor(x, y, width, height):
+    """Build a screeninfo-like monitor."""
+    return SimpleNamespace(x=x, y=y, width=width, height=height)
+
+
+class TestOverlayGeometry:
+    """
+    Tests for _get_overlay_geometry().
+
+    WHY: screeninfo enumerates monitors through the OS on every call, so the
+    result is cached until the display signature changes.
+    """
+
+    @pytest.fixture
+    def overlay_window(self, mocker):
+        """Provide the module with an empty geometry cache."""
+        from src.ui import overlay_window
+
+        mocker.patch.object(overlay_window, '_geometry_cache', None)
+        return overlay_window
+
+    def test_side_by_side_monitors(self, overlay_window, mocker):
+        """Verify two side-by-side monitors produce one wide window."""
+        mocker.patch.object(overlay_window, '_display_signature', return_value=None)
+        mocker.patch.object(overlay_window, 'get_monitors', return_value=[
+            _monitor(0, 0, 1920, 1080),
+            _monitor(1920, 0, 1920, 1080),
+        ])
+
+        assert overlay_window._get_overlay_geometry() == (3840, 1080, 0, 0)
+
+    def test_stacked_monitors(self, overlay_window, mocker):
+        """
+        Verify vertically stacked monitors produce one tall window.
+
+        WHY: Summing widths made this a 3840x1080 window that covered half of
+        the lower monitor and spilled off-screen to the right.
+        """
+        mocker.patch.object(overlay_window, '_display_signature', return_value=None)
+        mocker.patch.object(overlay_window, 'get_monitors', return_value=[
+            _monitor(0, 0, 1920, 1080),
+            _monitor(0, 1080, 1920, 1080),
+        ])
+
+        assert overlay_window._get_overlay_geometry() == (1920, 2160, 0, 0)
+
+    def test_offset_monitors(self, overlay_window, mocker):
+        """Verify monitors with negative and staggered origins are fully covered."""
+        mocker.patch.object(overlay_window, '_display_signature', return_value=None)
+        mocker.patch.object(overlay_window, 'get_monitors', return_value=[
+            _monitor(0, 0, 2560, 1440),
+            _monitor(-1920, 360, 1920, 1080),
+        ])
+
+        assert overlay_window._get_overlay_geometry() == (4480, 1440, -1920, 0)
+
+    def test_monitors_requeried_only_when_displays_change(self, overlay_window, mocker):
+        """
+        Verify screeninfo is only consulted again after the signature changes.
+
+        WHY: Most locks happen with the same displays attached; re-enumerating
+        them each time is wasted work on the lock path.
+        """
+        signature = mocker.patch.object(overlay_window, '_display_signature', return_value=(0, 0, 1920, 1080, 1))
+        get_monitors = mocker.patch.object(
+            overlay_window, 'get_monitors', return_value=[_monitor(0, 0, 1920, 1080)]
+        )
+
+        overlay_window._get_overlay_geometry()
+        overlay_window._get_overlay_geometry()
+        assert get_monitors.call_count == 1
+
+        signature.return_value = (0, 0, 3840, 1080, 2)
+        get_monitors.return_value = [_monitor(0, 0, 1920, 1080), _monitor(1920, 0, 1920, 1080)]
+
+        assert overlay_window._get_overlay_geometry() == (3840, 1080, 0, 0)
+        assert get_monitors.call_count == 2
+
+    def test_no_signature_always_requeries(self, overlay_window, mocker):
+        """Verify platforms without a display signature never use a stale cache."""
+        mocker.patch.object(overlay_window, '_display_signature', return_value=None)
+        get_monitors = mocker.patch.object(
+            overlay_window, 'get_monitors', return_value=[_monitor(0, 0, 1920, 1080)]
+        )
+
+        overlay_window._get_overlay_geometry()
+        overlay_window._get_overlay_geometry()
+
+        assert get_monitors.call_count == 2
+
+
+class TestUnlockSignal:
+    """
+    Tests for the <<Unlock>> handshake between the hotkey thread and Tk.
+
+    WHY: Unlocks are pushed into Tk instead of polled. A request made before
+    mainloop runs must neither block the hotkey thread nor be lost.
+    """
+
+    @pytest.fixture
+    def overlay(self):
+        """Provide an OverlayWindow with a mock root and a minimal main."""
+        import threading
+        from unittest.mock import Mock
+
+        from src.ui.overlay_window import OverlayWindow
+
+        main = SimpleNamespace(unlock_event=threading.Event(), unlock_keyboard=Mock())
+        overlay = OverlayWindow(main)
+        overlay.root = Mock()
+        return overlay
+
+    def test_request_before_mainloop_is_deferred(self, overlay):
+        """
+        Verify an early request makes no Tk call and is handled once mainloop starts.
+
+        WHY: A cross-thread Tk call with no running mainloop would stall the
+        keyboard hook thread.
+        """
+        overlay.main.unlock_event.set()
+        overlay.request_unlock()
+
+        overlay.root.event_generate.assert_not_called()
+
+        overlay._start_accepting_unlock()
+
+        overlay.main.unlock_keyboard.assert_called_once()
+        assert not overlay.main.unlock_event.is_set()
+        assert overlay.accepting_unlock is False
+
+    def test_request_while_running_queues_virtual_event(self, overlay):
+        """Verify a request during mainloop queues <<Unlock>> instead of polling."""
+        overlay._start_accepting_unlock()
+        overlay.main.unlock_keyboard.assert_not_called()
+
+        overlay.main.unlock_event.set()
+        overlay.request_unlock()
+
+        overlay.root.event_generate.assert_called_once_with('<<Unlock>>', when='tail')
+
+        overlay._handle_unlock()
+        overlay._handle_unlock()  # A duplicate wake-up must be harmless
+        overlay.main.unlock_keyboard.assert_called_once()
+
+    def test_unlock_waits_for_in_flight_request(self, overlay):
+        """
+        Verify the Tk side retries instead of quitting while a request is mid-call.
+
+        WHY: A request that passed its check must find mainloop still running
+        when its event_generate() lands, and the Tk thread must not block on
+        the lock, since the in-flight call needs that thread to complete.
+        """
+        overlay._start_accepting_unlock()
+        overlay.main.unlock_event.set()
+
+        with overlay._unlock_lock:  # request_unlock() between check and call
+            overlay._handle_unlock()
+
+        overlay.main.unlock_keyboard.assert_not_called()
+        assert overlay.accepting_unlock is True
+        overlay.root.after.assert_called_once_with(1, overlay._handle_unlock)
+
+        overlay._handle_unlock()  # The retry, once the request returned
+
+        overlay.main.unlock_keyboard.assert_called_once()
+        assert overlay.accepting_unlock is False
@@ -51,24 +51,43 @@ class TestGetPackagedPath:
         WHY: When bundled with PyInstaller, resources are extracted to
         a temp directory stored in sys._MEIPASS. We must use this path.
         """
-        from src.util.path_util import get_packaged_path
+        from src.util.path_util import _resolve_base
 
         # Simulate PyInstaller environment
         fake_meipass = "/tmp/fake_meipass_12345"
         mocker.patch.object(sys, '_MEIPASS', fake_meipass, create=True)
 
-        # Also need to patch hasattr check
-        original_hasattr = hasattr
+        assert _resolve_base() == fake_meipass
+
+    def test_development_base_is_absolute_project_root(self):
+        """
+        Verify the development base is the absolute project root.
+
+        WHY: Callers get absolute paths without get_packaged_path() calling
+        os.path.abspath() on every lookup.
+        """
+        from src.util.path_util import _resolve_base
+
+        if hasattr(sys, '_MEIPASS'):
+            pytest.skip("Running from a PyInstaller bundle")
+
+        base = _resolve_base()
+
+        assert os.path.isabs(base)
+        assert os.path.isfile(os.path.join(base, "src", "util", "path_util.py"))
+
+    def test_repeated_lookups_are_cached(self):
+        """
+        Verify the same relative path resolves to the identical string.
 
-        def patched_hasattr(obj, name):
-            if obj is sys and name == '_MEIPASS':
-                return True
-            return original_hasattr(obj, name)
+        WHY: Resources are looked up repeatedly; only the first lookup
+        should do any path work.
+        """
+        from src.util.path_util import get_packaged_path
 
-        mocker.patch('builtins.hasattr', patched_hasattr)
+        first = get_packaged_path("resources/img/icon.png")
 
-        # This test verifies the behavior when _MEIPASS exists
-        # The actual implementation may vary
+        assert get_packaged_path("resources/img/icon.png") is first
 
     def test_path_handles_special_characters(self):
         """
@@ -133,6 +152,24 @@ class TestGetConfigPath:
 
         assert result.endswith(".json"), f"Config path should end with .json, got {result}"
 
+    def test_config_dir_created_once(self, mocker):
+        """
+        Verify the config directory is created on the first call only.
+
+        WHY: The path can't change during a run, so later calls (every
+        save()) should not touch the filesystem at all.
+        """
+        from src.util import path_util
+
+        mocker.patch.object(path_util, '_config_path', None)
+        makedirs = mocker.patch.object(path_util.os, 'makedirs')
+
+        first = path_util.get_config_path()
+        second = path_util.get_config_path()
+
+        assert first == second
+        makedirs.assert_called_once_with(os.path.dirname(first), exist_ok=True)
+
 
 class TestGetLockfilePath:
     """
@@ -148,10 +185,10 @@ class TestGetLockfilePath:
         WHY: Lockfile should be alongside config for consistency
         and to avoid polluting the home directory root.
         """
-        from src.util.lockfile_handler import LOCKFILE_PATH
+        from src.util.lockfile_handler import _lockfile_path
 
-        assert ".pawgate" in LOCKFILE_PATH
-        assert "lockfile" in LOCKFILE_PATH.lower()
+        assert ".pawgate" in _lockfile_path()
+        assert "lockfile" in _lockfile_path().lower()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,153 @@
+"""
+Unit tests for pressed_events_handler module.
+
+WHY: The stale-key cleaner works around keyboard library issue #223. If it
+stops sweeping, hotkeys silently die after a Windows lock; if it keeps
+sweeping while idle, it wastes wakeups for the app's whole lifetime.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class TestPressedEventsCleaner:
+    """
+    Tests for the event-driven PressedEventsCleaner.
+
+    WHY: We swap in a private _pressed_events dict and lock so the tests
+    never touch the real keyboard library state or install real hooks.
+    """
+
+    @pytest.fixture
+    def mock_keyboard(self, mocker):
+        """Mock keyboard with an isolated pressed-events dict."""
+        mock_kb = mocker.patch('src.keyboard_controller.pressed_events_handler.keyboard')
+        mock_kb.KEY_DOWN = 'down'
+        mock_kb._pressed_events = {}
+        mock_kb._pressed_events_lock = threading.Lock()
+        return mock_kb
+
+    @pytest.fixture
+    def cleaner(self, mock_keyboard, mocker):
+        """Provide a cleaner whose timers are recorded instead of started."""
+        from src.keyboard_controller import pressed_events_handler
+
+        timers = []
+
+        def fake_timer(delay, fn):
+            timer = SimpleNamespace(delay=delay, fn=fn, daemon=False, start=lambda: None)
+            timers.append(timer)
+            return timer
+
+        mocker.patch.object(pressed_events_handler.threading, 'Timer', side_effect=fake_timer)
+        cleaner = pressed_events_handler.PressedEventsCleaner()
+        cleaner.timers = timers
+        return cleaner
+
+    def test_start_installs_hook(self, mock_keyboard):
+        """
+        Verify clear_pressed_events installs a keyboard hook and returns.
+
+        WHY: The cleaner must not block the caller or run a polling thread.
+        """
+        from src.keyboard_controller.pressed_events_handler import clear_pressed_events
+
+        cleaner = clear_pressed_events()
+
+        mock_keyboard.hook.assert_called_once_with(cleaner._on_event)
+
+    def test_key_down_arms_single_timer(self, cleaner):
+        """
+        Verify key presses arm one sweep, not one per event.
+
+        WHY: Held keys auto-repeat; each repeat must not spawn a new timer.
+        """
+        for _ in range(5):
+            cleaner._on_event(SimpleNamespace(event_type='down', scan_code=30))
+        cleaner._on_event(SimpleNamespace(event_type='up', scan_code=30))
+
+        assert len(cleaner.timers) == 1
+        assert cleaner.timers[0].daemon is True
+        assert cleaner.timers[0].name == 'pawgate-presscleaner'
+        assert cleaner._press_times == {}, "Key-up should forget the press time"
+
+    def test_sweep_ignores_wall_clock_jumps(self, cleaner, mock_keyboard):
+        """
+        Verify staleness is measured on the monotonic clock.
+
+        WHY: The keyboard library stamps events with time.time(); if the wall
+        clock jumps backward, a stuck key would otherwise never look stale.
+        """
+        mock_keyboard._pressed_events[29] = SimpleNamespace(name='ctrl', time=time.time() + 3600)
+        cleaner._press_times[29] = time.monotonic() - 10
+
+        cleaner._sweep()
+
+        assert mock_keyboard._pressed_events == {}
+
+    def test_sweep_removes_stale_and_rearms_for_held_keys(self, cleaner, mock_keyboard):
+        """
+        Verify a sweep deletes stale keys and re-arms only while keys remain.
+
+        WHY: Re-arming when nothing is held would turn the cleaner back into
+        a polling loop.
+        """
+        now = time.monotonic()
+        mock_keyboard._pressed_events.update({
+            29: SimpleNamespace(name='ctrl'),
+            38: SimpleNamespace(name='l'),
+        })
+        cleaner._press_times.update({29: now - 10, 38: now - 0.5})
+
+        cleaner._sweep()
+
+        assert list(mock_keyboard._pressed_events) == [38]
+        assert len(cleaner.timers) == 1
+        assert 1.0 < cleaner.timers[0].delay < 2.0
+
+        cleaner._press_times[38] = now - 10
+        cleaner._sweep()
+
+        assert mock_keyboard._pressed_events == {}
+        assert len(cleaner.timers) == 1, "Idle cleaner should not re-arm"
+
+    def test_sweep_skips_lock_when_nothing_pressed(self, cleaner, mock_keyboard):
+        """
+        Verify an empty pressed-events dict never takes the library's lock.
+
+        WHY: The lock is shared with the keyboard event thread; taking it for
+        nothing adds contention to every keystroke dispatch.
+        """
+        mock_keyboard._pressed_events_lock = MagicMock()
+
+        cleaner._sweep()
+
+        mock_keyboard._pressed_events_lock.__enter__.assert_not_called()
+        assert cleaner.timers == []
+
+    def test_sweep_takes_lock_only_to_remove_stale_keys(self, cleaner, mock_keyboard):
+        """
+        Verify a sweep that finds nothing stale never takes the library's lock.
+
+        WHY: The scan runs on a lock-free copy; the lock is only needed to
+        pop entries, so held-but-fresh keys must not contend with the
+        keyboard event thread.
+        """
+        mock_keyboard._pressed_events_lock = MagicMock()
+        mock_keyboard._pressed_events[38] = SimpleNamespace(name='l')
+        cleaner._press_times[38] = time.monotonic()
+
+        cleaner._sweep()
+
+        mock_keyboard._pressed_events_lock.__enter__.assert_not_called()
+        assert len(cleaner.timers) == 1
+
+        cleaner._press_times[38] = time.monotonic() - 10
+        cleaner._sweep()
+
+        mock_keyboard._pressed_events_lock.__enter__.assert_called_once()
+        assert mock_keyboard._pressed_events == {}
@@ -0,0 +1,240 @@
+"""
+Unit tests for tray_icon module.
+
+WHY: The tray icon is PawGate's only visible UI while unlocked. These tests
+verify how the icon's event loop is started without creating a real icon.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+
+class TestTrayIconRun:
+    """
+    Tests for how TrayIcon.open() runs the pystray icon.
+
+    WHY: open() runs on the tray worker thread, so it must use the blocking
+    run(); run_detached() needs the main thread's GUI loop.
+    """
+
+    @pytest.fixture
+    def mock_icon(self, mocker):
+        """
+        Stub the pystray package so no real tray icon (or backend) is created.
+
+        WHY sys.modules: open() imports pystray lazily, and the real
+        package's __init__ loads a platform backend that fails without a
+        desktop (Xlib's DisplayNameError on headless Linux). The stub shares
+        the real package path, so Menu and MenuItem still come from
+        pystray._base and the menu tests exercise pystray's own behavior.
+        """
+        stub = ModuleType('pystray')
+        stub.__path__ = importlib.util.find_spec('pystray').submodule_search_locations
+        mocker.patch.dict(sys.modules, {'pystray': stub})
+        base = importlib.import_module('pystray._base')
+        stub.Icon, stub.Menu, stub.MenuItem = Mock(), base.Menu, base.MenuItem
+        return stub.Icon
+
+    @pytest.fixture
+    def tray(self):
+        """Provide a TrayIcon over the minimal PawGateCore surface."""
+        from src.os_controller.tray_icon import TrayIcon
+
+        main = SimpleNamespace(
+            config=SimpleNamespace(opacity=0.3, notifications_enabled=True),
+            send_hotkey_signal=Mock(),
+            quit_program=Mock(),
+        )
+        return TrayIcon(main)
+
+    @pytest.mark.parametrize('platform', ['win32', 'darwin', 'linux'])
+    def test_runs_blocking_loop_on_tray_thread(self, mock_icon, tray, mocker, platform):
+        """
+        Verify every platform uses the blocking run() on the tray thread.
+
+        WHY darwin too: run_detached() from a worker thread would leave the
+        icon without a running AppKit loop.
+        """
+        mocker.patch.object(sys, 'platform', platform)
+
+        tray.open()
+
+        mock_icon.return_value.run.assert_called_once_with()
+        mock_icon.return_value.run_detached.assert_not_called()
+
+    def test_icon_image_decoded_once(self, mock_icon, tray, mocker):
+        """
+        Verify re-opening the icon reuses the decoded image.
+
+        WHY: The PNG decode and bundled-path lookup only need to happen once;
+        each icon still gets its own copy because PIL images are mutable.
+        """
+        import PIL.Image
+
+        from src.os_controller.tray_icon import _load_tray_image
+
+        _load_tray_image.cache_clear()
+        spy = mocker.spy(PIL.Image, 'open')
+
+        tray.open()
+        tray.open()
+
+        assert spy.call_count == 1
+        first, second = (c.args[1] for c in mock_icon.call_args_list)
+        assert first is not second
+        assert first.tobytes() == second.tobytes()
+
+    def test_icon_image_decoded_eagerly_and_file_closed(self, mocker):
+        """
+        Verify the cached image is fully decoded and its file is closed.
+
+        WHY: A lazy PIL image holds the PNG open and decodes on first pixel
+        access, which would land inside pystray on the tray thread.
+        """
+        import PIL.Image
+
+        from src.os_controller.tray_icon import _load_tray_image
+
+        _load_tray_image.cache_clear()
+        spy = mocker.spy(PIL.Image, 'open')
+
+        image = _load_tray_image()
+
+        assert image.mode == "RGBA"
+        assert getattr(image, "fp", None) is None
+        assert spy.spy_return.fp is None
+
+    def test_checkmarks_follow_config(self, mock_icon, tray):
+        """
+        Verify the menu's checkmarks read the live config on every repaint.
+
+        WHY: The checked= callables close over the config object once; they
+        must still reflect settings changed after the menu was built.
+        """
+        tray.open()
+        menu = mock_icon.call_args.args[3]
+        items = {item.text: item for item in menu.items}
+        opacity = {item.text: item for item in items["Set Opacity"].submenu.items}
+
+        assert opacity["30%"].checked is True
+        assert opacity["50%"].checked is False
+        assert items["Enable/Disable Notifications"].checked is True
+
+        tray.main.config.opacity = 0.5
+        tray.main.config.notifications_enabled = False
+
+        assert opacity["30%"].checked is False
+        assert opacity["50%"].checked is True
+        assert items["Enable/Disable Notifications"].checked is False
+
+    def test_opacity_items_set_their_own_value(self, mock_icon, tray):
+        """
+        Verify each generated opacity item applies its own value.
+
+        WHY: The submenu is built in a loop; a closure over the loop variable
+        would make every item set the last opacity.
+        """
+        tray.main.config.save = Mock()
+        tray.open()
+        menu = mock_icon.call_args.args[3]
+        submenu = next(item for item in menu.items if item.text == "Set Opacity").submenu
+
+        labels = [item.text for item in submenu.items]
+        assert labels == ["5%", "10%", "30%", "50%", "70%", "90%"]
+
+        icon = Mock()
+        for item in submenu.items:
+            item(icon)  # How pystray invokes a clicked item
+            assert f"{round(tray.main.config.opacity * 100)}%" == item.text
+            assert item.checked is True
+
+
+class TestConfigSaveDebounce:
+    """
+    Tests for the debounced config save behind the settings menu items.
+
+    WHY: Timers are recorded instead of started so the tests control exactly
+    when the delayed save fires.
+    """
+
+    @pytest.fixture
+    def tray(self, mocker):
+        """Provide a TrayIcon whose save timers are recorded, not started."""
+        from src.os_controller import tray_icon
+
+        timers = []
+
+        def fake_timer(delay, fn):
+            timer = SimpleNamespace(delay=delay, fn=fn, start=Mock(), cancel=Mock())
+            timers.append(timer)
+            return timer
+
+        mocker.patch.object(tray_icon.threading, 'Timer', side_effect=fake_timer)
+        main = SimpleNamespace(
+            config=SimpleNamespace(opacity=0.3, notifications_enabled=True, save=Mock()),
+        )
+        tray = tray_icon.TrayIcon(main)
+        tray.timers = timers
+        return tray
+
+    def test_burst_of_changes_saves_once(self, tray):
+        """
+        Verify clicking through several settings writes the file once.
+
+        WHY: Each click rearms the timer; only the last one may fire.
+        """
+        for opacity in (0.05, 0.1, 0.5):
+            tray.set_opacity(opacity)
+        tray.toggle_notifications()
+
+        tray.main.config.save.assert_not_called()
+        assert tray.main.config.opacity == 0.5, "The setting itself applies at once"
+        assert all(t.cancel.called for t in tray.timers[:-1])
+        assert tray.timers[-1].daemon is True
+
+        tray.timers[-1].fn()
+
+        tray.main.config.save.assert_called_once_with()
+
+    def test_flush_saves_pending_change_once(self, tray):
+        """
+        Verify quitting writes a pending change and the timer then does nothing.
+
+        WHY: The timer is a daemon thread; without a flush on quit, a change
+        made just before quitting would be lost.
+        """
+        tray.flush_config()
+        tray.main.config.save.assert_not_called()
+
+        tray.set_opacity(0.7)
+        tray.flush_config()
+
+        tray.main.config.save.assert_called_once_with()
+        tray.timers[-1].cancel.assert_called()
+
+        tray.timers[-1].fn()  # A timer that fires anyway finds nothing pending
+        tray.main.config.save.assert_called_once_with()
+
+
+def test_import_does_not_load_pil_or_pystray():
+    """
+    Verify importing tray_icon leaves Pillow and pystray unloaded.
+
+    WHY: They are imported inside open(), on the tray thread, so the main
+    thread's startup doesn't pay for them.
+    """
+    import subprocess
+    from pathlib import Path
+
+    code = (
+        "import sys; import src.os_controller.tray_icon; "
+        "sys.exit('PIL' in sys.modules or 'pystray' in sys.modules)"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    result = subprocess.run([sys.executable, '-c', code], cwd=repo_root, check=False)
+    assert result.returncode == 0
@@ -0,0 +1,59 @@
+"""
+Unit tests for web_browser_util module.
+
+WHY: The open_* helpers run on the tray thread. These tests verify each one
+opens the right page in a new tab without calling webbrowser inline.
+"""
+
+import pytest
+
+
+class TestOpenUrl:
+    """
+    Tests for open_url() and the open_* helpers built on it.
+
+    WHY: threading.Thread is replaced so the tests can check what the
+    background thread would run without starting one.
+    """
+
+    @pytest.fixture
+    def mock_thread(self, mocker):
+        """Replace threading.Thread in web_browser_util with a mock."""
+        from src.util import web_browser_util
+
+        return mocker.patch.object(web_browser_util.threading, 'Thread')
+
+    @pytest.mark.parametrize("helper, url", [
+        ("open_about", "https://catlock.app/about/"),
+        ("open_help", "https://catlock.app/faq/"),
+        ("open_buy_me_a_coffee", "https://buymeacoffee.com/richiehowelll"),
+    ])
+    def test_helpers_open_page_on_daemon_thread(self, mock_thread, mocker, helper, url):
+        """
+        Verify each helper hands its URL to webbrowser.open on a daemon thread.
+
+        WHY: webbrowser.open() can block while the browser starts; running it
+        inline would freeze the tray menu.
+        """
+        from src.util import web_browser_util
+
+        browser_open = mocker.patch.object(web_browser_util.webbrowser, 'open')
+
+        getattr(web_browser_util, helper)()
+
+        browser_open.assert_not_called()
+        kwargs = mock_thread.call_args.kwargs
+        assert kwargs['daemon'] is True
+        mock_thread.return_value.start.assert_called_once_with()
+
+        kwargs['target'](*kwargs['args'], **kwargs['kwargs'])
+        browser_open.assert_called_once_with(url, new=2)
+
+    def test_unknown_page_raises_on_caller_thread(self, mock_thread):
+        """Verify a bad page name fails loudly instead of inside the thread."""
+        from src.util.web_browser_util import open_url
+
+        with pytest.raises(KeyError):
+            open_url("nope")
+
+        mock_thread.assert_not_called()